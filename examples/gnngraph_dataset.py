@@ -34,11 +34,7 @@ class GraphDataset:
                             int(self.n_nodes),
                             int(self.n_edges))
         self.n_classes = int(npz.get('n_classes', default=np.max(npz['label']) + 1))
-        in_deg = np.zeros(shape=self.n_nodes, dtype=np.int)
-        out_deg = np.zeros(shape=self.n_nodes, dtype=np.int)
-        for r in npz['adj_coo_row']:
-            out_deg[r] += 1
-        for c in npz['adj_coo_col']:
-            in_deg[c] += 1
+        out_deg = np.bincount(npz['adj_coo_row'], minlength=int(self.n_nodes))
+        in_deg = np.bincount(npz['adj_coo_col'], minlength=int(self.n_nodes))
         self.in_deg = ms.Tensor(npz.get('in_degrees', default=in_deg), ms.int32)
         self.out_deg = ms.Tensor(npz.get('out_degrees', default=out_deg), ms.int32)
@@ -0,0 +1,74 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Benchmark of feature gather and scatter after node reordering"""
+import argparse
+import time
+import numpy as np
+
+from mindspore_gl.graph.graph import MindHomoGraph, CsrAdj, coo_to_csr
+from mindspore_gl.graph.reorder import reorder
+import mindspore_gl.array_kernel as array_kernel
+
+
+def load_graph(data_path, node_count, avg_degree):
+    """load graph from npz dataset, or generate a random graph if data_path is not given"""
+    if data_path:
+        npz = np.load(data_path)
+        adj_coo = np.stack([npz['adj_coo_row'], npz['adj_coo_col']]).astype(np.int32)
+        node_count = int(npz.get('n_nodes', default=adj_coo.max() + 1))
+    else:
+        # random graph with community structure hidden by a random node relabel
+        community = np.random.randint(0, node_count // 64, [node_count * avg_degree])
+        adj_coo = community * 64 + np.random.randint(0, 64, [2, node_count * avg_degree])
+        adj_coo = np.random.permutation(node_count)[adj_coo].astype(np.int32)
+    graph = MindHomoGraph()
+    graph.set_topo(coo_to_csr(adj_coo, node_count))
+    return graph
+
+
+def bench_gather(adj_csr: CsrAdj, feat: np.ndarray, repeat: int):
+    """time of gathering neighbor features of all edges"""
+    indices = adj_csr.indices.astype(np.int32)
+    gathered = np.empty([indices.shape[0], feat.shape[1]], dtype=np.float32)
+    beg = time.time()
+    for _ in range(repeat):
+        array_kernel.float_2d_gather_with_dst(gathered, feat, indices)
+    return (time.time() - beg) / repeat
+
+
+def main(bench_args):
+    graph = load_graph(bench_args.data_path, bench_args.node_count, bench_args.avg_degree)
+    feat = np.random.rand(graph.node_count, bench_args.feat_size).astype(np.float32)
+    base_time = bench_gather(graph.adj_csr, feat, bench_args.repeat)
+    print(f"original: {base_time * 1000:.2f} ms")
+    for method in bench_args.methods.split(","):
+        beg = time.time()
+        new_graph, permutation = reorder(graph, method)
+        reorder_time = time.time() - beg
+        new_time = bench_gather(new_graph.adj_csr, permutation.apply(feat), bench_args.repeat)
+        print(f"{method}: {new_time * 1000:.2f} ms, speedup {base_time / new_time:.2f}x, "
+              f"reorder cost {reorder_time:.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="reorder benchmark")
+    parser.add_argument("--data-path", type=str, default=None, help="npz dataset, random graph if not given")
+    parser.add_argument("--node-count", type=int, default=1 << 20, help="node count of random graph")
+    parser.add_argument("--avg-degree", type=int, default=16, help="average degree of random graph")
+    parser.add_argument("--feat-size", type=int, default=64, help="feature size")
+    parser.add_argument("--repeat", type=int, default=5, help="repeat times")
+    parser.add_argument("--methods", type=str, default="degree,bfs,rcm,rabbit", help="reorder methods to compare")
+    args = parser.parse_args()
+    main(args)
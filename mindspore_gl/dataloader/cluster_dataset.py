@@ -0,0 +1,141 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Cluster-GCN partition batch dataset."""
+from typing import List
+import numpy as np
+from mindspore_gl.graph.graph import MindHomoGraph, CsrAdj, gather_csr_rows, get_index_dtype
+from mindspore_gl.graph.node_map import NodeIdMap
+from mindspore_gl.graph.partition import partition_graph, edge_cut
+from mindspore_gl.graph.store import GraphStore, save_graph_store, is_graph_store
+from .dataset import Dataset
+
+
+class ClusterGCNDataset(Dataset):
+    """
+    Cluster-GCN dataset, the graph is partitioned into clusters once and each batch is the subgraph induced
+    by a few clusters, keeping edges inside and between the chosen clusters. Nodes are reordered by cluster
+    and the csr is relabeled up front, so nodes of a batch are contiguous slices and a batch is built with
+    array operations over the rows of its clusters only. Use with
+    :class:`mindspore_gl.dataloader.samplers.ClusterBatchSampler` which yields cluster ids of each batch.
+
+    Args:
+        graph(MindHomoGraph): graph to sample from.
+        num_parts(int): cluster count.
+        method(str): partition method of :func:`mindspore_gl.graph.partition.partition_graph`. Default: 'ldg'.
+        cache_path(str): if given, part ids are loaded from this graph store when they were built with the same
+            `num_parts` and `method` from a graph with the same node and edge count, else the graph is
+            partitioned and the part ids are saved there. Default: None.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.graph import MindHomoGraph
+        >>> from mindspore_gl.dataloader.cluster_dataset import ClusterGCNDataset
+        >>> graph = MindHomoGraph()
+        >>> graph.set_topo_coo(np.array([[0, 1, 2, 3, 0], [1, 0, 3, 2, 2]], dtype=np.int32))
+        >>> graph.node_count = 4
+        >>> dataset = ClusterGCNDataset(graph, 2)
+        >>> batch = dataset[[0]]
+        >>> print(dataset.parts)
+        [0 1 0 1]
+        >>> print(batch.node_map.global_ids, batch.adj_coo)
+        [0 2] [[0]
+         [1]]
+    """
+
+    def __init__(self, graph: MindHomoGraph, num_parts: int, method="ldg", cache_path: str = None):
+        self.graph = graph
+        self.num_parts = num_parts
+        self.parts = self._load_or_partition(graph, num_parts, method, cache_path)
+        node_count = graph.node_count
+        # nodes sorted by cluster, cluster i holds new node ids cluster_ptr[i]: cluster_ptr[i + 1]
+        self.order = np.argsort(self.parts, kind="stable")
+        self.cluster_ptr = np.zeros([num_parts + 1], dtype=np.int64)
+        np.cumsum(np.bincount(self.parts, minlength=num_parts), out=self.cluster_ptr[1:])
+        self.node_cluster = self.parts[self.order]
+        new_ids = np.empty([node_count], dtype=get_index_dtype(node_count))
+        new_ids[self.order] = np.arange(node_count, dtype=new_ids.dtype)
+        indptr, indices, self.positions = gather_csr_rows(graph.adj_csr, self.order, return_positions=True)
+        self.adj_csr = CsrAdj(indptr, new_ids[indices])
+
+    @staticmethod
+    def _load_or_partition(graph, num_parts, method, cache_path):
+        """part id of each node, partitioned once and cached in a graph store"""
+        # cached parts are reused only if they were built from a graph of this size with the same arguments
+        key = {"num_parts": num_parts, "method": method, "node_count": int(graph.node_count),
+               "edge_count": int(graph.adj_csr.indptr[-1])}
+        if cache_path is not None and is_graph_store(cache_path):
+            store = GraphStore(cache_path, mmap=False)
+            if all(store.meta.get(name) == value for name, value in key.items()):
+                return store["parts"]
+        parts = partition_graph(graph, num_parts, method)
+        if cache_path is not None:
+            save_graph_store(cache_path, {"parts": parts}, {"format": "partition", "edge_cut": edge_cut(graph, parts),
+                                                            **key})
+        return parts
+
+    def cluster_nodes(self, cluster_id: int) -> np.ndarray:
+        """
+        Nodes of a cluster.
+
+        Args:
+            cluster_id(int): cluster id.
+
+        Returns:
+            numpy.ndarray, local node ids of the cluster in the source graph.
+        """
+        return self.order[self.cluster_ptr[cluster_id]: self.cluster_ptr[cluster_id + 1]]
+
+    def __getitem__(self, cluster_ids: List[int]) -> MindHomoGraph:
+        """
+        Subgraph induced by clusters.
+
+        Args:
+            cluster_ids(List[int]): distinct cluster ids of the batch.
+
+        Returns:
+            MindHomoGraph, the relabeled subgraph in csr format, nodes are ordered by the given clusters.
+            Its global node ids and edge ids are the ones of the source graph.
+        """
+        clusters = np.asarray(cluster_ids, dtype=np.int64)
+        starts = self.cluster_ptr[clusters]
+        sizes = self.cluster_ptr[clusters + 1] - starts
+        offsets = np.zeros([clusters.shape[0] + 1], dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+        node_count = int(offsets[-1])
+        rows = np.arange(node_count) + np.repeat(starts - offsets[:-1], sizes)
+
+        indptr, indices, positions = gather_csr_rows(self.adj_csr, rows, return_positions=True)
+        # new node id -> batch local id by shifting each chosen cluster to its offset in the batch
+        chosen = np.zeros([self.num_parts], dtype=bool)
+        chosen[clusters] = True
+        shift = np.zeros([self.num_parts], dtype=np.int64)
+        shift[clusters] = offsets[:-1] - starts
+        index_cluster = self.node_cluster[indices]
+        kept = chosen[index_cluster]
+        local_row = np.repeat(np.arange(node_count), np.diff(indptr))[kept]
+        index_dtype = get_index_dtype(node_count, int(np.count_nonzero(kept)))
+        local_indptr = np.zeros([node_count + 1], dtype=index_dtype)
+        np.cumsum(np.bincount(local_row, minlength=node_count), out=local_indptr[1:])
+        local_indices = (indices[kept] + shift[index_cluster[kept]]).astype(index_dtype)
+
+        res = MindHomoGraph()
+        res.set_topo(CsrAdj(local_indptr, local_indices),
+                     NodeIdMap(global_ids=self.graph.node_map.to_global(self.order[rows])),
+                     self.graph.csr_edge_ids(self.positions[positions[kept]]))
+        res.node_count = node_count
+        return res
+
+    def __len__(self):
+        return self.num_parts
@@ -14,6 +14,7 @@
 # ============================================================================
 """Implement various data sampler."""
 import random
+import numpy as np
 import mindspore.dataset as ds
 
 
@@ -75,6 +76,15 @@ class DistributeRandomBatchSampler:
         world_size(int): Number of processes in distributed computing
         data_source(Union[List, Tuple, Iterable]): data source sample from
         batch_size(int): number of sampling subgraphs per batch
+        parts(numpy.ndarray): part id of each node, e.g. from `mindspore_gl.graph.partition.partition_graph`.
+            If given, each rank samples nodes of its own part instead of a stride of `data_source`,
+            so sampled neighborhoods mostly stay in the partition loaded by the rank.
+
+    Note:
+        All ranks must run the same number of steps, otherwise ranks with more steps wait in collective
+        communication forever. Each epoch every rank shuffles its nodes and uses only as many as the smallest
+        rank has, e.g. the smallest part when `parts` is given, so nodes beyond that count are visited in some
+        epochs only.
 
     Examples:
         >>> from mindspore_gl.dataloader.samplers import DistributeRandomBatchSampler
@@ -87,14 +97,21 @@ class DistributeRandomBatchSampler:
             [[10, 18, 6], [8, 12, 14], [4, 16, 2]]
 
     """
-    def __init__(self, rank, world_size, data_source, batch_size):
+    def __init__(self, rank, world_size, data_source, batch_size, parts=None):
         super().__init__()
         if data_source is None:
             data_source = []
         if isinstance(data_source, tuple):
             data_source = list(data_source)
 
-        self.data_source_rank = data_source[rank::world_size]
+        if parts is None:
+            self.data_source_rank = data_source[rank::world_size]
+            self.num_samples = len(data_source) // world_size
+        else:
+            data_source = np.asarray(data_source, dtype=np.int64)
+            data_parts = parts[data_source]
+            self.data_source_rank = data_source[data_parts == rank].tolist()
+            self.num_samples = int(np.bincount(data_parts, minlength=world_size)[:world_size].min())
         self.batch_size = batch_size
         self.epoch = 1
         self.rank = rank
@@ -110,7 +127,8 @@ class DistributeRandomBatchSampler:
                             "but got rank = {}.".format(self.rank))
 
     def node_iter(self):
-        data_length = len(self.data_source_rank)
+        # same node count on every rank, so all ranks run the same number of steps
+        data_length = self.num_samples
         for i in range(0, data_length, self.batch_size):
             # Drop reminder
             if i + self.batch_size <= data_length:
@@ -124,4 +142,45 @@ class DistributeRandomBatchSampler:
         return self.node_iter()
 
     def __len__(self):
-        return (len(self.data_source_rank) + self.batch_size - 1) // self.batch_size
+        return self.num_samples // self.batch_size
+
+
+class ClusterBatchSampler(ds.Sampler):
+    """
+    Cluster batch sampler for Cluster-GCN, shuffles clusters every epoch and yields `clusters_per_batch`
+    cluster ids for each batch. Every cluster is visited once per epoch, the last batch may hold fewer clusters.
+
+    Args:
+        num_parts(int): cluster count, e.g. `len(dataset)` of a
+            :class:`mindspore_gl.dataloader.cluster_dataset.ClusterGCNDataset`.
+        clusters_per_batch(int): number of clusters per batch.
+
+    Examples:
+        >>> from mindspore_gl.dataloader.samplers import ClusterBatchSampler
+        >>> sampler = ClusterBatchSampler(5, 2)
+        >>> print(list(sampler))
+        # results will be random for suffle
+            [[3, 0], [4, 1], [2]]
+    """
+    def __init__(self, num_parts, clusters_per_batch):
+        super().__init__()
+        if not isinstance(clusters_per_batch, int) or clusters_per_batch <= 0:
+            raise TypeError("clusters_per_batch should be a positive integer value,"
+                            "but got clusters_per_batch = {}.".format(clusters_per_batch))
+        self.data_source = list(range(num_parts))
+        self.clusters_per_batch = clusters_per_batch
+        self.epoch = 1
+
+    def cluster_iter(self):
+        for i in range(0, len(self.data_source), self.clusters_per_batch):
+            yield self.data_source[i: i + self.clusters_per_batch]
+
+    def __iter__(self):
+        # Reset random seed here if necessary
+        self.epoch += 1
+        random.seed(self.epoch)
+        random.shuffle(self.data_source)
+        return self.cluster_iter()
+
+    def __len__(self):
+        return (len(self.data_source) + self.clusters_per_batch - 1) // self.clusters_per_batch
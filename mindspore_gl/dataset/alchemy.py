@@ -17,6 +17,7 @@ from typing import Optional, Union
 import os.path as osp
 import numpy as np
 from mindspore_gl.graph.graph import MindHomoGraph
+from .utils import load_npz_or_store, as_index_array
 
 
 class Alchemy:
@@ -61,9 +62,9 @@ class Alchemy:
         self.load()
 
     def load(self):
-        self._npz_file = np.load(self._path)
-        self._edge_array = self._npz_file['edge_array'].astype(np.int64)
-        self._graph_edges = self._npz_file['graph_edges'].astype(np.int64)
+        self._npz_file = load_npz_or_store(self._path)
+        self._edge_array = self._npz_file['edge_array'].astype(np.int64, copy=False)
+        self._graph_edges = self._npz_file['graph_edges'].astype(np.int64, copy=False)
 
         self._graphs = np.array(list(range(len(self._graph_edges))))
 
@@ -100,18 +101,9 @@ class Alchemy:
     @property
     def graph_nodes(self):
         """return graph nodes"""
-        try:
-            if self._graph_nodes is None:
-                self._graph_nodes = self._npz_file['graph_nodes'].astype(np.int32)
-            return self._graph_nodes
-        except: #pylint: disable=W0702
-            ############################################################################
-            # NPZ File Is Known To Be Bugged When Sharing NPZFileHandler Across Process
-            # Checkout This Issue: https://github.com/numpy/numpy/issues/18124
-            #############################################################################
-            self.load()
-            self._graph_nodes = self._npz_file['graph_nodes'].astype(np.int32)
-            return self._graph_nodes
+        if self._graph_nodes is None:
+            self._graph_nodes = as_index_array(self._npz_file['graph_nodes'])
+        return self._graph_nodes
 
     @property
     def graph_edges(self):
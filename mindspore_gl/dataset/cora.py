@@ -20,6 +20,9 @@ import networkx as nx
 import scipy.sparse as sp
 from scipy.sparse import coo_matrix, csr_matrix
 from mindspore_gl.graph.graph import MindHomoGraph, CsrAdj
+from mindspore_gl.graph.node_map import NodeIdMap
+from mindspore_gl.graph.coalesce import coalesce
+from .utils import load_npz_or_store, as_index_array
 
 
 class CoraV2:
@@ -135,20 +138,10 @@ class CoraV2:
         onehot_labels[test_idx_reorder, :] = onehot_labels[test_idx_range, :]
         labels = np.argmax(onehot_labels, 1)
 
-        adj_coo_row = []
-        adj_coo_col = []
-        line_count = 0
-
-        for e in graph.edges:
-            adj_coo_row.append(e[0])
-            adj_coo_col.append(e[1])
-            line_count += 1
-
-        for i in range(len(labels)):
-            adj_coo_row.append(i)
-            adj_coo_col.append(i)
-
+        # networkx may already hold self loops, coalesce keeps exactly one per node and removes duplicates
         num_nodes = len(labels)
+        adj_coo = np.array(list(graph.edges), dtype=np.int64).reshape(-1, 2).T
+        adj_coo_row, adj_coo_col = coalesce(adj_coo, num_nodes, self_loop="add", sort_by="src")
         num_edges = len(adj_coo_row)
         idx_test = test_idx_range.tolist()
         idx_train = range(len(y))
@@ -172,11 +165,12 @@ class CoraV2:
 
     def load(self):
         """Load the saved npz dataset from files."""
-        self._npz_file = np.load(self._path)
-        self._csr_row = self._npz_file['adj_csr_indptr'].astype(np.int32)
-        self._csr_col = self._npz_file['adj_csr_indices'].astype(np.int32)
+        self._npz_file = load_npz_or_store(self._path)
+        indptr = self._npz_file['adj_csr_indptr']
+        self._csr_row = as_index_array(indptr, int(indptr[-1]))
+        self._csr_col = as_index_array(self._npz_file['adj_csr_indices'], indptr.shape[0] - 1)
 
-        self._nodes = np.array(list(range(len(self._csr_row) - 1)))
+        self._nodes = np.arange(len(self._csr_row) - 1)
 
     @property
     def num_features(self):
@@ -360,9 +354,9 @@ class CoraV2:
     def __getitem__(self, idx):
         assert idx == 0, "Cora only has one graph"
         graph = MindHomoGraph()
-        node_dict = {idx: idx for idx in range(self.node_count)}
-        edge_ids = np.array(list(range(self.edge_count))).astype(np.int32)
-        graph.set_topo(CsrAdj(self._csr_row, self._csr_col), node_dict=node_dict, edge_ids=edge_ids)
+        node_map = NodeIdMap(len(self._csr_row) - 1)
+        edge_ids = np.arange(self.edge_count, dtype=self._csr_row.dtype)
+        graph.set_topo(CsrAdj(self._csr_row, self._csr_col), node_dict=node_map, edge_ids=edge_ids)
         return graph
 
 
@@ -18,6 +18,7 @@ from typing import Optional, Union
 import os.path as osp
 import numpy as np
 from mindspore_gl.graph.graph import MindHomoGraph
+from .utils import load_npz_or_store
 
 
 class Enzymes:
@@ -63,7 +64,7 @@ class Enzymes:
         self.load()
 
     def load(self):
-        self._npz_file = np.load(self._path)
+        self._npz_file = load_npz_or_store(self._path)
         self._edge_array = self._npz_file['edge_array']
         self._graph_edges = self._npz_file['graph_edges']
 
@@ -105,11 +106,7 @@ class Enzymes:
 
     @property
     def graph_nodes(self):
-        try:
-            if self._graph_nodes is None:
-                self._graph_nodes = self._npz_file['graph_nodes']
-        except:
-            self.load()
+        if self._graph_nodes is None:
             self._graph_nodes = self._npz_file['graph_nodes']
         return self._graph_nodes
 
@@ -137,11 +134,7 @@ class Enzymes:
 
     @property
     def node_feat(self):
-        try:
-            if self._node_feat is None:
-                self._node_feat = self._npz_file["node_feat"]
-        except:
-            self.load()
+        if self._node_feat is None:
             self._node_feat = self._npz_file["node_feat"]
         return self._node_feat
 
@@ -150,11 +143,7 @@ class Enzymes:
 
     @property
     def graph_label(self):
-        try:
-            if self._graph_label is None:
-                self._graph_label = self._npz_file["graph_label"]
-        except:
-            self.load()
+        if self._graph_label is None:
             self._graph_label = self._npz_file["graph_label"]
         return self._graph_label
 
@@ -17,8 +17,8 @@
 from typing import Optional, Union, Dict
 import os.path as osp
 import numpy as np
-from mindspore_gl.graph.graph import MindRelationGraph, MindHeteroGraph, CsrAdj
-from .utils import get_indptr_from_coo_src
+from mindspore_gl.graph.graph import MindRelationGraph, MindHeteroGraph, CsrAdj, CscAdj
+from mindspore_gl.graph.store import GraphStore, build_csr_store, is_graph_store
 
 
 class MAG240MDataset:
@@ -157,16 +157,38 @@ class MAG240MDataset:
 
     def edge_index(self, id1: str, id2: str,
                    id3: Optional[str] = None) -> np.ndarray:
+        return np.load(self._edge_index_path(id1, id2, id3))
+
+    def _edge_index_path(self, id1: str, id2: str, id3: Optional[str] = None) -> str:
         src = id1
         rel, dst = (id3, id2) if id3 is None else (id2, id3)
         rel = self.__rels__[(src, dst)] if rel is None else rel
         name = f'{src}___{rel}___{dst}'
-        path = osp.join(self.dir, 'processed', name, 'edge_index.npy')
-        return np.load(path)
-
-    @property
-    def full_topo_csr(self):
-        return 1
+        return osp.join(self.dir, 'processed', name, 'edge_index.npy')
+
+    def num_nodes(self, node_type: str) -> int:
+        return int(self.__meta__[node_type])
+
+    @property
+    def full_topo_csr(self) -> Dict[str, GraphStore]:
+        """
+        Csr and reverse csr of each relation, keyed by relation type. They are built out-of-core once and
+        saved as a graph store next to the relation's edge_index.npy, later calls only memory map them.
+
+        Returns:
+            Dict[str, GraphStore], memory mapped csr store of each relation.
+        """
+        if self.__full_topo_csr__ is not None:
+            return self.__full_topo_csr__
+        self.__full_topo_csr__ = {}
+        for (src_type, dst_type), e_type in self.__rels__.items():
+            edge_index_path = self._edge_index_path(src_type, e_type, dst_type)
+            store_path = osp.join(osp.dirname(edge_index_path), 'csr')
+            if not is_graph_store(store_path):
+                build_csr_store(store_path, np.load(edge_index_path, mmap_mode='r'),
+                                self.num_nodes(src_type), self.num_nodes(dst_type))
+            self.__full_topo_csr__[f"{src_type}_{e_type}_{dst_type}"] = GraphStore(store_path)
+        return self.__full_topo_csr__
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}()'
@@ -176,18 +198,15 @@ class MAG240MDataset:
 
         result_graph = MindHeteroGraph()
 
-        for k, e_type in self.__rels__:
-            src_type, dst_type = k
-            relation_edge_index = self.edge_index(src_type, e_type, dst_type)
-            relation_edge_index = relation_edge_index.astype(np.int32)
+        full_topo_csr = self.full_topo_csr
+        for (src_type, dst_type), e_type in self.__rels__.items():
             relation_graph = MindRelationGraph(src_node_type=src_type, dst_node_type=dst_type, edge_type=e_type)
-            indptr = np.zeros(relation_edge_index[1][-1] + 1, dtype=np.int32)
-            get_indptr_from_coo_src(relation_edge_index[0], indptr)
-            adj = CsrAdj(
-                indptr=indptr,
-                indices=relation_edge_index[1]
-            )
-            relation_graph.set_topo(adj_csr=adj)
+            store = full_topo_csr[relation_graph.relation_type]
+            # relation graphs share the memory mapped buffers of the store
+            relation_graph.set_topo(adj_csr=CsrAdj(indptr=store['indptr'], indices=store['indices']),
+                                    edge_ids=store.get('edge_ids'),
+                                    dst_node_num=self.num_nodes(dst_type),
+                                    adj_csc=CscAdj(indptr=store['rev_indptr'], indices=store['rev_indices']))
             result_graph.add_graph(relation_graph)
 
         return result_graph
@@ -18,6 +18,8 @@
 import os.path as osp
 import numpy as np
 from mindspore_gl.graph.graph import MindHomoGraph, CsrAdj
+from mindspore_gl.graph.node_map import NodeIdMap
+from .utils import load_npz_or_store, as_index_array
 
 
 class Reddit:
@@ -60,11 +62,12 @@ class Reddit:
         self.load()
 
     def load(self):
-        self._npz_file = np.load(self._path)
-        self._csr_row = self._npz_file['adj_csr_indptr'].astype(np.int32)
-        self._csr_col = self._npz_file['adj_csr_indices'].astype(np.int32)
+        self._npz_file = load_npz_or_store(self._path)
+        indptr = self._npz_file['adj_csr_indptr']
+        self._csr_row = as_index_array(indptr, int(indptr[-1]))
+        self._csr_col = as_index_array(self._npz_file['adj_csr_indices'], indptr.shape[0] - 1)
 
-        self._nodes = np.array(list(range(len(self._csr_row) - 1)))
+        self._nodes = np.arange(len(self._csr_row) - 1)
 
     @property
     def num_features(self):
@@ -128,7 +131,7 @@ class Reddit:
     def __getitem__(self, idx):
         assert idx == 0, "reddit only has one graph"
         graph = MindHomoGraph()
-        node_dict = {idx: idx for idx in range(self.node_count)}
-        edge_ids = np.array(list(range(self.edge_count))).astype(np.int32)
-        graph.set_topo(CsrAdj(self._csr_row, self._csr_col), node_dict=node_dict, edge_ids=edge_ids)
+        node_map = NodeIdMap(len(self._csr_row) - 1)
+        edge_ids = np.arange(self.edge_count, dtype=self._csr_row.dtype)
+        graph.set_topo(CsrAdj(self._csr_row, self._csr_col), node_dict=node_map, edge_ids=edge_ids)
         return graph
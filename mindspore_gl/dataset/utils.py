@@ -13,19 +13,106 @@
 # limitations under the License.
 # ============================================================================
 """utils"""
+import os
+import shutil
 import numpy as np
+from mindspore_gl.graph.graph import get_index_dtype, _stable_argsort
+from mindspore_gl.graph.store import GraphStore, is_graph_store
 
 
-def get_indptr_from_coo_src(src_index: np.ndarray, result_array):
-    """get indptr from coo"""
-    cum_sum = 0
-    index_ptr = 1
-    cur_val = src_index[0]
-    for index in range(src_index.shape[0]):
-        if src_index[index] != cur_val:
-            result_array[index_ptr] = cum_sum
-            cur_val = src_index[index]
-            index_ptr += 1
+def load_npz_or_store(npz_path: str):
+    """
+    Load dataset arrays from a graph store next to the npz file, e.g. `reddit_with_mask/` for
+    `reddit_with_mask.npz`. The npz file is converted into the store on first load. Arrays in graph store are
+    memory mapped, which are zero-copy and safe to share across processes, unlike npz file handles.
+    If the store can not be written, e.g. in a read only directory, arrays are read from the npz file into
+    memory.
+
+    Args:
+        npz_path(str): path of the npz file.
+
+    Returns:
+        Union[GraphStore, Dict[str, numpy.ndarray]], arrays indexed by name.
+    """
+    store_path = npz_path[:-len(".npz")] if npz_path.endswith(".npz") else npz_path
+    if is_graph_store(store_path):
+        return GraphStore(store_path)
+    # convert into a private directory first, so concurrent loaders never see a half written store
+    tmp_path = f"{store_path}.tmp{os.getpid()}"
+    try:
+        GraphStore.from_npz(npz_path, tmp_path)
+        os.rename(tmp_path, store_path)
+    except OSError:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not is_graph_store(store_path):
+            with np.load(npz_path) as npz_file:
+                return {name: npz_file[name] for name in npz_file.files}
+    return GraphStore(store_path)
+
+
+def as_index_array(array: np.ndarray, bound=None) -> np.ndarray:
+    """
+    Cast an integer array of node or edge ids or offsets to the index data type, int32 if values fit in it,
+    else int64. No copy is made if the array already has this data type.
+
+    Args:
+        array(numpy.ndarray): integer array.
+        bound(int): exclusive upper bound of values, max value + 1 if not given.
+
+    Returns:
+        numpy.ndarray, the casted array.
+    """
+    if bound is None:
+        bound = int(array.max()) + 1 if array.size > 0 else 0
+    return array.astype(get_index_dtype(bound), copy=False)
+
+
+def get_indptr_from_coo_src(src_index: np.ndarray, result_array: np.ndarray = None, node_count=None,
+                            return_perm=False):
+    """
+    Get csr indptr from coo source nodes. Sorted sources are handled by binary search, unsorted sources by
+    counting, isolated nodes get empty rows in both cases.
+
+    Args:
+        src_index(numpy.ndarray): source node of each coo edge.
+        result_array(numpy.ndarray): array with shape [node_count + 1] to write indptr into, a new array is
+            allocated if None.
+        node_count(int): node count, inferred from `result_array` or the max source node id if not given.
+        return_perm(bool): if True, also return the coo edge position for each csr edge, i.e. the order to
+            gather destination nodes and edge features in.
+
+    Returns:
+        - **indptr** (numpy.ndarray) - csr indptr with shape [node_count + 1].
+        - **perm** (numpy.ndarray) - coo edge position for each csr edge, only returned if `return_perm` is True.
+            It is None if `src_index` is already sorted.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.dataset.utils import get_indptr_from_coo_src
+        >>> indptr, perm = get_indptr_from_coo_src(np.array([2, 0, 2, 3]), node_count=5, return_perm=True)
+        >>> print(indptr, perm)
+        [0 1 1 3 4 4] [1 0 2 3]
+    """
+    src_index = np.asarray(src_index)
+    edge_count = src_index.shape[0]
+    if node_count is None:
+        if result_array is not None:
+            node_count = result_array.shape[0] - 1
         else:
-            cum_sum += 1
+            node_count = int(src_index.max()) + 1 if edge_count > 0 else 0
+    if result_array is None:
+        result_array = np.empty([node_count + 1], dtype=get_index_dtype(edge_count))
+    assert result_array.shape[0] == node_count + 1, "result_array should have node_count + 1 elements"
+
+    perm = None
+    if edge_count == 0 or np.all(src_index[1:] >= src_index[:-1]):
+        # first edge position of each node
+        result_array[:] = np.searchsorted(src_index, np.arange(node_count + 1), side='left')
+    else:
+        result_array[0] = 0
+        np.cumsum(np.bincount(src_index, minlength=node_count), out=result_array[1:])
+        if return_perm:
+            perm = _stable_argsort(src_index, node_count).astype(result_array.dtype, copy=False)
+    if return_perm:
+        return result_array, perm
     return result_array
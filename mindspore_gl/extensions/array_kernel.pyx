@@ -25,16 +25,21 @@ from libc.stdlib cimport rand, RAND_MAX
 from libcpp cimport bool
 from cython.parallel import prange
 
+# index types, int32 is used when node and edge counts fit in it, else int64
+ctypedef fused idx_t:
+    np.int32_t
+    np.int64_t
+
 @cython.boundscheck(False)
 @cython.boundscheck(False)
-def float_2d_array_slicing(np.ndarray[np.float32_t, ndim=2] array, np.ndarray[np.int32_t, ndim=1] indices):
+def float_2d_array_slicing(np.ndarray[np.float32_t, ndim=2] array, np.ndarray[idx_t, ndim=1] indices):
 
     cdef np.ndarray[np.float32_t, ndim=2] res = np.zeros([indices.shape[0], array.shape[1]], dtype=array.dtype)
-    cdef int indice_size =indices.shape[0]
-    cdef int index
-    cdef int indice_value
+    cdef long long indice_size =indices.shape[0]
+    cdef long long index
+    cdef long long indice_value
 
-    cdef int [:] indice_view = indices
+    cdef idx_t [:] indice_view = indices
     cdef float [:, :] array_view = array
     cdef float [:, :] res_view = res
     with nogil:
@@ -45,11 +50,11 @@ def float_2d_array_slicing(np.ndarray[np.float32_t, ndim=2] array, np.ndarray[np
 
 @cython.boundscheck(False)
 @cython.boundscheck(False)
-def int_2d_array_slicing(np.ndarray[np.int32_t, ndim=2] array, np.ndarray[np.int32_t, ndim=1] indices):
+def int_2d_array_slicing(np.ndarray[np.int32_t, ndim=2] array, np.ndarray[idx_t, ndim=1] indices):
     cdef np.ndarray[np.int32_t, ndim=2] res = np.zeros([indices.shape[0], array.shape[1]], dtype=array.dtype)
-    cdef int indice_size = indices.shape[0]
-    cdef int index
-    cdef int indice_value
+    cdef long long indice_size = indices.shape[0]
+    cdef long long index
+    cdef long long indice_value
     for index in xrange(indice_size):
         indice_value = indices[index]
         res[index] = array[indice_value]
@@ -57,11 +62,11 @@ def int_2d_array_slicing(np.ndarray[np.int32_t, ndim=2] array, np.ndarray[np.int
 
 @cython.boundscheck(False)
 @cython.boundscheck(False)
-def int_1d_array_slicing(np.ndarray[np.int32_t, ndim=1] array, np.ndarray[np.int32_t, ndim=1] indices):
+def int_1d_array_slicing(np.ndarray[np.int32_t, ndim=1] array, np.ndarray[idx_t, ndim=1] indices):
     cdef np.ndarray[np.int32_t, ndim=1] res = np.zeros([indices.shape[0]], dtype=array.dtype)
-    cdef int indice_size = indices.shape[0]
-    cdef int index
-    cdef int indice_value
+    cdef long long indice_size = indices.shape[0]
+    cdef long long index
+    cdef long long indice_value
     for index in xrange(indice_size):
         indice_value = indices[index]
         res[index] = array[indice_value]
@@ -86,14 +91,14 @@ def float_2d_array_col_copy(np.ndarray[np.float32_t, ndim=2] target_array, np.nd
 @cython.boundscheck(False)
 def float_2d_gather_with_dst(np.ndarray[np.float32_t, ndim=2] dst,
                              np.ndarray[np.float32_t, ndim=2] src,
-                             np.ndarray[np.int32_t, ndim=1] indices
+                             np.ndarray[idx_t, ndim=1] indices
                             ):
 
-    cdef int indice_size =indices.shape[0]
-    cdef int index
-    cdef int indice_value
+    cdef long long indice_size =indices.shape[0]
+    cdef long long index
+    cdef long long indice_value
 
-    cdef int [:] indice_view = indices
+    cdef idx_t [:] indice_view = indices
     cdef float [:, :] dst_view = dst
     cdef float [:, :] src_view = src
     with nogil:
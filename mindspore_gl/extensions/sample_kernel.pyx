@@ -21,20 +21,35 @@ from libcpp.set cimport set
 from libcpp.unordered_set cimport unordered_set
 from libcpp.unordered_map cimport unordered_map
 from libcpp.vector cimport vector
+from libcpp.pair cimport pair
+from libcpp.algorithm cimport partial_sort
+from libcpp.functional cimport greater
+from libc.math cimport log
 from libc.stdlib cimport rand, RAND_MAX
 from libcpp cimport bool
 from cython.parallel import prange
 
+# index types, int32 is used when node and edge counts fit in it, else int64
+ctypedef fused idx_t:
+    np.int32_t
+    np.int64_t
+
+ctypedef fused ptr_t:
+    np.int32_t
+    np.int64_t
+
+# (key, csr position) for weighted sampling without replacement
+ctypedef pair[double, long long] weighted_edge
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def map_edges(np.ndarray[np.int32_t, ndim=2] edges, reindex):
+def map_edges(np.ndarray[idx_t, ndim=2] edges, reindex):
     """Mapping edges by given dictionary
     """
-    cdef unordered_map[int, int] m = reindex
-    cdef int i = 0
-    cdef int h = edges.shape[1]
-    cdef int j
-    cdef int [:, :] edges_view = edges
+    cdef unordered_map[long long, long long] m = reindex
+    cdef long long i = 0
+    cdef long long h = edges.shape[1]
+    cdef idx_t [:, :] edges_view = edges
     with nogil:
         for i in prange(h, schedule="static"):
             edges_view[0, i] = m[edges_view[0, i]]
@@ -47,12 +62,12 @@ def map_edges(np.ndarray[np.int32_t, ndim=2] edges, reindex):
 def map_nodes(nodes, reindex):
     """Mapping nodes by given dictionary
     """
-    cdef np.ndarray[np.int32_t, ndim=1] t_nodes = np.array(nodes, dtype=np.int32)
-    cdef unordered_map[int, int] m = reindex
-    cdef int i = 0
-    cdef int h = len(nodes)
-    cdef np.ndarray[np.int32_t, ndim=1] new_nodes = np.zeros([h], dtype=np.int32)
-    cdef int j
+    cdef np.ndarray[np.int64_t, ndim=1] t_nodes = np.array(nodes, dtype=np.int64)
+    cdef unordered_map[long long, long long] m = reindex
+    cdef long long i = 0
+    cdef long long h = len(nodes)
+    cdef np.ndarray[np.int64_t, ndim=1] new_nodes = np.zeros([h], dtype=np.int64)
+    cdef long long j
     with nogil:
         for i in xrange(h):
             j = t_nodes[i]
@@ -61,49 +76,51 @@ def map_nodes(nodes, reindex):
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def sample_one_hop_unbias(np.ndarray[np.int32_t, ndim=1] csr_row, np.ndarray[np.int32_t, ndim=1] csr_col, int neighbor_num,
-                          np.ndarray[np.int32_t, ndim=1] seeds, bool replace=False):
+def sample_one_hop_unbias(np.ndarray[ptr_t, ndim=1] csr_row, np.ndarray[idx_t, ndim=1] csr_col, int neighbor_num,
+                          np.ndarray[idx_t, ndim=1] seeds, bool replace=False):
+    """Sample neighbors without replacement, edge index has the dtype of csr_col and edge ids of csr_row"""
+    cdef long long seeds_length = seeds.shape[0]
 
-    
-    cdef int seeds_length = len(seeds)
-
-    cdef int seed_idx
-    cdef int node
-    cdef int col_start, col_end
-    cdef int total_edge_num = 0
-    cdef int offset = 0
-    cdef int idx
+    cdef long long seed_idx
+    cdef long long node
+    cdef long long col_start, col_end, degree
+    cdef long long total_edge_num = 0
+    cdef long long offset = 0
+    cdef long long k, j, t
+    cdef unordered_set[long long] chosen
 
     for seed_idx in xrange(seeds_length):
         node = seeds[seed_idx]
-        col_start, col_end = csr_row[node], csr_row[node + 1]
-        if col_end - col_start <= neighbor_num:
-            total_edge_num += col_end - col_start
-        else:
-            total_edge_num += neighbor_num
-    #
-    cdef np.ndarray[np.int32_t, ndim=1] edge_ids = np.zeros([total_edge_num], dtype=np.int32)
+        degree = csr_row[node + 1] - csr_row[node]
+        total_edge_num += degree if degree <= neighbor_num else neighbor_num
 
     # define result
-    cdef np.ndarray[np.int32_t, ndim=2] res_edge_index = np.zeros([2, total_edge_num], dtype=np.int32)
+    cdef np.ndarray[ptr_t, ndim=1] edge_ids = np.zeros([total_edge_num], dtype=csr_row.dtype)
+    cdef np.ndarray[idx_t, ndim=2] res_edge_index = np.zeros([2, total_edge_num], dtype=csr_col.dtype)
     for seed_idx in xrange(seeds_length):
         node = seeds[seed_idx]
         col_start, col_end = csr_row[node], csr_row[node + 1]
-        if col_end - col_start <= neighbor_num:
-            # print("neighbor < count")
-            res_edge_index[0][offset: offset + col_end - col_start] = node
-
-            res_edge_index[1][offset: offset + col_end - col_start] = csr_col[col_start: col_end]
-            for idx in xrange(col_end - col_start):
-                edge_ids[offset + idx] = col_start + idx
-            offset += col_end - col_start
+        degree = col_end - col_start
+        if degree <= neighbor_num:
+            for k in xrange(degree):
+                edge_ids[offset + k] = col_start + k
         else:
-
-            choose_index(edge_ids, neighbor_num, col_end - col_start, offset, col_start)
-            #update
-            res_edge_index[0, offset: offset + neighbor_num] = node
-            res_edge_index[1, offset: offset + neighbor_num] = csr_col[edge_ids[offset: offset + neighbor_num]]
-            offset += neighbor_num
+            # Sample without replacement via Robert Floyd algorithm
+            # https://www.nowherenearithaca.com/2013/05/robert-floyds-tiny-and-beautiful.html
+            chosen.clear()
+            k = 0
+            for j in xrange(degree - neighbor_num, degree):
+                t = rand() % (j + 1)
+                if chosen.find(t) != chosen.end():
+                    t = j
+                chosen.insert(t)
+                edge_ids[offset + k] = col_start + t
+                k += 1
+            degree = neighbor_num
+        for k in xrange(degree):
+            res_edge_index[0, offset + k] = node
+            res_edge_index[1, offset + k] = csr_col[edge_ids[offset + k]]
+        offset += degree
 
     return res_edge_index, edge_ids
 
@@ -147,26 +164,284 @@ def choose_index(np.ndarray[ndim=1, dtype=np.int32_t] rnd, int neighbor_count, i
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
-def random_walk_cpu_unbias(np.ndarray[np.int32_t, ndim=1] csr_row, np.ndarray[np.int32_t, ndim=1] csr_col,
-                           int walk_length, np.ndarray[np.int32_t, ndim=1] seeds, int default_value = -1):
-    cdef int seeds_length = seeds.shape[0]
-    cdef np.ndarray[np.int32_t, ndim=2] out = np.full([seeds_length, walk_length + 1], -1, dtype=np.int32)
-    cdef int idx
-    cdef int node
-    cdef int row_start, row_end
+def random_walk_cpu_unbias(np.ndarray[ptr_t, ndim=1] csr_row, np.ndarray[idx_t, ndim=1] csr_col,
+                           int walk_length, np.ndarray[idx_t, ndim=1] seeds, int default_value = -1):
+    """Random walk, a walk reaching a node without out edges is padded by default_value"""
+    cdef long long seeds_length = seeds.shape[0]
+    cdef np.ndarray[idx_t, ndim=2] out = np.full([seeds_length, walk_length + 1], default_value,
+                                                 dtype=csr_col.dtype)
+    cdef long long idx
+    cdef long long node
+    cdef long long row_start, row_end
     cdef int cur_ptr = 0
-    cdef int sampled_node
     for idx in xrange(seeds_length):
         node = seeds[idx]
-        out[idx][0] = node
+        out[idx, 0] = node
         for cur_ptr in xrange(walk_length):
             row_start = csr_row[node]
             row_end = csr_row[node + 1]
-            sampled_node = csr_col[row_start + rand() % (row_end - row_start)]
-            out[idx][cur_ptr + 1] = sampled_node
+            if row_end == row_start:
+                break
+            node = csr_col[row_start + rand() % (row_end - row_start)]
+            out[idx, cur_ptr + 1] = node
 
     return out
-    
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def csr_cumulative_weight(np.ndarray[ptr_t, ndim=1] csr_row, const double[:] weights):
+    """Cumulative edge weights restarting at each csr row, so row sums do not lose precision to earlier rows"""
+    cdef long long node_count = csr_row.shape[0] - 1
+    cdef np.ndarray[np.float64_t, ndim=1] cum_weight = np.empty([weights.shape[0]], dtype=np.float64)
+    cdef double[:] cum_view = cum_weight
+    cdef ptr_t[:] row_view = csr_row
+    cdef long long node, k
+    cdef double total
+    with nogil:
+        for node in prange(node_count, schedule="guided"):
+            total = 0
+            for k in range(row_view[node], row_view[node + 1]):
+                total = total + weights[k]
+                cum_view[k] = total
+    return cum_weight
+
+
+cdef inline double _uniform() noexcept nogil:
+    # uniform in [0, 1)
+    return rand() / (RAND_MAX + 1.0)
+
+
+cdef inline long long _search_cumulative(const double* cum_weight, long long row_start, long long row_end) noexcept nogil:
+    """position of a neighbor drawn with probability proportional to its weight, row weight sum should be positive"""
+    # cumulative weights restart at each row
+    cdef double target = _uniform() * cum_weight[row_end - 1]
+    cdef long long low = row_start
+    cdef long long high = row_end - 1
+    cdef long long mid
+    # first position whose cumulative weight exceeds target, zero weight edges are never chosen
+    while low < high:
+        mid = (low + high) >> 1
+        if cum_weight[mid] > target:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+cdef inline bool _chosen(const ptr_t* chosen, long long count, long long position) noexcept nogil:
+    # linear scan, neighbor num is small and chosen edges stay in cache
+    cdef long long k
+    for k in range(count):
+        if chosen[k] == position:
+            return True
+    return False
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def sample_one_hop_weighted(np.ndarray[ptr_t, ndim=1] csr_row, np.ndarray[idx_t, ndim=1] csr_col,
+                            const double[:] cum_weight, const long long[:] positive_degree, int neighbor_num,
+                            np.ndarray[idx_t, ndim=1] seeds, bool replace=False):
+    """
+    Sample neighbors with probability proportional to edge weights given as row cumulative weights.
+    With replacement, each seed with positive weight sum gets neighbor_num draws by binary search. Without
+    replacement, draws hitting chosen edges are rejected, and if rejections pile up the rest are chosen by
+    Efraimidis-Spirakis keys u^(1/w) over the remaining edges, both give successive weighted sampling.
+    """
+    cdef long long seeds_length = seeds.shape[0]
+    cdef long long seed_idx, node, row_start, row_end, degree, k, p, attempts, count
+    cdef long long total_edge_num = 0
+    cdef long long offset = 0
+    cdef double weight
+    cdef vector[weighted_edge] keys
+    cdef const double* cum_ptr = &cum_weight[0] if cum_weight.shape[0] > 0 else NULL
+
+    for seed_idx in xrange(seeds_length):
+        degree = positive_degree[seeds[seed_idx]]
+        if replace:
+            total_edge_num += neighbor_num if degree > 0 else 0
+        else:
+            total_edge_num += degree if degree <= neighbor_num else neighbor_num
+
+    cdef np.ndarray[ptr_t, ndim=1] edge_ids = np.zeros([total_edge_num], dtype=csr_row.dtype)
+    cdef ptr_t[:] edge_ids_view = edge_ids
+    cdef np.ndarray[idx_t, ndim=2] res_edge_index = np.zeros([2, total_edge_num], dtype=csr_col.dtype)
+    for seed_idx in xrange(seeds_length):
+        node = seeds[seed_idx]
+        row_start, row_end = csr_row[node], csr_row[node + 1]
+        degree = positive_degree[node]
+        if degree == 0:
+            continue
+        if replace:
+            for k in xrange(neighbor_num):
+                edge_ids[offset + k] = _search_cumulative(cum_ptr, row_start, row_end)
+            degree = neighbor_num
+        elif degree <= neighbor_num:
+            k = 0
+            for p in xrange(row_start, row_end):
+                if cum_weight[p] > (cum_weight[p - 1] if p > row_start else 0):
+                    edge_ids[offset + k] = p
+                    k += 1
+        else:
+            count = 0
+            attempts = 0
+            # rejections are frequent when most of the row is sampled, keys are used directly then
+            while count < neighbor_num and attempts < 4 * neighbor_num and 2 * neighbor_num < degree:
+                p = _search_cumulative(cum_ptr, row_start, row_end)
+                attempts += 1
+                if not _chosen(&edge_ids_view[offset], count, p):
+                    edge_ids_view[offset + count] = p
+                    count += 1
+            if count < neighbor_num:
+                keys.clear()
+                for p in xrange(row_start, row_end):
+                    weight = cum_ptr[p] - (cum_ptr[p - 1] if p > row_start else 0)
+                    if weight > 0 and not _chosen(&edge_ids_view[offset], count, p):
+                        # log of u^(1/w), u is shifted into (0, 1]
+                        keys.push_back(weighted_edge(log(1 - _uniform()) / weight, p))
+                k = neighbor_num - count
+                partial_sort(keys.begin(), keys.begin() + k, keys.end(), greater[weighted_edge]())
+                for p in xrange(k):
+                    edge_ids_view[offset + count + p] = keys[p].second
+            degree = neighbor_num
+        for k in xrange(degree):
+            res_edge_index[0, offset + k] = node
+            res_edge_index[1, offset + k] = csr_col[edge_ids[offset + k]]
+        offset += degree
+
+    return res_edge_index, edge_ids
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def random_walk_cpu_weighted(np.ndarray[ptr_t, ndim=1] csr_row, np.ndarray[idx_t, ndim=1] csr_col,
+                             const double[:] cum_weight, int walk_length, np.ndarray[idx_t, ndim=1] seeds,
+                             int default_value = -1):
+    """Weighted random walk, a walk reaching a node without positive weight out edges is padded by default_value"""
+    cdef long long seeds_length = seeds.shape[0]
+    cdef np.ndarray[idx_t, ndim=2] out = np.full([seeds_length, walk_length + 1], default_value,
+                                                 dtype=csr_col.dtype)
+    cdef long long idx
+    cdef long long node
+    cdef long long row_start, row_end
+    cdef int cur_ptr = 0
+    cdef const double* cum_ptr = &cum_weight[0] if cum_weight.shape[0] > 0 else NULL
+    for idx in xrange(seeds_length):
+        node = seeds[idx]
+        out[idx, 0] = node
+        for cur_ptr in xrange(walk_length):
+            row_start = csr_row[node]
+            row_end = csr_row[node + 1]
+            if row_end == row_start or cum_ptr[row_end - 1] <= 0:
+                break
+            node = csr_col[_search_cumulative(cum_ptr, row_start, row_end)]
+            out[idx, cur_ptr + 1] = node
+
+    return out
+
+
+cdef inline long long _decode_compressed(const unsigned char[:] data, const long long[:] block_offsets,
+                                         long long block, long long skip) nogil:
+    # blocks start with an absolute value followed by varint encoded gaps
+    cdef long long pos = block_offsets[block]
+    cdef long long value = 0
+    cdef long long gap
+    cdef long long i
+    cdef int shift
+    cdef unsigned char byte
+    for i in range(skip + 1):
+        gap = 0
+        shift = 0
+        byte = data[pos]
+        pos += 1
+        while byte >= 0x80:
+            gap |= (<long long>(byte & 0x7f)) << shift
+            shift += 7
+            byte = data[pos]
+            pos += 1
+        gap |= (<long long>byte) << shift
+        value += gap
+    return value
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def sample_one_hop_unbias_compressed(const long long[:] indptr, const long long[:] block_indptr,
+                                     const long long[:] block_offsets, const unsigned char[:] data,
+                                     int block_size, int neighbor_num, np.ndarray[idx_t, ndim=1] seeds):
+    """Sample neighbors without replacement on compressed csr, neighbors are decoded on the fly"""
+    cdef long long seeds_length = seeds.shape[0]
+    cdef long long seed_idx
+    cdef long long node
+    cdef long long row_start, degree, k, j, t
+    cdef long long total_edge_num = 0
+    cdef long long offset = 0
+    cdef unordered_set[long long] chosen
+
+    for seed_idx in xrange(seeds_length):
+        node = seeds[seed_idx]
+        degree = indptr[node + 1] - indptr[node]
+        total_edge_num += degree if degree <= neighbor_num else neighbor_num
+
+    cdef np.ndarray[idx_t, ndim=2] res_edge_index = np.zeros([2, total_edge_num], dtype=seeds.dtype)
+    cdef np.ndarray[np.int64_t, ndim=1] edge_ids = np.zeros([total_edge_num], dtype=np.int64)
+    for seed_idx in xrange(seeds_length):
+        node = seeds[seed_idx]
+        row_start = indptr[node]
+        degree = indptr[node + 1] - row_start
+        if degree <= neighbor_num:
+            for k in xrange(degree):
+                edge_ids[offset + k] = row_start + k
+        else:
+            # Sample without replacement via Robert Floyd algorithm
+            chosen.clear()
+            k = 0
+            for j in xrange(degree - neighbor_num, degree):
+                t = rand() % (j + 1)
+                if chosen.find(t) != chosen.end():
+                    t = j
+                chosen.insert(t)
+                edge_ids[offset + k] = row_start + t
+                k += 1
+            degree = neighbor_num
+        for k in xrange(degree):
+            t = edge_ids[offset + k] - row_start
+            res_edge_index[0, offset + k] = node
+            res_edge_index[1, offset + k] = _decode_compressed(data, block_offsets, block_indptr[node] + t // block_size,
+                                                               t % block_size)
+        offset += degree
+
+    return res_edge_index, edge_ids
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def random_walk_cpu_unbias_compressed(const long long[:] indptr, const long long[:] block_indptr,
+                                      const long long[:] block_offsets, const unsigned char[:] data,
+                                      int block_size, int walk_length, np.ndarray[idx_t, ndim=1] seeds,
+                                      int default_value=-1):
+    """Random walk on compressed csr, a walk reaching a node without out edges is padded by default_value"""
+    cdef long long seeds_length = seeds.shape[0]
+    cdef np.ndarray[idx_t, ndim=2] out = np.full([seeds_length, walk_length + 1], default_value,
+                                                 dtype=seeds.dtype)
+    cdef long long idx
+    cdef int cur_ptr
+    cdef long long node
+    cdef long long degree, t
+    for idx in xrange(seeds_length):
+        node = seeds[idx]
+        out[idx, 0] = node
+        for cur_ptr in xrange(walk_length):
+            degree = indptr[node + 1] - indptr[node]
+            if degree == 0:
+                break
+            t = rand() % degree
+            node = _decode_compressed(data, block_offsets, block_indptr[node] + t // block_size, t % block_size)
+            out[idx, cur_ptr + 1] = node
+
+    return out
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def skip_gram_gen_pair(vector[long long] walk, long win_size=5):
@@ -0,0 +1,233 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Bucketing policies for padding."""
+from collections import namedtuple
+from bisect import bisect_left
+from typing import List, Union, Tuple
+import math
+import numpy as np
+
+PaddingStats = namedtuple("PaddingStats", ['count', 'size', 'padded_size', 'overhead', 'shape_count'])
+
+
+class BucketPolicy:
+    """
+    Base class of bucketing policies. A policy maps a size to the smallest bucket not less than it, inputs of the
+    same bucket are padded to the same shape, so the number of buckets bounds the number of graph compilations
+    while the gap between sizes and buckets is the padding waste.
+    """
+
+    def __call__(self, size: int) -> int:
+        """
+        Get bucket of a size.
+
+        Args:
+            size(int): input size.
+
+        Returns:
+            int, the bucket, not less than `size`.
+        """
+        raise NotImplementedError
+
+
+class GeometricBucket(BucketPolicy):
+    """
+    Buckets grow geometrically from `min_size`, the next bucket is ceil(bucket * ratio). With ratio 2 and
+    min_size 1, buckets are powers of two, which is what PadMode.AUTO uses by default. A smaller ratio wastes less
+    padding but produces more buckets.
+
+    Args:
+        ratio(float): ratio between adjacent buckets, should be larger than 1.
+        min_size(int): the smallest bucket.
+
+    Examples:
+        >>> from mindspore_gl.graph.bucket import GeometricBucket
+        >>> bucket = GeometricBucket(ratio=1.5, min_size=64)
+        >>> print(bucket(100), bucket(150))
+        144 216
+    """
+
+    def __init__(self, ratio=2., min_size=1):
+        if ratio <= 1:
+            raise ValueError(f"ratio should be larger than 1, but got {ratio}")
+        if min_size < 1:
+            raise ValueError(f"min_size should be positive, but got {min_size}")
+        self.ratio = ratio
+        self.min_size = int(min_size)
+        self._buckets = [self.min_size]
+
+    def __call__(self, size: int) -> int:
+        # buckets are extended by integer steps, so they do not drift with float rounding of large sizes
+        while self._buckets[-1] < size:
+            last = self._buckets[-1]
+            self._buckets.append(max(last + 1, math.ceil(last * self.ratio)))
+        return self._buckets[bisect_left(self._buckets, size)]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(ratio={self.ratio}, min_size={self.min_size})"
+
+
+class FixedBucket(BucketPolicy):
+    """
+    Buckets from a given list of sizes.
+
+    Args:
+        sizes(Union[List[int], Tuple[int], numpy.ndarray]): bucket sizes.
+        fallback(BucketPolicy): policy for sizes larger than all buckets. If None, such sizes raise ValueError.
+
+    Examples:
+        >>> from mindspore_gl.graph.bucket import FixedBucket
+        >>> bucket = FixedBucket([100, 200, 400])
+        >>> print(bucket(100), bucket(101))
+        100 200
+    """
+
+    def __init__(self, sizes: Union[List[int], Tuple[int], np.ndarray], fallback: BucketPolicy = None):
+        self.sizes = sorted(set(int(size) for size in sizes))
+        if not self.sizes:
+            raise ValueError("sizes should not be empty")
+        self.fallback = fallback
+
+    def __call__(self, size: int) -> int:
+        pos = bisect_left(self.sizes, size)
+        if pos < len(self.sizes):
+            return self.sizes[pos]
+        if self.fallback is None:
+            raise ValueError(f"size {size} is larger than the largest bucket {self.sizes[-1]}")
+        return self.fallback(size)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(sizes={self.sizes}, fallback={self.fallback!r})"
+
+
+class LearnedBucket(FixedBucket):
+    """
+    Buckets learned from observed sizes, boundaries are chosen by dynamic programming to minimize the total padding
+    of the observed sizes with at most `bucket_count` buckets. The largest bucket is the largest observed size,
+    larger sizes go to `fallback`.
+
+    Args:
+        sizes(Union[List[int], numpy.ndarray]): observed sizes, e.g. node counts of the graphs in a dataset.
+        bucket_count(int): max number of buckets.
+        fallback(BucketPolicy): policy for sizes larger than all observed sizes. Default: GeometricBucket().
+        max_candidates(int): if observed sizes have more distinct values, candidate boundaries are reduced to
+            this many quantiles of the sizes to bound the fitting cost.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.bucket import LearnedBucket
+        >>> bucket = LearnedBucket(np.array([10, 11, 12, 100, 101]), bucket_count=2)
+        >>> print(bucket.sizes)
+        [12, 101]
+    """
+
+    def __init__(self, sizes: Union[List[int], np.ndarray], bucket_count=8, fallback: BucketPolicy = None,
+                 max_candidates=256):
+        if bucket_count < 1:
+            raise ValueError(f"bucket_count should be positive, but got {bucket_count}")
+        sizes = np.asarray(sizes, dtype=np.int64)
+        if sizes.shape[0] == 0:
+            raise ValueError("sizes should not be empty")
+        super().__init__(_fit_buckets(sizes, bucket_count, max_candidates),
+                         GeometricBucket() if fallback is None else fallback)
+
+
+def _fit_buckets(sizes: np.ndarray, bucket_count: int, max_candidates: int) -> np.ndarray:
+    """bucket boundaries with minimal total padding of sizes"""
+    candidates, counts = np.unique(sizes, return_counts=True)
+    if candidates.shape[0] > max_candidates:
+        # the "higher" quantiles, np.quantile only takes a method argument from numpy 1.22
+        quantile_idx = np.ceil(np.linspace(0, 1, max_candidates) * (sizes.shape[0] - 1)).astype(np.int64)
+        candidates = np.unique(np.sort(sizes)[quantile_idx])
+        counts = np.bincount(np.searchsorted(candidates, sizes), minlength=candidates.shape[0])
+    totals = np.bincount(np.searchsorted(candidates, sizes), weights=sizes, minlength=candidates.shape[0])
+    count_prefix = np.concatenate([[0], np.cumsum(counts)])
+    total_prefix = np.concatenate([[0.], np.cumsum(totals)])
+    candidate_count = candidates.shape[0]
+    bucket_count = min(bucket_count, candidate_count)
+
+    def padding(end):
+        # padding of candidate groups [start, end] for each start, all padded to candidates[end]
+        start = np.arange(end + 1)
+        return candidates[end] * (count_prefix[end + 1] - count_prefix[start]) - \
+            (total_prefix[end + 1] - total_prefix[start])
+
+    # cost[b, j]: min padding of groups [0, j] with b + 1 buckets, the last one is candidates[j]
+    cost = np.full([bucket_count, candidate_count], np.inf)
+    split = np.zeros([bucket_count, candidate_count], dtype=np.int64)
+    for end in range(candidate_count):
+        end_padding = padding(end)
+        cost[0, end] = end_padding[0]
+        for b in range(1, min(bucket_count, end + 1)):
+            # the previous bucket ends at start - 1
+            total = cost[b - 1, :end] + end_padding[1:]
+            split[b, end] = np.argmin(total) + 1
+            cost[b, end] = total[split[b, end] - 1]
+    b = int(np.argmin(cost[:, -1]))
+    end = candidate_count - 1
+    buckets = []
+    while b >= 0:
+        buckets.append(candidates[end])
+        end = split[b, end] - 1
+        b -= 1
+    return np.array(buckets[::-1])
+
+
+class PaddingRecorder:
+    """
+    Record padding results of a pad operator: total real size, total padded size and distinct padded shapes.
+    The overhead is the padded fraction of the real size, the shape count is the number of compiled graphs the
+    padded inputs need.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """reset the record"""
+        self._count = 0
+        self._size = 0
+        self._padded_size = 0
+        self._shapes = set()
+
+    def record(self, size: int, padded_size: int, shape: Tuple):
+        """
+        Record one padding.
+
+        Args:
+            size(int): real size of the input.
+            padded_size(int): size after padding.
+            shape(Tuple): padded shape.
+        """
+        self._count += 1
+        self._size += int(size)
+        self._padded_size += int(padded_size)
+        self._shapes.add(tuple(int(dim) for dim in shape))
+
+    def stats(self) -> PaddingStats:
+        """
+        Padding statistics.
+
+        Returns:
+            PaddingStats, with fields
+
+            - **count** (int) - number of recorded paddings.
+            - **size** (int) - total real size.
+            - **padded_size** (int) - total size after padding.
+            - **overhead** (float) - padded_size / size - 1.
+            - **shape_count** (int) - number of distinct padded shapes.
+        """
+        overhead = self._padded_size / self._size - 1 if self._size else 0.
+        return PaddingStats(self._count, self._size, self._padded_size, overhead, len(self._shapes))
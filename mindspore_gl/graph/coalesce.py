@@ -0,0 +1,184 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Coalesce edges: deduplicate, normalize self loops and sort."""
+import numpy as np
+from .graph import MindHomoGraph, BatchMeta, get_index_dtype, _stable_argsort
+
+_REDUCE_OPS = {"sum": np.add, "max": np.maximum, "min": np.minimum}
+
+
+def _reduce_segments(values: np.ndarray, starts: np.ndarray, reduce: str) -> np.ndarray:
+    """reduce consecutive segments of values beginning at starts"""
+    if starts.shape[0] == 0:
+        return values[:0]
+    if reduce == "first":
+        return values[starts]
+    if reduce == "mean":
+        counts = np.diff(np.append(starts, values.shape[0]))
+        res = np.add.reduceat(values, starts, axis=0)
+        return res / counts.reshape((-1,) + (1,) * (values.ndim - 1))
+    return _REDUCE_OPS[reduce].reduceat(values, starts, axis=0)
+
+
+def coalesce(adj_coo: np.ndarray, node_count=None, edge_weight: np.ndarray = None, reduce="sum", self_loop=None,
+             fill_value=1, sort_by="dst", return_perm=False):
+    """
+    Coalesce coo format adjacent matrix in a single sort. Duplicate edges are merged, self loops are kept,
+    removed or added and edges are sorted by (dst, src) or (src, dst). Sorting by destination node makes
+    the edges of each destination contiguous, which suits segment reductions of messages.
+
+    Args:
+        adj_coo(numpy.ndarray): coo format adjacent matrix with shape [2, edge_count].
+        node_count(int): node count of the graph, inferred from the max node id if not given.
+        edge_weight(numpy.ndarray): edge weights or features with edge count as first dimension.
+        reduce(str): how weights of duplicate edges are merged, one of 'sum', 'mean', 'max', 'min' and 'first'.
+        self_loop(str): None to keep self loops as they are, 'remove' to drop them, 'add' to make sure every
+            node has exactly one self loop.
+        fill_value(Union[int, float]): weight of added self loops.
+        sort_by(str): 'dst' to sort edges by (dst, src), 'src' to sort by (src, dst), i.e. csr order.
+        return_perm(bool): if True, also return the input position of each output edge.
+
+    Returns:
+        - **adj_coo** (numpy.ndarray) - coalesced coo format adjacent matrix.
+        - **edge_weight** (numpy.ndarray) - merged edge weights, only returned if `edge_weight` is given.
+        - **perm** (numpy.ndarray) - input position of the first merged edge of each output edge, -1 for
+          added self loops, only returned if `return_perm` is True. Edge features are permuted by
+          :func:`gather_edge_feat`.
+
+    Raises:
+        ValueError: if `reduce`, `self_loop` or `sort_by` is not supported.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.coalesce import coalesce
+        >>> adj_coo = np.array([[1, 0, 1, 2], [0, 1, 0, 2]])
+        >>> adj_coo, weight, perm = coalesce(adj_coo, edge_weight=np.ones(4), self_loop="add", return_perm=True)
+        >>> print(adj_coo)
+        [[0 1 0 1 2]
+         [0 0 1 1 2]]
+        >>> print(weight, perm)
+        [1. 2. 1. 1. 1.] [-1  0  1 -1  3]
+    """
+    if reduce not in ("sum", "mean", "max", "min", "first"):
+        raise ValueError(f"reduce should be one of 'sum', 'mean', 'max', 'min' and 'first', but got {reduce}.")
+    if self_loop not in (None, "remove", "add"):
+        raise ValueError(f"self_loop should be None, 'remove' or 'add', but got {self_loop}.")
+    if sort_by not in ("dst", "src"):
+        raise ValueError(f"sort_by should be 'dst' or 'src', but got {sort_by}.")
+    adj_coo = np.asarray(adj_coo)
+    edge_count = adj_coo.shape[1]
+    if node_count is None:
+        node_count = int(adj_coo.max()) + 1 if edge_count > 0 else 0
+    perm = np.arange(edge_count, dtype=np.int64)
+
+    if self_loop is not None:
+        is_loop = adj_coo[0] == adj_coo[1]
+        if self_loop == "remove":
+            keep = np.flatnonzero(~is_loop)
+            adj_coo, perm = adj_coo[:, keep], perm[keep]
+            edge_weight = None if edge_weight is None else edge_weight[keep]
+        else:
+            has_loop = np.zeros([node_count], dtype=bool)
+            has_loop[adj_coo[0, is_loop]] = True
+            loop_nodes = np.flatnonzero(~has_loop).astype(adj_coo.dtype, copy=False)
+            adj_coo = np.concatenate([adj_coo, np.stack([loop_nodes, loop_nodes])], axis=1)
+            perm = np.concatenate([perm, np.full(loop_nodes.shape, -1, dtype=np.int64)])
+            if edge_weight is not None:
+                loop_weight = np.full((loop_nodes.shape[0],) + edge_weight.shape[1:], fill_value,
+                                      dtype=edge_weight.dtype)
+                edge_weight = np.concatenate([edge_weight, loop_weight])
+
+    major, minor = (adj_coo[1], adj_coo[0]) if sort_by == "dst" else (adj_coo[0], adj_coo[1])
+    keys = major.astype(np.int64) * node_count + minor
+    if max(node_count * node_count, 1).bit_length() + max(keys.shape[0] - 1, 1).bit_length() <= 63:
+        order = _stable_argsort(keys, node_count * node_count)
+    else:
+        # two stable passes with packed keys are much faster than a stable argsort of wide keys
+        order = _stable_argsort(minor, node_count)
+        order = order[_stable_argsort(major[order], node_count)]
+    keys = keys[order]
+    starts = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]])) if keys.shape[0] > 0 else order
+
+    # decode nodes from the sorted keys, gathering columns of a [2, edge_count] array is much slower
+    unique_keys = keys[starts]
+    res_major = unique_keys // max(node_count, 1)
+    res_minor = unique_keys - res_major * node_count
+    index_dtype = get_index_dtype(node_count)
+    res_coo = np.empty([2, unique_keys.shape[0]], dtype=index_dtype)
+    res_coo[0], res_coo[1] = (res_minor, res_major) if sort_by == "dst" else (res_major, res_minor)
+
+    res = [res_coo]
+    if edge_weight is not None:
+        res.append(_reduce_segments(edge_weight[order], starts, reduce))
+    if return_perm:
+        res.append(perm[order[starts]].astype(get_index_dtype(edge_count), copy=False))
+    return res[0] if len(res) == 1 else tuple(res)
+
+
+def gather_edge_feat(edge_feat: np.ndarray, perm: np.ndarray, fill_value=0) -> np.ndarray:
+    """
+    Gather edge features of coalesced edges, added self loops are filled with `fill_value`.
+
+    Args:
+        edge_feat(numpy.ndarray): features of input edges with edge count as first dimension.
+        perm(numpy.ndarray): input position of each coalesced edge, as returned by :func:`coalesce`.
+        fill_value(Union[int, float]): feature of added self loops.
+
+    Returns:
+        numpy.ndarray, features of coalesced edges.
+    """
+    res = edge_feat[perm]
+    res[perm < 0] = fill_value
+    return res
+
+
+def coalesce_graph(graph: MindHomoGraph, edge_weight: np.ndarray = None, reduce="sum", self_loop=None,
+                   fill_value=1, sort_by="dst"):
+    """
+    Coalesce edges of a graph, e.g. as a preprocessing step of a dataset. Global node ids are kept and
+    edge ids of the result are the edge ids of the first merged input edge, -1 for added self loops.
+    For batched graphs edges stay grouped by graph and batch meta information is updated.
+
+    Args:
+        graph(MindHomoGraph): graph to coalesce.
+        edge_weight(numpy.ndarray): weights or features of the coo edges of `graph`.
+        reduce(str): how weights of duplicate edges are merged, see :func:`coalesce`.
+        self_loop(str): None, 'remove' or 'add', see :func:`coalesce`.
+        fill_value(Union[int, float]): weight of added self loops.
+        sort_by(str): 'dst' or 'src', see :func:`coalesce`.
+
+    Returns:
+        - **graph** (MindHomoGraph) - coalesced graph in coo format.
+        - **edge_weight** (numpy.ndarray) - merged edge weights, only returned if `edge_weight` is given.
+    """
+    node_count = graph.node_count
+    res = coalesce(graph.adj_coo, node_count, edge_weight, reduce, self_loop, fill_value, sort_by, return_perm=True)
+    adj_coo, perm = res[0], res[-1]
+    edge_ids = perm if graph.edge_ids is None else np.where(perm >= 0, graph.edge_ids[perm], -1)
+
+    new_graph = MindHomoGraph()
+    new_graph.set_topo_coo(adj_coo, node_dict=graph.node_map, edge_ids=edge_ids)
+    new_graph.node_count = node_count
+    new_graph.edge_count = adj_coo.shape[1]
+    if graph.is_batched:
+        batch_meta = graph.batch_meta
+        # graphs own disjoint, increasing node ranges, so sorted edges stay grouped by graph
+        graph_idx = batch_meta.node_map_idx[adj_coo[1] if sort_by == "dst" else adj_coo[0]]
+        graph_edges = np.zeros([batch_meta.graph_count + 1], dtype=batch_meta.graph_edges.dtype)
+        np.cumsum(np.bincount(graph_idx, minlength=batch_meta.graph_count), out=graph_edges[1:])
+        new_graph.batch_meta = BatchMeta(batch_meta.graph_nodes, graph_edges)
+    if edge_weight is not None:
+        return new_graph, res[1]
+    return new_graph
@@ -0,0 +1,353 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Homo graph with incremental edge updates."""
+import threading
+import numpy as np
+from .graph import MindHomoGraph, CsrAdj, get_index_dtype, _decompressed, _stable_argsort
+
+_ADD = 0
+_REMOVE = 1
+
+
+def _pad_indptr(indptr: np.ndarray, node_count: int) -> np.ndarray:
+    """extend indptr with empty rows up to node_count"""
+    if indptr.shape[0] == node_count + 1:
+        return indptr
+    return np.concatenate([indptr, np.full([node_count + 1 - indptr.shape[0]], indptr[-1], dtype=indptr.dtype)])
+
+
+def _merge_csr(base: CsrAdj, base_ids: np.ndarray, delta: CsrAdj, delta_ids: np.ndarray):
+    """merge two csr with the same rows, edges of `base` come first in each row"""
+    node_count = delta.indptr.shape[0] - 1
+    base_deg = np.diff(base.indptr)
+    delta_deg = np.diff(delta.indptr)
+    edge_count = int(base.indptr[-1]) + int(delta.indptr[-1])
+    index_dtype = get_index_dtype(node_count, edge_count)
+    indptr = np.zeros([node_count + 1], dtype=index_dtype)
+    np.cumsum(base_deg + delta_deg, out=indptr[1:])
+    base_pos = np.arange(base_deg.sum(), dtype=np.int64) + np.repeat(indptr[:-1] - base.indptr[:-1], base_deg)
+    delta_pos = np.arange(delta_deg.sum(), dtype=np.int64) + \
+        np.repeat(indptr[:-1] + base_deg - delta.indptr[:-1], delta_deg)
+    indices = np.empty([edge_count], dtype=index_dtype)
+    indices[base_pos] = base.indices
+    indices[delta_pos] = delta.indices
+    edge_ids = np.empty([edge_count], dtype=np.int64)
+    edge_ids[base_pos] = base_ids
+    edge_ids[delta_pos] = delta_ids
+    return CsrAdj(indptr=indptr, indices=indices), edge_ids
+
+
+class DynamicHomoGraph:
+    """
+    Homo graph with incremental edge updates. Updates are appended to a log on top of an immutable base csr,
+    so an update costs O(delta) instead of rebuilding the whole csr. Added edges are kept as a delta coo sorted by
+    source node and removed edges as sorted tombstone keys, both derived lazily from the log. Queries and samplers
+    see the merged view, and :func:`DynamicHomoGraph.compact` folds the log into a new base csr.
+
+    Node ids are the local ids of the base graph, adding an edge to node `node_count` or larger adds new nodes.
+    Removing an edge removes all of its copies added before. New edges get increasing edge ids after the ones
+    of the base graph.
+
+    Args:
+        graph(MindHomoGraph): base graph with identity node id mapping.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.graph import MindHomoGraph
+        >>> from mindspore_gl.graph.dynamic import DynamicHomoGraph
+        >>> graph = MindHomoGraph()
+        >>> graph.set_topo_coo(np.array([[0, 0, 1], [1, 2, 2]]))
+        >>> dynamic_graph = DynamicHomoGraph(graph)
+        >>> dynamic_graph.add_edges(np.array([1, 3]), np.array([0, 0]))
+        >>> dynamic_graph.remove_edges(np.array([0]), np.array([2]))
+        >>> print(dynamic_graph.neighbors(0), dynamic_graph.neighbors(1), dynamic_graph.node_count)
+        [1] [2 0] 4
+    """
+
+    def __init__(self, graph: MindHomoGraph):
+        assert graph.node_map.is_identity, "base graph should use identity node id mapping"
+        self._base = graph
+        self._node_count = graph.node_count
+        edge_ids = graph.edge_ids
+        self._next_edge_id = graph.edge_count if edge_ids is None or edge_ids.shape[0] == 0 else \
+            max(int(edge_ids.max()) + 1, graph.edge_count)
+        self._log = []
+        self._lock = threading.Lock()
+        self._compact_thread: threading.Thread = None
+
+        #######################
+        # For Lazy Computation
+        #######################
+        self._delta = None
+        self._merged = None
+
+    ############################################
+    # Updates
+    ############################################
+    def add_edges(self, src: np.ndarray, dst: np.ndarray, edge_ids: np.ndarray = None) -> np.ndarray:
+        """
+        Add edges, nodes with id not smaller than node count are added as well.
+
+        Args:
+            src(numpy.ndarray): source node of each edge.
+            dst(numpy.ndarray): destination node of each edge.
+            edge_ids(numpy.ndarray): ids of the new edges, by default increasing ids after the existing ones.
+
+        Returns:
+            numpy.ndarray, ids of the new edges.
+        """
+        src, dst = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+        assert src.shape == dst.shape, "src and dst should have the same shape"
+        with self._lock:
+            if edge_ids is None:
+                edge_ids = np.arange(self._next_edge_id, self._next_edge_id + src.shape[0], dtype=np.int64)
+            edge_ids = np.asarray(edge_ids, dtype=np.int64)
+            if edge_ids.shape[0] > 0:
+                self._next_edge_id = max(self._next_edge_id, int(edge_ids.max()) + 1)
+                self._node_count = max(self._node_count, int(src.max()) + 1, int(dst.max()) + 1)
+            self._log.append((_ADD, src, dst, edge_ids))
+            self._delta = None
+            self._merged = None
+        return edge_ids
+
+    def remove_edges(self, src: np.ndarray, dst: np.ndarray):
+        """
+        Remove all existing copies of edges, removing an edge not in the graph has no effect.
+
+        Args:
+            src(numpy.ndarray): source node of each edge.
+            dst(numpy.ndarray): destination node of each edge.
+        """
+        src, dst = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+        assert src.shape == dst.shape, "src and dst should have the same shape"
+        with self._lock:
+            # edges with a node outside the graph do not exist, and their keys would collide with real edges
+            valid = (src >= 0) & (src < self._node_count) & (dst >= 0) & (dst < self._node_count)
+            if not np.all(valid):
+                src, dst = src[valid], dst[valid]
+            self._log.append((_REMOVE, src, dst, None))
+            self._delta = None
+            self._merged = None
+
+    def compact(self, background=False):
+        """
+        Fold logged updates into a new base csr. Updates made while compacting in background stay in the log
+        and are applied on top of the new base.
+
+        Args:
+            background(bool): if True, build the new base csr in a background thread.
+
+        Returns:
+            threading.Thread, the compacting thread if `background` is True, else None.
+        """
+        self.wait_compact()
+        if not background:
+            self._compact()
+            return None
+        self._compact_thread = threading.Thread(target=self._compact, daemon=True)
+        self._compact_thread.start()
+        return self._compact_thread
+
+    def wait_compact(self):
+        """wait for background compaction to finish"""
+        if self._compact_thread is not None:
+            self._compact_thread.join()
+            self._compact_thread = None
+
+    ##########################################
+    # Query With Lazy Computation
+    ##########################################
+    @property
+    def node_count(self):
+        """node count of the merged graph"""
+        return self._node_count
+
+    @property
+    def edge_count(self):
+        """edge count of the merged graph"""
+        return int(self.adj_csr.indptr[-1])
+
+    @property
+    def log_size(self):
+        """edge count of logged updates not compacted yet"""
+        return sum(entry[1].shape[0] for entry in self._log)
+
+    @property
+    def adj_csr(self) -> CsrAdj:
+        """csr of the merged graph, rebuilt in O(edge_count) on first query after updates"""
+        return self._merged_view()[0]
+
+    @property
+    def edge_ids(self) -> np.ndarray:
+        """edge id of each edge in :attr:`adj_csr`"""
+        return self._merged_view()[1]
+
+    def neighbors(self, node):
+        """
+        Neighbors of node in the merged view, costs O(degree) without rebuilding the merged csr.
+
+        Args:
+            node(int): node id.
+
+        Returns:
+            numpy.ndarray, neighbor node ids, base edges first.
+        """
+        base, delta, _, tombstones, node_count = self._state()
+        neighbors = []
+        if node < base.node_count:
+            base_csr = _decompressed(base.adj_csr)
+            row = base_csr.indices[base_csr.indptr[node]: base_csr.indptr[node + 1]]
+            if tombstones.shape[0] > 0:
+                row = row[~_contains(tombstones, _edge_keys(node, row, node_count))]
+            neighbors.append(row)
+        start, end = np.searchsorted(delta[0], [node, node + 1])
+        neighbors.append(delta[1, start: end])
+        return np.concatenate(neighbors)
+
+    def degree(self, node):
+        """out degree of node in the merged view"""
+        return self.neighbors(node).shape[0]
+
+    def to_graph(self) -> MindHomoGraph:
+        """
+        Snapshot of the merged view as a MindHomoGraph.
+
+        Returns:
+            MindHomoGraph, graph in csr format with edge ids.
+        """
+        adj_csr, edge_ids = self._merged_view()
+        graph = MindHomoGraph()
+        graph.set_topo(adj_csr, edge_ids=edge_ids)
+        graph.node_count = self._node_count
+        return graph
+
+    ############################
+    # Inner Function
+    ############################
+    def _state(self):
+        """base graph, delta coo, delta edge ids, sorted tombstone keys and node count of the current log"""
+        with self._lock:
+            base, log, delta, node_count = self._base, list(self._log), self._delta, self._node_count
+        if delta is None:
+            delta = self._derive(log, node_count)
+            with self._lock:
+                if self._base is base and len(self._log) == len(log):
+                    self._delta = delta
+        return (base,) + delta
+
+    @staticmethod
+    def _derive(log, node_count):
+        """
+        Replay log: an added edge is alive if no removal of it comes later, base edges are removed by
+        any removal.
+        """
+        add_src, add_dst, add_ids, add_seq, remove_keys, remove_seq = [], [], [], [], [], []
+        for seq, (op, src, dst, edge_ids) in enumerate(log):
+            if op == _ADD:
+                add_src.append(src)
+                add_dst.append(dst)
+                add_ids.append(edge_ids)
+                add_seq.append(np.full(src.shape, seq, dtype=np.int64))
+            else:
+                remove_keys.append(_edge_keys(src, dst, node_count))
+                remove_seq.append(np.full(src.shape, seq, dtype=np.int64))
+        empty = np.zeros([0], dtype=np.int64)
+        add_src = np.concatenate(add_src) if add_src else empty
+        add_dst = np.concatenate(add_dst) if add_dst else empty
+        add_ids = np.concatenate(add_ids) if add_ids else empty
+        add_seq = np.concatenate(add_seq) if add_seq else empty
+        remove_keys = np.concatenate(remove_keys) if remove_keys else empty
+        remove_seq = np.concatenate(remove_seq) if remove_seq else empty
+
+        # last removal of each key
+        order = np.lexsort((remove_seq, remove_keys))
+        remove_keys, remove_seq = remove_keys[order], remove_seq[order]
+        last = np.concatenate([remove_keys[1:] != remove_keys[:-1], [True]]) if remove_keys.shape[0] > 0 \
+            else remove_keys.astype(bool)
+        tombstones, last_seq = remove_keys[last], remove_seq[last]
+        if tombstones.shape[0] > 0:
+            add_keys = _edge_keys(add_src, add_dst, node_count)
+            pos = np.minimum(np.searchsorted(tombstones, add_keys), tombstones.shape[0] - 1)
+            alive = (tombstones[pos] != add_keys) | (last_seq[pos] < add_seq)
+            add_src, add_dst, add_ids = add_src[alive], add_dst[alive], add_ids[alive]
+
+        order = _stable_argsort(add_src, node_count)
+        return np.stack([add_src[order], add_dst[order]]), add_ids[order], tombstones, node_count
+
+    def _merged_view(self):
+        merged = self._merged
+        if merged is not None:
+            return merged
+        with self._lock:
+            version = len(self._log)
+        state = self._state()
+        base = state[0]
+        merged = self._merge(*state)
+        with self._lock:
+            if self._base is base and len(self._log) == version:
+                self._merged = merged
+        return merged
+
+    @staticmethod
+    def _merge(base, delta, delta_ids, tombstones, node_count):
+        base_csr = _decompressed(base.adj_csr)
+        base_ids = base.edge_ids if base.edge_ids is not None else \
+            np.arange(base_csr.indices.shape[0], dtype=np.int64)
+        base_csr = CsrAdj(_pad_indptr(base_csr.indptr, node_count), base_csr.indices)
+        if tombstones.shape[0] > 0:
+            rows = np.repeat(np.arange(base_csr.indptr.shape[0] - 1, dtype=np.int64), np.diff(base_csr.indptr))
+            kept = ~_contains(tombstones, _edge_keys(rows, base_csr.indices, node_count))
+            kept_count = np.zeros([kept.shape[0] + 1], dtype=np.int64)
+            np.cumsum(kept, out=kept_count[1:])
+            base_csr = CsrAdj(kept_count[base_csr.indptr], base_csr.indices[kept])
+            base_ids = base_ids[kept]
+        delta_csr = CsrAdj(np.searchsorted(delta[0], np.arange(node_count + 1)), delta[1])
+        return _merge_csr(base_csr, base_ids, delta_csr, delta_ids)
+
+    def _compact(self):
+        with self._lock:
+            base, log, node_count = self._base, list(self._log), self._node_count
+        adj_csr, edge_ids = self._merge(base, *self._derive(log, node_count))
+        new_base = MindHomoGraph()
+        new_base.set_topo(adj_csr, edge_ids=edge_ids)
+        new_base.node_count = node_count
+        with self._lock:
+            # updates logged while compacting are kept and replayed on the new base
+            self._log = self._log[len(log):]
+            self._base = new_base
+            self._delta = None
+            self._merged = None
+
+    def __getstate__(self):
+        # only the base graph and the log are pickled, a base graph loaded from store is sent as its path
+        self.wait_compact()
+        state = self.__dict__.copy()
+        state.update(_lock=None, _compact_thread=None, _delta=None, _merged=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def _edge_keys(src, dst, node_count):
+    """key of each (src, dst) edge, ordered by src first"""
+    return np.asarray(src, dtype=np.int64) * max(node_count, 1) + dst
+
+
+def _contains(sorted_keys: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """if each key is in non-empty sorted_keys"""
+    pos = np.minimum(np.searchsorted(sorted_keys, keys), sorted_keys.shape[0] - 1)
+    return sorted_keys[pos] == keys
@@ -13,28 +13,344 @@
 # limitations under the License.
 # ============================================================================
 """Claesses for Graph data structure"""
-from typing import Dict
+from typing import Dict, List
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-import mindspore_gl.sample_kernel as kernel
+from .node_map import NodeIdMap
+from .store import GraphStore, save_graph_store
+from .stats import GraphStats
+from .. import sample_kernel
 
-CsrAdj = namedtuple("csr_adj", ['indptr', 'indices'])
+CsrAdj = namedtuple("CsrAdj", ['indptr', 'indices'])
+CscAdj = namedtuple("CscAdj", ['indptr', 'indices'])
+# edge weights in csr order accumulated row by row, and count of positive weight edges of each row
+CsrWeight = namedtuple("CsrWeight", ['cum_weight', 'positive_degree'])
 
 
-def coo_to_csr():
-    raise NotImplementedError()
+def get_index_dtype(*counts):
+    """
+    Choose index data type for the given element counts, int32 is used when all counts fit in it.
+
+    Args:
+        counts(int): element counts to be indexed, e.g. node count and edge count.
+
+    Returns:
+        numpy.dtype, np.int32 or np.int64.
+    """
+    if max(counts, default=0) < np.iinfo(np.int32).max:
+        return np.int32
+    return np.int64
+
+
+def _count_nodes(nodes: np.ndarray, node_count: int, chunk_size=None, num_workers=1):
+    """count occurrence of each node id, chunk by chunk if chunk_size is given"""
+    if chunk_size is None or nodes.shape[0] <= chunk_size:
+        return np.bincount(nodes, minlength=node_count)
+    chunks = [nodes[start: start + chunk_size] for start in range(0, nodes.shape[0], chunk_size)]
+    if num_workers > 1:
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            partial_counts = list(executor.map(lambda chunk: np.bincount(chunk, minlength=node_count), chunks))
+        return np.sum(partial_counts, axis=0)
+    counts = np.zeros([node_count], dtype=np.int64)
+    for chunk in chunks:
+        counts += np.bincount(chunk, minlength=node_count)
+    return counts
+
+
+def _stable_argsort(keys: np.ndarray, key_bound: int):
+    """stable argsort of non-negative integer keys smaller than key_bound"""
+    length = keys.shape[0]
+    shift = max(length - 1, 1).bit_length()
+    if max(key_bound, 1).bit_length() + shift > 63:
+        return np.argsort(keys, kind='stable')
+    # pack (key, position) into a single int64 so that an unstable sort is enough
+    packed = (keys.astype(np.int64) << shift) | np.arange(length, dtype=np.int64)
+    packed.sort()
+    packed &= (1 << shift) - 1
+    return packed
+
+
+def coo_to_csr(adj_coo: np.ndarray, node_count=None, return_perm=False, chunk_size=None, num_workers=1):
+    """
+    Convert coo format adjacent matrix to csr format by counting sort on source nodes.
+
+    Args:
+        adj_coo(numpy.ndarray): coo format adjacent matrix with shape [2, edge_count].
+        node_count(int): node count of the graph, inferred from the max node id if not given.
+        return_perm(bool): if True, also return the coo edge position for each csr edge.
+        chunk_size(int): count node degrees chunk by chunk to bound temporary memory.
+        num_workers(int): thread count for chunked degree counting.
+
+    Returns:
+        - **adj_csr** (CsrAdj) - csr format adjacent matrix.
+        - **perm** (numpy.ndarray) - coo edge position for each csr edge, only returned if `return_perm` is True.
+    """
+    row, col = adj_coo[0], adj_coo[1]
+    edge_count = row.shape[0]
+    if node_count is None:
+        node_count = int(adj_coo.max()) + 1 if edge_count > 0 else 0
+    edge_dtype = get_index_dtype(edge_count)
+    node_dtype = get_index_dtype(node_count)
+
+    indptr = np.zeros([node_count + 1], dtype=edge_dtype)
+    np.cumsum(_count_nodes(row, node_count, chunk_size, num_workers), out=indptr[1:])
+
+    if edge_count == 0 or np.all(row[1:] >= row[:-1]):
+        # already sorted by source node, no need to move edges
+        perm = np.arange(edge_count, dtype=edge_dtype) if return_perm else None
+        indices = col.astype(node_dtype, copy=False)
+    else:
+        perm = _stable_argsort(row, node_count).astype(edge_dtype, copy=False)
+        indices = col[perm].astype(node_dtype, copy=False)
+    adj_csr = CsrAdj(indptr=indptr, indices=indices)
+    if return_perm:
+        return adj_csr, perm
+    return adj_csr
 
 
 def csr_to_coo(csr: CsrAdj):
-    coo_adj = [[], []]
-    j = 0
-    for i in range(len(csr.indptr) - 1):
-        while j < csr.indptr[i + 1]:
-            coo_adj[0].append(i)
-            coo_adj[1].append(csr.indices[j])
-            j += 1
-    return coo_adj
+    """
+    Convert csr format adjacent matrix to coo format.
+
+    Args:
+        csr(CsrAdj): csr format adjacent matrix.
+
+    Returns:
+        numpy.ndarray, coo format adjacent matrix with shape [2, edge_count].
+    """
+    csr = _decompressed(csr)
+    node_count = csr.indptr.shape[0] - 1
+    row = np.repeat(np.arange(node_count, dtype=csr.indices.dtype), np.diff(csr.indptr))
+    return np.stack([row, csr.indices])
+
+
+def csr_to_csc(csr: CsrAdj, node_count=None, return_perm=False):
+    """
+    Convert csr format adjacent matrix to csc format, i.e. the csr format of the reversed graph.
+
+    Args:
+        csr(CsrAdj): csr format adjacent matrix.
+        node_count(int): destination node count, equals to source node count if not given.
+        return_perm(bool): if True, also return the csr edge position for each csc edge.
+
+    Returns:
+        - **adj_csc** (CscAdj) - csc format adjacent matrix.
+        - **perm** (numpy.ndarray) - csr edge position for each csc edge, only returned if `return_perm` is True.
+    """
+    if node_count is None:
+        node_count = csr.indptr.shape[0] - 1
+    adj_coo = csr_to_coo(csr)
+    res = coo_to_csr(adj_coo[::-1], node_count, return_perm=return_perm)
+    if return_perm:
+        return CscAdj(*res[0]), res[1]
+    return CscAdj(*res)
+
+
+def _as_node_map(node_dict):
+    """node_dict can be given as NodeIdMap, global->local dict or None for identity mapping"""
+    if node_dict is None or isinstance(node_dict, NodeIdMap):
+        return node_dict
+    return NodeIdMap.from_dict(node_dict)
+
+
+def gather_csr_rows(adj, rows: np.ndarray, return_positions=False):
+    """
+    Gather rows of a csr(or csc) adjacent matrix into a compact csr without python loop.
+
+    Args:
+        adj(Union[CsrAdj, CscAdj]): adjacent matrix to gather from.
+        rows(numpy.ndarray): row ids to gather.
+        return_positions(bool): if True, also return the position in `adj.indices` of each gathered element.
+
+    Returns:
+        - **indptr** (numpy.ndarray) - indptr of gathered rows, with length len(rows) + 1.
+        - **indices** (numpy.ndarray) - concatenated column ids of gathered rows.
+        - **positions** (numpy.ndarray) - position in `adj.indices`, only returned if `return_positions` is True.
+    """
+    rows = np.asarray(rows)
+    if isinstance(adj, CompressedCsrAdj):
+        return adj.gather_rows(rows, return_positions)
+    starts = adj.indptr[rows]
+    lengths = adj.indptr[rows + 1] - starts
+    indptr = np.zeros([rows.shape[0] + 1], dtype=adj.indptr.dtype)
+    np.cumsum(lengths, out=indptr[1:])
+    positions = np.arange(indptr[-1], dtype=adj.indptr.dtype) + np.repeat(starts - indptr[:-1], lengths)
+    indices = adj.indices[positions]
+    if return_positions:
+        return indptr, indices, positions
+    return indptr, indices
+
+
+def _varint_decode(data: np.ndarray) -> np.ndarray:
+    """decode concatenated little endian base-128 varints"""
+    last_byte = data < 0x80
+    value_starts = np.flatnonzero(np.concatenate([[True], last_byte[:-1]]))
+    if value_starts.shape[0] == 0 or data.shape[0] == 0:
+        return np.zeros([0], dtype=np.int64)
+    value_lengths = np.diff(np.append(value_starts, data.shape[0]))
+    shifts = 7 * (np.arange(data.shape[0]) - np.repeat(value_starts, value_lengths))
+    parts = (data & 0x7f).astype(np.int64) << shifts
+    return np.bitwise_or.reduceat(parts, value_starts)
+
+
+class CompressedCsrAdj(namedtuple("compressed_csr_adj", ['indptr', 'block_indptr', 'block_offsets', 'data',
+                                                         'block_size', 'col_count'])):
+    """
+    Compressed csr adjacent matrix. Neighbor list of each row is sorted and split into blocks of `block_size`
+    neighbors, each block keeps its first neighbor id and gaps to the previous neighbors as varints. Sorted
+    neighbor lists of real graphs have small gaps, which take 1 or 2 bytes instead of 4 or 8. Any neighbor can
+    be decoded from the start of its block, so random access costs at most `block_size` varint decodes.
+
+    Edge positions of compressed csr follow the sorted neighbor order, see `return_perm` of
+    :func:`CompressedCsrAdj.from_csr`.
+
+    Args:
+        indptr(numpy.ndarray): neighbors of row `i` are the `indptr[i]`-th to `indptr[i + 1]`-th edges.
+        block_indptr(numpy.ndarray): blocks of row `i` are `block_indptr[i]` to `block_indptr[i + 1]`.
+        block_offsets(numpy.ndarray): byte offset of each block in `data`, with total byte count at the end.
+        data(numpy.ndarray): encoded neighbors, uint8.
+        block_size(int): neighbor count of each block except the last block of a row.
+        col_count(int): column count, i.e. destination node count.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_csr(cls, adj_csr: CsrAdj, col_count=None, block_size=64, return_perm=False):
+        """
+        Compress csr adjacent matrix.
+
+        Args:
+            adj_csr(CsrAdj): csr adjacent matrix.
+            col_count(int): column count, inferred from the max column id if not given.
+            block_size(int): neighbor count of each block, larger blocks compress better but decode slower.
+            return_perm(bool): if True, also return the `adj_csr` edge position of each compressed edge.
+
+        Returns:
+            - **adj** (CompressedCsrAdj) - compressed csr.
+            - **perm** (numpy.ndarray) - `adj_csr` edge position of each compressed edge, only returned
+              if `return_perm` is True.
+        """
+        indptr = adj_csr.indptr.astype(np.int64)
+        indices = adj_csr.indices.astype(np.int64)
+        edge_count = indices.shape[0]
+        if col_count is None:
+            col_count = int(indices.max()) + 1 if edge_count > 0 else 0
+        degrees = np.diff(indptr)
+        row = np.repeat(np.arange(degrees.shape[0], dtype=np.int64), degrees)
+        # rows are already sorted, sort (row, col) keys to sort neighbors inside each row
+        keys = row * max(col_count, 1) + indices
+        perm = np.argsort(keys, kind='stable') if return_perm else None
+        indices = indices[perm] if return_perm else np.sort(keys) - row * max(col_count, 1)
+        del keys
+
+        pos_in_row = np.arange(edge_count, dtype=np.int64) - np.repeat(indptr[:-1], degrees)
+        block_start = pos_in_row % block_size == 0
+        gaps = np.diff(indices, prepend=0)
+        gaps[block_start] = indices[block_start]
+        byte_counts = np.ones([edge_count], dtype=np.int64)
+        for shift in range(7, 64, 7):
+            byte_counts += gaps >= (1 << shift)
+        byte_offsets = np.zeros([edge_count + 1], dtype=np.int64)
+        np.cumsum(byte_counts, out=byte_offsets[1:])
+        data = np.empty([byte_offsets[-1]], dtype=np.uint8)
+        for byte_idx in range(int(byte_counts.max()) if edge_count > 0 else 0):
+            selected = np.flatnonzero(byte_counts > byte_idx)
+            data[byte_offsets[selected] + byte_idx] = ((gaps[selected] >> (7 * byte_idx)) & 0x7f) | \
+                np.where(byte_counts[selected] > byte_idx + 1, 0x80, 0)
+
+        block_offsets = np.append(byte_offsets[:-1][block_start], byte_offsets[-1])
+        block_indptr = np.zeros([degrees.shape[0] + 1], dtype=np.int64)
+        np.cumsum((degrees + block_size - 1) // block_size, out=block_indptr[1:])
+        adj = cls(indptr, block_indptr, block_offsets, data, block_size, col_count)
+        if return_perm:
+            return adj, perm
+        return adj
+
+    @property
+    def row_count(self):
+        return self.indptr.shape[0] - 1
+
+    @property
+    def edge_count(self):
+        return int(self.indptr[-1])
+
+    @property
+    def nbytes(self):
+        """memory size of compressed csr"""
+        return self.indptr.nbytes + self.block_indptr.nbytes + self.block_offsets.nbytes + self.data.nbytes
+
+    def gather_rows(self, rows: np.ndarray, return_positions=False):
+        """
+        Decode rows into a compact csr.
+
+        Args:
+            rows(numpy.ndarray): row ids to decode.
+            return_positions(bool): if True, also return the compressed edge position of each neighbor.
+
+        Returns:
+            - **indptr** (numpy.ndarray) - indptr of decoded rows, with length len(rows) + 1.
+            - **indices** (numpy.ndarray) - concatenated column ids of decoded rows.
+            - **positions** (numpy.ndarray) - compressed edge position, only returned if `return_positions` is True.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        byte_starts = self.block_offsets[self.block_indptr[rows]]
+        byte_lengths = self.block_offsets[self.block_indptr[rows + 1]] - byte_starts
+        byte_indptr = np.zeros([rows.shape[0] + 1], dtype=np.int64)
+        np.cumsum(byte_lengths, out=byte_indptr[1:])
+        byte_positions = np.arange(byte_indptr[-1], dtype=np.int64) + np.repeat(byte_starts - byte_indptr[:-1],
+                                                                                 byte_lengths)
+        gaps = _varint_decode(self.data[byte_positions])
+
+        starts = self.indptr[rows]
+        lengths = self.indptr[rows + 1] - starts
+        indptr = np.zeros([rows.shape[0] + 1], dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        pos_in_row = np.arange(indptr[-1], dtype=np.int64) - np.repeat(indptr[:-1], lengths)
+        # prefix sum of gaps restarted at each block
+        block_start = np.where(pos_in_row % self.block_size == 0, np.arange(indptr[-1]), 0)
+        np.maximum.accumulate(block_start, out=block_start)
+        prefix = np.cumsum(gaps)
+        indices = prefix - prefix[block_start] + gaps[block_start]
+        if return_positions:
+            return indptr, indices, pos_in_row + np.repeat(starts, lengths)
+        return indptr, indices
+
+    def row(self, row_id):
+        """decode neighbors of a row"""
+        return self.gather_rows(np.array([row_id]))[1]
+
+    def to_csr(self) -> CsrAdj:
+        """
+        Decode into csr adjacent matrix with sorted neighbor lists.
+
+        Returns:
+            CsrAdj, the decoded csr.
+        """
+        _, indices = self.gather_rows(np.arange(self.row_count))
+        return CsrAdj(indptr=self.indptr.astype(get_index_dtype(self.edge_count), copy=False),
+                      indices=indices.astype(get_index_dtype(self.col_count)))
+
+
+def node_index_dtype(adj):
+    """
+    Node index data type of a csr adjacent matrix, samplers return node ids in this type.
+
+    Args:
+        adj(Union[CsrAdj, CscAdj, CompressedCsrAdj]): adjacent matrix.
+
+    Returns:
+        numpy.dtype, np.int32 or np.int64.
+    """
+    if isinstance(adj, CompressedCsrAdj):
+        return get_index_dtype(adj.col_count)
+    return adj.indices.dtype
+
+
+def _decompressed(adj):
+    """plain csr of a possibly compressed csr"""
+    return adj.to_csr() if isinstance(adj, CompressedCsrAdj) else adj
 
 
 class MindRelationGraph:
@@ -57,30 +373,35 @@ class MindRelationGraph:
         # dataloader
         self._adj_csr = None
         self._adj_coo = None
-        self._reverse_adj_csr = None
-        self._node_dict = None
-        self._node_ids = None
+        self._adj_csc = None
+        self._dst_node_num = None
+        self._node_map: NodeIdMap = None
         self._edge_ids = None
 
     ################################
     # Initialize Graph
     ################################
 
-    def set_topo(self, adj_csr: CsrAdj, node_dict=None, edge_ids: np.ndarray = None):
+    def set_topo(self, adj_csr: CsrAdj, node_dict=None, edge_ids: np.ndarray = None, dst_node_num=None,
+                 adj_csc: CscAdj = None):
         """
         set topology for relation graph by either csr_adj.
 
         Args:
-            adj_csr(csr_adj): csr format description of adjacent matrix.
+            adj_csr(Union[CsrAdj, CompressedCsrAdj]): csr format description of adjacent matrix.
             edge_ids(numpy.ndarray): edge ids for each edge.
-            node_dict(Dict): global->local node id.
+            node_dict(Union[NodeIdMap, Dict]): global<->local node id mapping, identity if None.
+            dst_node_num(int): destination node count, used to build reverse csr. If None, it is inferred
+                from source node count and max destination node id.
+            adj_csc(CscAdj): precomputed reverse csr, built lazily from `adj_csr` if None.
         """
         self._adj_csr = adj_csr
-        self._node_dict = node_dict
-        self._node_ids = None if node_dict is None else np.array(list(node_dict.keys()))
+        self._adj_coo = None
+        self._adj_csc = adj_csc
+        self._dst_node_num = dst_node_num
+        self._node_map = _as_node_map(node_dict)
         self._edge_ids = edge_ids
 
-
     #####################################
     # Query Graph, With Lazy Computation
     #####################################
@@ -95,59 +416,151 @@ class MindRelationGraph:
             bool, indicate if node is in this graph
 
         """
-        return node < self._adj_csr.indptr.shape[0] \
-               if self._node_dict is None else self._node_dict.get(node) is not None
+        return 0 <= node < self.node_num if self._node_map is None else node in self._node_map
 
     def successors(self, src_node):
-        mapped_idx = self._node_dict.get(src_node, None)
-        assert mapped_idx is not None
-        neighbor_start = self._adj_csr.indptr[mapped_idx]
-        neighbor_end = self._adj_csr.indptr[mapped_idx + 1]
-        neighbors = self._adj_csr.indices[neighbor_start: neighbor_end]
-        node_ids = neighbors if self._node_ids is None else self._node_ids[neighbors]
-        return node_ids
+        """
+        Successors of a node.
+
+        Args:
+            src_node(int): global node id.
+
+        Returns:
+            numpy.ndarray, global ids of successors.
+        """
+        return self._row(self._adj_csr, src_node)
 
     def predecessors(self, dst_node):
-        pass
+        """
+        Predecessors of a node, queried on the lazily built reverse csr.
+
+        Args:
+            dst_node(int): global node id.
+
+        Returns:
+            numpy.ndarray, global ids of predecessors.
+        """
+        return self._row(self.adj_csc, dst_node)
+
+    def successors_batch(self, src_nodes):
+        """
+        Successors of a batch of nodes.
+
+        Args:
+            src_nodes(numpy.ndarray): global node ids.
+
+        Returns:
+            - **indptr** (numpy.ndarray) - successors of src_nodes[i] are indices[indptr[i]: indptr[i + 1]].
+            - **indices** (numpy.ndarray) - global ids of successors.
+        """
+        return self._rows(self._adj_csr, src_nodes)
+
+    def predecessors_batch(self, dst_nodes):
+        """
+        Predecessors of a batch of nodes.
+
+        Args:
+            dst_nodes(numpy.ndarray): global node ids.
+
+        Returns:
+            - **indptr** (numpy.ndarray) - predecessors of dst_nodes[i] are indices[indptr[i]: indptr[i + 1]].
+            - **indices** (numpy.ndarray) - global ids of predecessors.
+        """
+        return self._rows(self.adj_csc, dst_nodes)
 
     def out_degree(self, src_node):
-        mapped_idx = src_node if self._node_dict is None else self._node_dict.get(src_node, None)
-        assert mapped_idx is not None
-        neighbor_start = self._adj_csr.indptr[mapped_idx]
-        neighbor_end = self._adj_csr.indptr[mapped_idx + 1]
-        return neighbor_end - neighbor_start
+        mapped_idx = self._map_node(src_node)
+        return self._adj_csr.indptr[mapped_idx + 1] - self._adj_csr.indptr[mapped_idx]
 
-    def out_degrees(self, src_nodes):
-        pass
+    def out_degrees(self, src_nodes=None):
+        """
+        Out degrees of a batch of nodes.
+
+        Args:
+            src_nodes(numpy.ndarray): global node ids, all nodes if None.
+
+        Returns:
+            numpy.ndarray, out degree of each node.
+        """
+        return self._degrees(self._adj_csr, src_nodes)
 
     def in_degree(self, dst_node):
-        pass
+        mapped_idx = self._map_node(dst_node)
+        return self.adj_csc.indptr[mapped_idx + 1] - self.adj_csc.indptr[mapped_idx]
 
-    def in_degrees(self, dst_nodes):
-        pass
+    def in_degrees(self, dst_nodes=None):
+        """
+        In degrees of a batch of nodes.
+
+        Args:
+            dst_nodes(numpy.ndarray): global node ids, all nodes if None.
+
+        Returns:
+            numpy.ndarray, in degree of each node.
+        """
+        return self._degrees(self.adj_csc, dst_nodes)
 
     def format(self, out_format):
-        pass
+        """
+        Get adjacent matrix of this relation graph in certain format.
 
+        Args:
+            out_format(str): one of 'csr', 'coo' and 'csc'.
+
+        Returns:
+            Union[CsrAdj, numpy.ndarray, CscAdj], adjacent matrix in `out_format`.
+
+        Raises:
+            ValueError: if `out_format` is not supported.
+        """
+        if out_format == 'csr':
+            return self.adj_csr
+        if out_format == 'coo':
+            return self.adj_coo
+        if out_format == 'csc':
+            return self.adj_csc
+        raise ValueError(f"Unsupported format {out_format}, expect one of 'csr', 'coo' and 'csc'.")
 
     #########################
     # properties
     #########################
     @property
     def node_num(self):
-        return self._adj_csr.indptr.shape[0]
+        return self._adj_csr.indptr.shape[0] - 1
+
+    @property
+    def dst_node_num(self):
+        """destination node count of this relation"""
+        if self._dst_node_num is None and isinstance(self._adj_csr, CompressedCsrAdj):
+            self._dst_node_num = self._adj_csr.col_count
+        if self._dst_node_num is None:
+            max_dst = int(self._adj_csr.indices.max()) + 1 if self.edge_num > 0 else 0
+            self._dst_node_num = max(self.node_num, max_dst)
+        return self._dst_node_num
 
     @property
     def edge_num(self):
-        return self._adj_csr.indices.shape[0]
+        return int(self._adj_csr.indptr[-1])
 
     @property
     def relation_type(self):
         return self._relation_type
 
+    @property
+    def src_node_type(self):
+        return self._u_type
+
+    @property
+    def dst_node_type(self):
+        return self._v_type
+
+    @property
+    def edge_type(self):
+        return self._e_type
+
     @property
     def nodes(self):
-        return np.arange(self.node_num) if self._node_ids is None else self._node_ids
+        return np.arange(self.node_num) if self._node_map is None else self._node_map.global_ids
 
     @property
     def edges(self):
@@ -160,6 +573,47 @@ class MindRelationGraph:
     ######################################
     # Transform Graph To Different Format
     ######################################
+    @property
+    def adj_coo(self) -> np.ndarray:
+        """coo format adjacent matrix, computed from csr lazily"""
+        if self._adj_coo is None:
+            self._adj_coo = csr_to_coo(self._adj_csr)
+        return self._adj_coo
+
+    @property
+    def adj_csc(self) -> CscAdj:
+        """csc format adjacent matrix, computed from csr lazily"""
+        if self._adj_csc is None:
+            self._adj_csc = csr_to_csc(self._adj_csr, self.dst_node_num)
+        return self._adj_csc
+
+    ############################
+    # Inner Function
+    ############################
+    def _map_node(self, node):
+        return node if self._node_map is None else self._node_map.to_local(node)
+
+    def _map_nodes(self, nodes):
+        nodes = np.asarray(nodes)
+        return nodes if self._node_map is None else self._node_map.to_local(nodes)
+
+    def _row(self, adj, node):
+        mapped_idx = self._map_node(node)
+        if isinstance(adj, CompressedCsrAdj):
+            neighbors = adj.row(mapped_idx)
+        else:
+            neighbors = adj.indices[adj.indptr[mapped_idx]: adj.indptr[mapped_idx + 1]]
+        return neighbors if self._node_map is None else self._node_map.to_global(neighbors)
+
+    def _rows(self, adj, nodes):
+        indptr, indices = gather_csr_rows(adj, self._map_nodes(nodes))
+        if self._node_map is not None:
+            indices = self._node_map.to_global(indices)
+        return indptr, indices
+
+    def _degrees(self, adj, nodes):
+        degrees = np.diff(adj.indptr)
+        return degrees if nodes is None else degrees[self._map_nodes(nodes)]
 
 
 class BatchMeta:
@@ -216,8 +670,7 @@ class BatchMeta:
         """
         if self._node_map_idx is not None:
             return self._node_map_idx
-        self._node_map_idx = np.zeros([self._graph_nodes[-1]], dtype=np.int32)
-        kernel.set_node_map_idx(self._node_map_idx, self._graph_nodes)
+        self._node_map_idx = np.repeat(np.arange(self.graph_count, dtype=np.int32), np.diff(self._graph_nodes))
         return self._node_map_idx
 
     @property
@@ -228,10 +681,46 @@ class BatchMeta:
         """
         if self._edge_map_idx is not None:
             return self._edge_map_idx
-        self._edge_map_idx = np.zeros([self._graph_edges[-1]], dtype=np.int32)
-        kernel.set_edge_map_idx(self._edge_map_idx, self._graph_edges)
+        self._edge_map_idx = np.repeat(np.arange(self.graph_count, dtype=np.int32), np.diff(self._graph_edges))
         return self._edge_map_idx
 
+    def local_adj_coo(self, adj_coo: np.ndarray) -> np.ndarray:
+        """
+        Renumber nodes of batched coo to the node ids inside each graph in one pass.
+        Edges of graph `i` are `local_adj_coo[:, graph_edges[i]: graph_edges[i + 1]]`.
+
+        Args:
+            adj_coo(numpy.ndarray): coo of the batched graph with shape [2, edge_count].
+
+        Returns:
+            numpy.ndarray, coo with graph local node ids, `adj_coo` is not modified.
+        """
+        return adj_coo - self._graph_nodes[self.edge_map_idx].astype(adj_coo.dtype, copy=False)
+
+    def split_nodes(self, array: np.ndarray) -> List[np.ndarray]:
+        """
+        Split node array of batched graph, e.g. node predictions, into views for each graph.
+
+        Args:
+            array(numpy.ndarray): array with node count as first dimension.
+
+        Returns:
+            List[numpy.ndarray], node array of each graph.
+        """
+        return np.split(array, self._graph_nodes[1:-1])
+
+    def split_edges(self, array: np.ndarray) -> List[np.ndarray]:
+        """
+        Split edge array of batched graph, e.g. edge predictions, into views for each graph.
+
+        Args:
+            array(numpy.ndarray): array with edge count as first dimension.
+
+        Returns:
+            List[numpy.ndarray], edge array of each graph.
+        """
+        return np.split(array, self._graph_edges[1:-1])
+
     def __getitem__(self, graph_idx):
         """
         return node count and edge count for idx graph
@@ -247,18 +736,104 @@ class BatchMeta:
                 self.graph_edges[graph_idx + 1] - self.graph_edges[graph_idx])
 
 
+class HeteroBatchMeta:
+    """
+    HeteroBatchMeta, meta information for a batched heterogeneous graph. Nodes of each type and edges of each
+    relation are numbered graph by graph.
+
+    Args:
+        graph_nodes(Dict[str, numpy.array]): accumulated node sum of each node type for graphs in batched
+            graph(first element is 0).
+        graph_edges(Dict[str, numpy.array]): accumulated edge sum of each relation type for graphs in batched
+            graph(first element is 0).
+    """
+    def __init__(self, graph_nodes: Dict[str, np.ndarray], graph_edges: Dict[str, np.ndarray]):
+        self._graph_nodes = graph_nodes
+        self._graph_edges = graph_edges
+
+        #######################
+        # For Lazy Computation
+        #######################
+        self._node_map_idx = {}
+        self._edge_map_idx = {}
+
+    @property
+    def graph_nodes(self) -> Dict[str, np.ndarray]:
+        """
+        Returns:
+            Dict[str, numpy.array], accumulated node sum of each node type(first element is 0)
+        """
+        return self._graph_nodes
+
+    @property
+    def graph_edges(self) -> Dict[str, np.ndarray]:
+        """
+        Returns:
+            Dict[str, numpy.array], accumulated edge sum of each relation type(first element is 0)
+        """
+        return self._graph_edges
+
+    @property
+    def graph_count(self):
+        """
+        Returns:
+            int, total graph count in this batched graph
+        """
+        return next(iter(self._graph_nodes.values())).shape[0] - 1
+
+    def node_map_idx(self, node_type):
+        """
+        Args:
+            node_type(str): node type.
+
+        Returns:
+            numpy.array, array indicate graph index for each node of `node_type`
+        """
+        if node_type not in self._node_map_idx:
+            self._node_map_idx[node_type] = np.repeat(np.arange(self.graph_count, dtype=np.int32),
+                                                      np.diff(self._graph_nodes[node_type]))
+        return self._node_map_idx[node_type]
+
+    def edge_map_idx(self, relation_type):
+        """
+        Args:
+            relation_type(str): relation type.
+
+        Returns:
+            numpy.array, array indicate graph index for each edge of `relation_type`
+        """
+        if relation_type not in self._edge_map_idx:
+            self._edge_map_idx[relation_type] = np.repeat(np.arange(self.graph_count, dtype=np.int32),
+                                                          np.diff(self._graph_edges[relation_type]))
+        return self._edge_map_idx[relation_type]
+
+    def __getitem__(self, graph_idx):
+        """
+        return node count of each node type and edge count of each relation for idx graph
+
+        Args:
+            graph_idx(int): graph idx for query
+
+        Returns:
+            (Dict[str, int], Dict[str, int]), (node_counts, edge_counts)
+        """
+        assert graph_idx < self.graph_count, "index out of range"
+        return ({key: int(value[graph_idx + 1] - value[graph_idx]) for key, value in self._graph_nodes.items()},
+                {key: int(value[graph_idx + 1] - value[graph_idx]) for key, value in self._graph_edges.items()})
+
+
 class MindHomoGraph:
     """
     in-memory homo graph, edge_type == 1
     """
     def __init__(self):
 
-        self._node_dict = None
-        self._node_ids = None
+        self._node_map: NodeIdMap = None
         self._edge_ids = None
 
         self._adj_csr: CsrAdj = None
         self._adj_coo = None
+        self._adj_csc: CscAdj = None
 
         ################
         #
@@ -271,42 +846,278 @@ class MindHomoGraph:
         ###################
         self._batch_meta = None
 
+        ###################
+        # On-disk Store
+        ###################
+        self._store: GraphStore = None
+
+        #######################
+        # For Lazy Computation
+        #######################
+        self._csr_perm = None
+        self._edge_id_map: NodeIdMap = None
+        self._stats: GraphStats = None
+        self._edge_weight = None
+        self._csr_weight: CsrWeight = None
+
     ############################################
     # initialize Graph
     ###########################################
-    def set_topo(self, adj_csr: np.ndarray, node_dict, edge_ids: np.ndarray):
+    @classmethod
+    def from_store(cls, path: str, mmap=True) -> 'MindHomoGraph':
+        """
+        Load graph from a graph store saved by :func:`MindHomoGraph.to_store`.
+        With `mmap`, topology arrays are zero-copy views of the store files and are shared through page cache
+        by all processes. Pickling such a graph, e.g. to DataLoader workers, only sends the store path.
+
+        Args:
+            path(str): directory of the graph store.
+            mmap(bool): if True, memory map the arrays, else load them into memory.
+
+        Returns:
+            MindHomoGraph, the loaded graph.
+        """
+        graph = cls()
+        graph._store = GraphStore(path, mmap)
+        graph._load_store()
+        return graph
+
+    def to_store(self, path: str, meta: Dict = None, **arrays):
+        """
+        Save graph topology in csr format and extra arrays such as node features, labels or masks into
+        a graph store directory.
+
+        Args:
+            path(str): directory of the graph store.
+            meta(Dict): extra json serializable meta information of the store.
+            arrays(numpy.ndarray): extra arrays to save, keyed by name.
+        """
+        adj_csr = self.adj_csr
+        # edge_count property raises on graphs without edges
+        store_meta = {"format": "homo_csr", "node_count": self.node_count, "edge_count": int(adj_csr.indptr[-1])}
+        if isinstance(adj_csr, CompressedCsrAdj):
+            topo_arrays = {"indptr": adj_csr.indptr, "block_indptr": adj_csr.block_indptr,
+                           "block_offsets": adj_csr.block_offsets, "compressed_indices": adj_csr.data}
+            store_meta.update(format="homo_compressed_csr", block_size=adj_csr.block_size)
+        else:
+            topo_arrays = {"indptr": adj_csr.indptr, "indices": adj_csr.indices}
+        if self._edge_ids is not None:
+            topo_arrays["edge_ids"] = self._edge_ids
+        if self._node_map is not None and not self._node_map.is_identity:
+            topo_arrays["node_ids"] = self._node_map.global_ids
+        assert not set(topo_arrays).intersection(arrays), f"array names {list(topo_arrays)} are reserved"
+        topo_arrays.update(arrays)
+        store_meta.update(meta or {})
+        save_graph_store(path, topo_arrays, store_meta)
+
+    def set_topo(self, adj_csr: np.ndarray, node_dict=None, edge_ids: np.ndarray = None):
+        """
+        set topology for homo graph by csr_adj.
+
+        Args:
+            adj_csr(Union[CsrAdj, CompressedCsrAdj]): csr format description of adjacent matrix. Samplers
+                decode compressed csr on the fly.
+            node_dict(Union[NodeIdMap, Dict]): global<->local node id mapping, identity if None.
+            edge_ids(numpy.ndarray): edge ids for each edge.
+        """
         self._adj_csr = adj_csr
-        self._node_dict = node_dict
+        self._adj_coo = None
+        self._adj_csc = None
+        self._node_map = _as_node_map(node_dict)
         self._edge_ids = edge_ids
-        self._node_ids = np.array(list(node_dict.keys()))
+        self._store = None
+        self._csr_perm = None
+        self._edge_id_map = None
+        self._stats = None
+        self._edge_weight = None
+        self._csr_weight = None
 
     def set_topo_coo(self, adj_coo, node_dict=None, edge_ids: np.ndarray = None):
         self._adj_coo = adj_coo
-        self._node_dict = node_dict
-        self._node_ids = None if node_dict is None else np.array(list(node_dict.keys()))
+        self._adj_csr = None
+        self._adj_csc = None
+        self._node_map = _as_node_map(node_dict)
         self._edge_ids = edge_ids
+        self._store = None
+        self._csr_perm = None
+        self._edge_id_map = None
+        self._stats = None
+        self._edge_weight = None
+        self._csr_weight = None
 
     ##########################################
     # Query With Lazy Computation
     ##########################################
+    def has_node(self, node):
+        """
+        If this graph has certain node.
+
+        Args:
+            node: global node id
+
+        Returns:
+            bool, indicate if node is in this graph
+        """
+        return 0 <= node < self.node_count if self._node_map is None else node in self._node_map
+
     def neighbors(self, node):
         self._check_csr()
-        mapped_idx = self._node_dict.get(node, None)
-        assert mapped_idx is not None
-        neighbor_start = self._adj_csr.indptr[mapped_idx]
-        neighbor_end = self._adj_csr.indptr[mapped_idx + 1]
-        neighbors = self._adj_csr.indices[neighbor_start: neighbor_end]
-        node_ids = self._node_ids[neighbors]
+        mapped_idx = node if self._node_map is None else self._node_map.to_local(node)
+        if isinstance(self._adj_csr, CompressedCsrAdj):
+            neighbors = self._adj_csr.row(mapped_idx)
+        else:
+            neighbor_start = self._adj_csr.indptr[mapped_idx]
+            neighbor_end = self._adj_csr.indptr[mapped_idx + 1]
+            neighbors = self._adj_csr.indices[neighbor_start: neighbor_end]
+        node_ids = neighbors if self._node_map is None else self._node_map.to_global(neighbors)
         return node_ids
 
     def degree(self, node):
         self._check_csr()
-        mapped_idx = self._node_dict.get(node, None)
-        assert mapped_idx is not None
+        mapped_idx = node if self._node_map is None else self._node_map.to_local(node)
         neighbor_start = self._adj_csr.indptr[mapped_idx]
         neighbor_end = self._adj_csr.indptr[mapped_idx + 1]
         return neighbor_end - neighbor_start
 
+    def subgraph(self, nodes) -> 'MindHomoGraph':
+        """
+        Extract the subgraph induced by nodes, i.e. the nodes and all edges between them. Only csr rows of
+        `nodes` are visited, so the cost is proportional to the subgraph size rather than the graph size.
+
+        Args:
+            nodes(numpy.ndarray): global ids of unique nodes, local node `i` of the subgraph is `nodes[i]`.
+
+        Returns:
+            MindHomoGraph, subgraph in csr format. Its global node ids and edge ids are the ones of this graph.
+
+        Examples:
+            >>> import numpy as np
+            >>> from mindspore_gl.graph.graph import MindHomoGraph
+            >>> graph = MindHomoGraph()
+            >>> graph.set_topo_coo(np.array([[0, 1, 1, 2], [1, 2, 3, 0]]))
+            >>> sub_graph = graph.subgraph(np.array([2, 0, 1]))
+            >>> print(sub_graph.adj_coo, sub_graph.edge_ids)
+            [[0 1 2]
+             [1 2 0]] [3 0 1]
+        """
+        nodes = np.asarray(nodes)
+        local_nodes = self.node_map.to_local(nodes)
+        indptr, neighbors, positions = gather_csr_rows(self.adj_csr, local_nodes, return_positions=True)
+        sub_map = NodeIdMap(global_ids=local_nodes)
+        neighbors = sub_map.to_local(neighbors, check=False)
+        kept = neighbors >= 0
+        kept_count = np.zeros([kept.shape[0] + 1], dtype=indptr.dtype)
+        np.cumsum(kept, out=kept_count[1:])
+        index_dtype = get_index_dtype(nodes.shape[0])
+        adj_csr = CsrAdj(indptr=kept_count[indptr], indices=neighbors[kept].astype(index_dtype, copy=False))
+        res = MindHomoGraph()
+        res.set_topo(adj_csr, NodeIdMap(global_ids=nodes), self.csr_edge_ids(positions[kept]))
+        res.node_count = nodes.shape[0]
+        return res
+
+    def edge_subgraph(self, edge_ids) -> 'MindHomoGraph':
+        """
+        Extract the subgraph induced by edges, i.e. the edges and their end nodes. Nodes of the subgraph
+        keep their order in this graph.
+
+        Args:
+            edge_ids(numpy.ndarray): ids of unique edges, i.e. values of :attr:`edge_ids` if set, else edge
+                positions in the topology this graph is built from.
+
+        Returns:
+            MindHomoGraph, subgraph in csr format. Its global node ids and edge ids are the ones of this graph.
+        """
+        edge_ids = np.asarray(edge_ids)
+        if self._edge_ids is None:
+            positions = edge_ids
+        else:
+            if self._edge_id_map is None:
+                self._edge_id_map = NodeIdMap(global_ids=self._edge_ids)
+            positions = self._edge_id_map.to_local(edge_ids)
+        if self._adj_coo is not None:
+            src, dst = self._adj_coo[0][positions], self._adj_coo[1][positions]
+        else:
+            adj_csr = _decompressed(self._adj_csr)
+            src, dst = np.searchsorted(adj_csr.indptr, positions, side='right') - 1, adj_csr.indices[positions]
+        local_nodes, local_coo = np.unique(np.concatenate([src, dst]), return_inverse=True)
+        local_coo = local_coo.reshape(2, -1).astype(get_index_dtype(local_nodes.shape[0]), copy=False)
+        adj_csr, perm = coo_to_csr(local_coo, local_nodes.shape[0], return_perm=True)
+        res = MindHomoGraph()
+        res.set_topo(adj_csr, NodeIdMap(global_ids=self.node_map.to_global(local_nodes)), edge_ids[perm])
+        res.node_count = local_nodes.shape[0]
+        return res
+
+    def stats(self) -> GraphStats:
+        """
+        Statistics of the graph topology, e.g. degree distribution, self loop, duplicate edge and connected
+        component counts and estimated memory of each format, computed once from csr and cached.
+
+        Returns:
+            GraphStats, the statistics, :func:`GraphStats.report` gives a readable report.
+
+        Examples:
+            >>> import numpy as np
+            >>> from mindspore_gl.graph.graph import MindHomoGraph
+            >>> graph = MindHomoGraph()
+            >>> graph.set_topo_coo(np.array([[0, 0, 1, 3], [1, 1, 1, 3]]))
+            >>> stats = graph.stats()
+            >>> print(stats.self_loop_count, stats.duplicate_edge_count, stats.component_count)
+            2 1 3
+        """
+        if self._stats is None:
+            adj_csr = self.adj_csr
+            decompressed = _decompressed(adj_csr)
+            self._stats = GraphStats(decompressed.indptr, decompressed.indices, self.node_count)
+            if isinstance(adj_csr, CompressedCsrAdj):
+                self._stats.format_bytes["compressed_csr"] = adj_csr.nbytes
+        return self._stats
+
+    def set_edge_weight(self, edge_weight: np.ndarray):
+        """
+        Set edge weights for weighted sampling. Weights are ordered like the topology the graph is built from,
+        i.e. coo order for graphs set by coo and csr order for graphs set by csr. Setting topology again drops
+        the weights.
+
+        Args:
+            edge_weight(numpy.ndarray): non-negative weight of each edge, edges with zero weight are never sampled.
+
+        Raises:
+            ValueError: if `edge_weight` does not have one finite non-negative weight for each edge.
+        """
+        edge_weight = np.asarray(edge_weight)
+        if edge_weight.shape != (self.edge_count,):
+            raise ValueError(f"edge_weight should have shape ({self.edge_count},), but got {edge_weight.shape}")
+        if not np.all(np.isfinite(edge_weight)) or np.any(edge_weight < 0):
+            raise ValueError("edge_weight should be finite and non-negative")
+        self._edge_weight = edge_weight
+        self._csr_weight = None
+
+    @property
+    def edge_weight(self) -> np.ndarray:
+        """weight of each edge in the order of the topology the graph is built from, None if not set"""
+        return self._edge_weight
+
+    def csr_weight(self) -> CsrWeight:
+        """
+        Edge weights in csr order accumulated row by row, with the positive weight edge count of each row.
+        Weighted samplers find a neighbor by binary search on the row, the table is built once in O(edge_count)
+        and cached until topology or weights change.
+
+        Returns:
+            CsrWeight, cumulative weights and positive degrees.
+        """
+        if self._csr_weight is None:
+            assert self._edge_weight is not None, "edge weight is not set"
+            indptr = self.adj_csr.indptr
+            weight = self._edge_weight.astype(np.float64, copy=False)
+            if self._csr_perm is not None:
+                weight = weight[self._csr_perm]
+            positive_count = np.zeros([weight.shape[0] + 1], dtype=np.int64)
+            np.cumsum(weight > 0, out=positive_count[1:])
+            self._csr_weight = CsrWeight(sample_kernel.csr_cumulative_weight(indptr, weight),
+                                         np.diff(positive_count[indptr]))
+        return self._csr_weight
+
     @property
     def adj_csr(self):
         self._check_csr()
@@ -319,9 +1130,22 @@ class MindHomoGraph:
 
     @adj_coo.setter
     def adj_coo(self, adj_coo):
-        del self._adj_csr
         self._adj_csr = None
+        self._adj_csc = None
         self._adj_coo = adj_coo
+        self._store = None
+        self._csr_perm = None
+        self._edge_id_map = None
+        self._stats = None
+        self._edge_weight = None
+        self._csr_weight = None
+
+    @property
+    def adj_csc(self) -> CscAdj:
+        """csc format adjacent matrix, i.e. csr format of the reversed graph, computed lazily"""
+        if self._adj_csc is None:
+            self._adj_csc = csr_to_csc(self.adj_csr, self.node_count)
+        return self._adj_csc
 
     @property
     def edge_count(self):
@@ -330,7 +1154,7 @@ class MindHomoGraph:
             return self._edge_count
 
         if self._adj_csr is not None:
-            self._edge_count = self._adj_csr.indices.shape[0]
+            self._edge_count = int(self._adj_csr.indptr[-1])
         if self._adj_coo is not None:
             self._edge_count = self._adj_coo.shape[1]
 
@@ -344,15 +1168,48 @@ class MindHomoGraph:
         if self._node_count > 0:
             return self._node_count
         if self._adj_csr is not None:
-            self._node_count = self._adj_csr.indptr.shape[0]
-        if self._adj_coo is not None:
-            self._node_count = (np.unique(self.adj_coo[0])).shape[0]
+            self._node_count = self._adj_csr.indptr.shape[0] - 1
+        elif self._adj_coo is not None and self._adj_coo.shape[1] > 0:
+            self._node_count = int(self._adj_coo.max()) + 1
 
         if self._node_count == 0:
             raise Exception("graph topo is not set")
 
         return self._node_count
 
+    @property
+    def edge_ids(self) -> np.ndarray:
+        """edge id of each csr edge, None if edges are identified by their csr position"""
+        return self._edge_ids
+
+    def csr_edge_ids(self, positions):
+        """
+        Edge ids of edges at csr positions, e.g. edges sampled or gathered from :attr:`adj_csr`.
+
+        Args:
+            positions(numpy.ndarray): positions in `adj_csr.indices`.
+
+        Returns:
+            numpy.ndarray, values of :attr:`edge_ids` if set, else edge positions in the topology this graph is
+            built from, i.e. coo positions for graphs built from coo.
+        """
+        self._check_csr()
+        if self._csr_perm is not None:
+            positions = self._csr_perm[positions]
+        return positions if self._edge_ids is None else self._edge_ids[positions]
+
+    @property
+    def node_map(self) -> NodeIdMap:
+        """global<->local node id mapping, identity mapping is created on demand"""
+        if self._node_map is None:
+            self._node_map = NodeIdMap(self.node_count)
+        return self._node_map
+
+    @property
+    def store(self) -> GraphStore:
+        """graph store this graph is loaded from, None if graph is not loaded from store"""
+        return self._store
+
     @property
     def is_batched(self) -> bool:
         return self.batch_meta is not None
@@ -379,8 +1236,8 @@ class MindHomoGraph:
         res = MindHomoGraph()
         node_count, edge_count = self.batch_meta[graph_idx]
         res.adj_coo = self.adj_coo[:, self.batch_meta.graph_edges[graph_idx]:
-                                   self.batch_meta.graph_edges[graph_idx + 1]]
-        res.adj_coo -= - self.batch_meta.graph_nodes[graph_idx]
+                                   self.batch_meta.graph_edges[graph_idx + 1]] - \
+            self.batch_meta.graph_nodes[graph_idx]
         res.node_count = node_count
         res.edge_count = edge_count
         return res
@@ -392,7 +1249,7 @@ class MindHomoGraph:
         assert self._adj_csr is not None or self._adj_coo is not None
         if self._adj_csr is not None:
             return
-        self._adj_csr = coo_to_csr()
+        self._adj_csr, self._csr_perm = coo_to_csr(self._adj_coo, self.node_count, return_perm=True)
         return
 
     def _check_coo(self):
@@ -402,6 +1259,31 @@ class MindHomoGraph:
         self._adj_coo = csr_to_coo(self._adj_csr)
         return
 
+    def _load_store(self):
+        store = self._store
+        node_map = NodeIdMap(global_ids=store["node_ids"]) if "node_ids" in store else None
+        if store.meta.get("format") == "homo_compressed_csr":
+            adj_csr = CompressedCsrAdj(store["indptr"], store["block_indptr"], store["block_offsets"],
+                                       store["compressed_indices"], store.meta["block_size"], store.meta["node_count"])
+        else:
+            adj_csr = CsrAdj(store["indptr"], store["indices"])
+        self.set_topo(adj_csr, node_map, store.get("edge_ids"))
+        self._store = store
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self._store is not None:
+            # topology is mapped again from the store in the receiving process
+            state.update(_adj_csr=None, _adj_coo=None, _adj_csc=None, _node_map=None, _edge_ids=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._store is not None:
+            self._load_store()
+            # weights belong to the reloaded topology
+            self._edge_weight, self._csr_weight = state.get("_edge_weight"), state.get("_csr_weight")
+
 
 class MindHeteroGraph:
     """
@@ -410,6 +1292,7 @@ class MindHeteroGraph:
 
     def __init__(self):
         self._rel_graphs: Dict = {}
+        self._node_counts: Dict = {}
 
         # Information For Batch
         self._batch_meta = None
@@ -417,30 +1300,116 @@ class MindHeteroGraph:
     def add_graph(self, rel_graph: MindRelationGraph):
         self._rel_graphs[rel_graph.relation_type] = rel_graph
 
+    def get_graph(self, relation_type) -> MindRelationGraph:
+        return self._rel_graphs[relation_type]
+
+    def set_node_count(self, node_type, node_count):
+        """
+        Set node count of a node type, e.g. to count nodes without any edge.
+
+        Args:
+            node_type(str): node type.
+            node_count(int): node count.
+        """
+        self._node_counts[node_type] = int(node_count)
+
+    def node_count(self, node_type):
+        """
+        Node count of a node type, inferred from relation graphs if not set.
+
+        Args:
+            node_type(str): node type.
+
+        Returns:
+            int, node count.
+        """
+        if node_type in self._node_counts:
+            return self._node_counts[node_type]
+        node_count = 0
+        for rel_graph in self._rel_graphs.values():
+            if rel_graph.src_node_type == node_type:
+                node_count = max(node_count, rel_graph.node_num)
+            if rel_graph.dst_node_type == node_type:
+                node_count = max(node_count, rel_graph.dst_node_num)
+        return node_count
+
+    @property
+    def node_types(self) -> List[str]:
+        """node types, in order of first appearance"""
+        node_types = dict.fromkeys(self._node_counts)
+        for rel_graph in self._rel_graphs.values():
+            node_types.update(dict.fromkeys([rel_graph.src_node_type, rel_graph.dst_node_type]))
+        return list(node_types)
+
+    @property
+    def relation_types(self) -> List[str]:
+        return list(self._rel_graphs)
+
+    @property
+    def is_batched(self) -> bool:
+        return self._batch_meta is not None
+
+    @property
+    def batch_meta(self) -> HeteroBatchMeta:
+        return self._batch_meta
+
+    @batch_meta.setter
+    def batch_meta(self, batch_meta: HeteroBatchMeta):
+        self._batch_meta = batch_meta
+
+    def to_field_inputs(self, relation_types: List[str] = None):
+        """
+        Coo of each relation in the layout of `HeterGraphField`.
+
+        Args:
+            relation_types(List[str]): relations to output, all relations if None.
+
+        Returns:
+            - **src_idx** (List[numpy.ndarray]) - source node of each edge for each relation.
+            - **dst_idx** (List[numpy.ndarray]) - destination node of each edge for each relation.
+            - **n_nodes** (List[int]) - destination node type count for each relation.
+            - **n_edges** (List[int]) - edge count for each relation.
+        """
+        relation_types = self.relation_types if relation_types is None else relation_types
+        src_idx, dst_idx, n_nodes, n_edges = [], [], [], []
+        for relation_type in relation_types:
+            rel_graph = self._rel_graphs[relation_type]
+            adj_coo = rel_graph.adj_coo
+            src_idx.append(adj_coo[0])
+            dst_idx.append(adj_coo[1])
+            n_nodes.append(self.node_count(rel_graph.dst_node_type))
+            n_edges.append(rel_graph.edge_num)
+        return src_idx, dst_idx, n_nodes, n_edges
+
     ########################################
     # Query Graphs With Lazy Computation
     #######################################
     def successors(self, relation_type, src_node):
-
         return self._rel_graphs[relation_type].successors(src_node)
 
-    def predecessors(self, dst_node):
-        pass
+    def predecessors(self, relation_type, dst_node):
+        return self._rel_graphs[relation_type].predecessors(dst_node)
+
+    def successors_batch(self, relation_type, src_nodes):
+        return self._rel_graphs[relation_type].successors_batch(src_nodes)
+
+    def predecessors_batch(self, relation_type, dst_nodes):
+        return self._rel_graphs[relation_type].predecessors_batch(dst_nodes)
 
     def out_degree(self, relation_type, src_node):
         return self._rel_graphs[relation_type].out_degree(src_node)
 
-    def out_degrees(self, relation_type, src_nodes):
-        pass
+    def out_degrees(self, relation_type, src_nodes=None):
+        return self._rel_graphs[relation_type].out_degrees(src_nodes)
 
     def in_degree(self, relation_type, dst_node):
-        pass
+        return self._rel_graphs[relation_type].in_degree(dst_node)
 
-    def in_degrees(self, relation_type, dst_nodes):
-        pass
+    def in_degrees(self, relation_type, dst_nodes=None):
+        return self._rel_graphs[relation_type].in_degrees(dst_nodes)
 
     def format(self, relation_type, out_format):
-        pass
+        return self._rel_graphs[relation_type].format(out_format)
 
     def nodes(self, relation_type):
         return self._rel_graphs[relation_type].nodes
@@ -0,0 +1,163 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Array backed node id mapping."""
+from typing import Dict
+import numpy as np
+
+
+class NodeIdMap:
+    """
+    Mapping between global node ids and local node ids, local ids are 0, 1, ..., node_count - 1.
+    With no global ids given, the mapping is identity and takes no storage. Otherwise global ids are
+    looked up by binary search on a sorted copy, which costs at most 16 bytes per node.
+
+    Args:
+        node_count(int): node count, can be omitted if `global_ids` is given.
+        global_ids(numpy.ndarray): global id of each local node, global ids should be unique.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.node_map import NodeIdMap
+        >>> node_map = NodeIdMap(global_ids=np.array([10, 3, 7]))
+        >>> print(node_map.to_local(np.array([7, 10])))
+        [2 0]
+        >>> print(node_map.to_global(np.array([1, 2])))
+        [3 7]
+    """
+
+    def __init__(self, node_count=None, global_ids: np.ndarray = None):
+        if global_ids is not None:
+            global_ids = np.asarray(global_ids)
+            node_count = global_ids.shape[0]
+        assert node_count is not None, "node_count or global_ids should be given"
+        self._node_count = int(node_count)
+        self._global_ids = global_ids
+
+        #######################
+        # For Lazy Computation
+        #######################
+        self._sorted_ids = None
+        self._sorted_pos = None
+
+    @classmethod
+    def from_dict(cls, node_dict: Dict) -> 'NodeIdMap':
+        """
+        Build mapping from a global->local node id dict.
+
+        Args:
+            node_dict(Dict): global->local node id.
+
+        Returns:
+            NodeIdMap, the mapping.
+        """
+        node_count = len(node_dict)
+        global_ids = np.fromiter(node_dict.keys(), dtype=np.int64, count=node_count)
+        local_ids = np.fromiter(node_dict.values(), dtype=np.int64, count=node_count)
+        if np.array_equal(global_ids, local_ids) and np.array_equal(local_ids, np.arange(node_count)):
+            return cls(node_count)
+        res = np.empty([node_count], dtype=np.int64)
+        res[local_ids] = global_ids
+        return cls(global_ids=res)
+
+    @property
+    def node_count(self):
+        """node count of the mapping"""
+        return self._node_count
+
+    @property
+    def is_identity(self) -> bool:
+        """if global id equals local id"""
+        return self._global_ids is None
+
+    @property
+    def global_ids(self) -> np.ndarray:
+        """global id of each local node"""
+        if self._global_ids is None:
+            return np.arange(self._node_count)
+        return self._global_ids
+
+    def to_global(self, local_ids):
+        """
+        Map local node ids to global node ids.
+
+        Args:
+            local_ids(Union[int, numpy.ndarray]): local node ids.
+
+        Returns:
+            Union[int, numpy.ndarray], global node ids.
+        """
+        if self._global_ids is None:
+            return local_ids
+        return self._global_ids[local_ids]
+
+    def to_local(self, global_ids, check=True):
+        """
+        Map global node ids to local node ids.
+
+        Args:
+            global_ids(Union[int, numpy.ndarray]): global node ids.
+            check(bool): if True, assert all ids are in the mapping, else unknown ids are mapped to -1.
+
+        Returns:
+            Union[int, numpy.ndarray], local node ids.
+        """
+        if self._global_ids is None:
+            if check:
+                assert np.all(self.contains(global_ids)), "node not in graph"
+                return global_ids
+            return np.where(self.contains(global_ids), global_ids, -1)
+        if self._node_count == 0:
+            found = np.zeros(np.shape(global_ids), dtype=bool)
+            if check:
+                assert np.all(found), "node not in graph"
+            return np.where(found, global_ids, -1)
+        self._build_index()
+        # ids larger than all global ids are clipped to the last one and then reported as not found
+        pos = np.minimum(np.searchsorted(self._sorted_ids, global_ids), self._node_count - 1)
+        found = self._sorted_ids[pos] == global_ids
+        if check:
+            assert np.all(found), "node not in graph"
+        local_ids = pos if self._sorted_pos is None else self._sorted_pos[pos]
+        return local_ids if check else np.where(found, local_ids, -1)
+
+    def contains(self, global_ids):
+        """
+        Check if nodes are in the mapping.
+
+        Args:
+            global_ids(Union[int, numpy.ndarray]): global node ids.
+
+        Returns:
+            Union[bool, numpy.ndarray], if each node is in the mapping.
+        """
+        if self._global_ids is None:
+            return (global_ids >= 0) & (global_ids < self._node_count)
+        return self.to_local(global_ids, check=False) >= 0
+
+    def __contains__(self, global_id):
+        return bool(self.contains(global_id))
+
+    def __len__(self):
+        return self._node_count
+
+    def _build_index(self):
+        if self._sorted_ids is not None:
+            return
+        if np.all(self._global_ids[1:] > self._global_ids[:-1]):
+            # already sorted, search on global ids directly
+            self._sorted_ids = self._global_ids
+            return
+        self._sorted_pos = np.argsort(self._global_ids, kind='stable')
+        self._sorted_ids = self._global_ids[self._sorted_pos]
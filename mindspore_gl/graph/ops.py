@@ -13,15 +13,17 @@
 # limitations under the License.
 # ============================================================================
 """Operations for Graph."""
-from typing import List, Union, Tuple
+from typing import Dict, List, Union, Tuple
 import math
 from enum import Enum
 import numpy as np
 
 import mindspore_gl.array_kernel as array_kernel
 import mindspore_gl.dataloader.shared_numpy as shared_numpy
-from .graph import BatchMeta, MindHomoGraph
-from .utils import SharedArrayPool, ArrayPool
+from .graph import BatchMeta, MindHomoGraph, get_index_dtype, HeteroBatchMeta, MindHeteroGraph, MindRelationGraph, \
+    CsrAdj, _decompressed
+from .utils import SharedArrayPool, ArrayPool, DEFAULT_POOL_BYTES
+from .bucket import BucketPolicy, GeometricBucket, PaddingRecorder, PaddingStats
 
 
 class BatchHomoGraph:
@@ -30,39 +32,68 @@ class BatchHomoGraph:
     """
 
     def __init__(self):
-        self.res_coo = None
-
-    def __call__(self, graph_list: List[MindHomoGraph], **kwargs) -> MindHomoGraph:
-        ########################
-        # determine coo_length
-        #########################
-        total_edge_count = 0
-        total_node_count = 0
-        graph_nodes = np.zeros([len(graph_list) + 1], dtype=np.int32)
-        graph_edges = np.zeros([len(graph_list) + 1], dtype=np.int32)
-        for idx, graph in enumerate(graph_list):
-            total_edge_count += graph.edge_count
-            total_node_count += graph.node_count
-            graph_edges[idx + 1] = total_edge_count
-            graph_nodes[idx + 1] = total_node_count
-
-        if self.res_coo is None or self.res_coo.shape[1] < total_edge_count:
-            del self.res_coo
-            self.res_coo = np.zeros([2, total_edge_count], dtype=np.int32)
-        ###########################
-        # copy edge array
-        ########################
-        node_offset = 0
-        edge_offset = 0
-        for graph in graph_list:
-            self.res_coo[:, edge_offset: graph.edge_count + edge_offset] = graph.adj_coo + node_offset
-            node_offset += graph.node_count
-            edge_offset += graph.edge_count
+        pass
+
+    def __call__(self, graph_list: List[MindHomoGraph], out: np.ndarray = None, **kwargs) -> MindHomoGraph:
+        """
+        Batch graphs.
+
+        Args:
+            graph_list(List[MindHomoGraph]): graphs to batch.
+            out(numpy.ndarray): buffer with shape [2, edge_count] or larger to write batched coo into,
+                e.g. a SharedNDArray. A new array is allocated if None, its data type is int32 if total node
+                count fits in it, else int64.
+
+        Returns:
+            MindHomoGraph, the batched graph.
+        """
+        graph_count = len(graph_list)
+        node_counts = np.fromiter((graph.node_count for graph in graph_list), dtype=np.int64, count=graph_count)
+        edge_counts = np.fromiter((graph.edge_count for graph in graph_list), dtype=np.int64, count=graph_count)
+        total_edge_count = int(edge_counts.sum())
+        if out is None:
+            out = np.empty([2, total_edge_count], dtype=get_index_dtype(int(node_counts.sum())))
+        np.concatenate([graph.adj_coo for graph in graph_list], axis=1, out=out[:, :total_edge_count])
+        return self.from_coo(out, node_counts, edge_counts, out=out)
+
+    @staticmethod
+    def from_coo(adj_coo: np.ndarray, node_counts: np.ndarray, edge_counts: np.ndarray,
+                 out: np.ndarray = None) -> MindHomoGraph:
+        """
+        Batch graphs given as a concatenated coo, node ids in `adj_coo` are local to each graph.
+        Node offsets of all edges are added in a single vectorized pass.
+
+        Args:
+            adj_coo(numpy.ndarray): concatenated coo of all graphs with shape [2, edge_count].
+            node_counts(numpy.ndarray): node count of each graph.
+            edge_counts(numpy.ndarray): edge count of each graph.
+            out(numpy.ndarray): buffer with shape [2, edge_count] or larger to write batched coo into,
+                e.g. a SharedNDArray, can be `adj_coo` itself. A new array is allocated if None, its data type
+                is int32 if total node count fits in it, else int64.
+
+        Returns:
+            MindHomoGraph, the batched graph, its coo is a view of `out` if given.
+        """
+        total_node_count = int(np.sum(node_counts))
+        total_edge_count = int(np.sum(edge_counts))
+        assert adj_coo.shape[1] >= total_edge_count, "adj_coo is smaller than total edge count"
+        graph_nodes = np.zeros([len(node_counts) + 1], dtype=get_index_dtype(total_node_count))
+        graph_edges = np.zeros([len(edge_counts) + 1], dtype=get_index_dtype(total_edge_count))
+        np.cumsum(node_counts, out=graph_nodes[1:])
+        np.cumsum(edge_counts, out=graph_edges[1:])
+
+        if out is None:
+            res_coo = np.empty([2, total_edge_count], dtype=graph_nodes.dtype)
+        else:
+            assert np.iinfo(out.dtype).max > total_node_count, f"node ids overflow {out.dtype} of out"
+            res_coo = out[:, :total_edge_count]
+        node_offset = np.repeat(graph_nodes[:-1], edge_counts)
+        np.add(adj_coo[:, :total_edge_count], node_offset, out=res_coo)
         ######################################
         # Pack Result
         ######################################
         res_graph = MindHomoGraph()
-        res_graph.set_topo_coo(np.copy(self.res_coo[:, :total_edge_count]))
+        res_graph.set_topo_coo(res_coo)
         res_graph.node_count = total_node_count
         res_graph.edge_count = total_edge_count
         batch_meta = BatchMeta(graph_nodes=graph_nodes, graph_edges=graph_edges)
@@ -70,9 +101,87 @@ class BatchHomoGraph:
         return res_graph
 
 
+class BatchHeteroGraph:
+    """
+    BatchHeteroGraph, batch list of MindHeteroGraph into a single MindHeteroGraph with HeteroBatchMeta.
+    Nodes of each type are numbered graph by graph, and the csr of each relation is built by offsetting
+    and concatenating the csr of all graphs without sorting. Node ids of relation graphs should be local ids.
+    """
+
+    def __init__(self):
+        pass
+
+    def __call__(self, graph_list: List[MindHeteroGraph], **kwargs) -> MindHeteroGraph:
+        """
+        Batch graphs, a relation missing in some graphs is treated as having no edge in them.
+
+        Args:
+            graph_list(List[MindHeteroGraph]): graphs to batch.
+
+        Returns:
+            MindHeteroGraph, the batched graph.
+        """
+        graph_count = len(graph_list)
+        relations = {}
+        node_types = {}
+        for graph in graph_list:
+            for relation_type in graph.relation_types:
+                if relation_type not in relations:
+                    rel_graph = graph.get_graph(relation_type)
+                    relations[relation_type] = (rel_graph.src_node_type, rel_graph.edge_type, rel_graph.dst_node_type)
+            node_types.update(dict.fromkeys(graph.node_types))
+
+        graph_nodes = {}
+        for node_type in node_types:
+            node_counts = np.fromiter((graph.node_count(node_type) for graph in graph_list), dtype=np.int64,
+                                      count=graph_count)
+            graph_nodes[node_type] = np.zeros([graph_count + 1], dtype=get_index_dtype(int(node_counts.sum())))
+            np.cumsum(node_counts, out=graph_nodes[node_type][1:])
+
+        res_graph = MindHeteroGraph()
+        graph_edges = {}
+        for relation_type, (src_type, edge_type, dst_type) in relations.items():
+            csr_list = [_decompressed(graph.get_graph(relation_type).adj_csr)
+                        if relation_type in graph.relation_types else None for graph in graph_list]
+            adj_csr, graph_edges[relation_type] = _batch_csr(csr_list, graph_nodes[src_type], graph_nodes[dst_type])
+            rel_graph = MindRelationGraph(src_type, dst_type, edge_type)
+            rel_graph.set_topo(adj_csr, dst_node_num=int(graph_nodes[dst_type][-1]))
+            res_graph.add_graph(rel_graph)
+        for node_type, node_offsets in graph_nodes.items():
+            res_graph.set_node_count(node_type, node_offsets[-1])
+        res_graph.batch_meta = HeteroBatchMeta(graph_nodes, graph_edges)
+        return res_graph
+
+
+def _batch_csr(csr_list: List[CsrAdj], row_offsets: np.ndarray, col_offsets: np.ndarray):
+    """concatenate csr of graphs into one csr, row and column ids of graph `i` start at the given offsets"""
+    empty = np.zeros([1], dtype=np.int64)
+    indptr_list = [empty if csr is None else csr.indptr for csr in csr_list]
+    row_counts = np.fromiter((indptr.shape[0] - 1 for indptr in indptr_list), dtype=np.int64, count=len(csr_list))
+    edge_counts = np.fromiter((indptr[-1] for indptr in indptr_list), dtype=np.int64, count=len(csr_list))
+    graph_edges = np.zeros([len(csr_list) + 1], dtype=get_index_dtype(int(edge_counts.sum())))
+    np.cumsum(edge_counts, out=graph_edges[1:])
+
+    # relation rows of a graph can be fewer than the nodes of its source type, place degrees at row offsets
+    row_starts = np.zeros([len(csr_list) + 1], dtype=np.int64)
+    np.cumsum(row_counts, out=row_starts[1:])
+    row_pos = np.arange(row_starts[-1], dtype=np.int64) + np.repeat(row_offsets[:-1] - row_starts[:-1], row_counts)
+    degrees = np.zeros([int(row_offsets[-1])], dtype=graph_edges.dtype)
+    degrees[row_pos] = np.concatenate([np.diff(indptr) for indptr in indptr_list])
+    indptr = np.zeros([degrees.shape[0] + 1], dtype=graph_edges.dtype)
+    np.cumsum(degrees, out=indptr[1:])
+
+    index_dtype = get_index_dtype(int(col_offsets[-1]))
+    indices = np.concatenate([empty[:0] if csr is None else csr.indices for csr in csr_list]).astype(index_dtype)
+    indices += np.repeat(col_offsets[:-1], edge_counts).astype(index_dtype, copy=False)
+    return CsrAdj(indptr=indptr, indices=indices), graph_edges
+
+
 class UnBatchHomoGraph:
     """
     Return list of MindHomoGraph from a Batched MindHomoGraph.
+    Nodes are renumbered for all graphs in a single pass, and the coo of each returned graph is a view
+    of this shared buffer, so no per graph copy is made.
     """
 
     def __init__(self):
@@ -80,9 +189,17 @@ class UnBatchHomoGraph:
 
     def __call__(self, graph: MindHomoGraph, **kwargs) -> List[MindHomoGraph]:
         assert graph.is_batched, "UnBatchHomoGraph can only be operated on batched_graph"
+        batch_meta = graph.batch_meta
+        local_coo = batch_meta.local_adj_coo(graph.adj_coo)
+        graph_nodes = batch_meta.graph_nodes.tolist()
+        graph_edges = batch_meta.graph_edges.tolist()
         res: List[MindHomoGraph] = []
-        for idx in range(graph.batch_meta.graph_count):
-            res.append(graph[idx])
+        for idx in range(batch_meta.graph_count):
+            sub_graph = MindHomoGraph()
+            sub_graph.set_topo_coo(local_coo[:, graph_edges[idx]: graph_edges[idx + 1]])
+            sub_graph.node_count = graph_nodes[idx + 1] - graph_nodes[idx]
+            sub_graph.edge_count = graph_edges[idx + 1] - graph_edges[idx]
+            res.append(sub_graph)
         return res
 
 
@@ -118,16 +235,19 @@ class PadArray2d:
         reset_with_fill_value(bool): PadArray2d will reuse memory buffer,
             you can set this value to False if you dont care about the padded value.
         mode(PadMode): Pad mode for array, if PadMode.CONST, this op will pad array to user-specific size.
-            If PadMode.AUTO, this will choose padded result length according to input's length.
-            The expected length can be calculated as 2^ceil(log2(input_length)).
+            If PadMode.AUTO, this will choose padded result length according to input's length by `bucket`.
+            By default the expected length can be calculated as 2^ceil(log2(input_length)).
         size(Union[List, Tuple]): User specific size for padding result.
         use_shared_numpy(bool): If we use SharedNDArray for speeding up inter process communication.
             This is recommended if you do feature collection and feature padding in child process and
             need inter process communication for graph feature.
+        bucket(BucketPolicy): bucketing policy of padded length in PadMode.AUTO. Default: GeometricBucket().
+        pool_max_bytes(Union[int, None]): max total bytes of reused buffers, least recently used buffers are released
+            beyond it, None means unbounded. Default: 1 GiB.
     """
 
     def __init__(self, dtype, direction, fill_value=None, reset_with_fill_value=True, mode=PadMode.AUTO, size=None,
-                 use_shared_numpy=False):
+                 use_shared_numpy=False, bucket: BucketPolicy = None, pool_max_bytes=DEFAULT_POOL_BYTES):
         if mode == PadMode.CONST:
             assert size is not None and dtype is not None and fill_value is not None, \
                 "pad size should be provided when padding mode is PadMode.CONST"
@@ -139,18 +259,15 @@ class PadArray2d:
         self.reset_with_fill_value = reset_with_fill_value
         self.use_shared_numpy = use_shared_numpy
         self.size = size
+        self.bucket = GeometricBucket() if bucket is None else bucket
+        self.recorder = PaddingRecorder()
         if self.use_shared_numpy:
-            self.array_pool = SharedArrayPool()
+            self.array_pool = SharedArrayPool(pool_max_bytes)
         else:
-            self.array_pool = ArrayPool()
+            self.array_pool = ArrayPool(pool_max_bytes)
 
         if mode == PadMode.CONST:
-            if self.use_shared_numpy:
-                memory_buffer = shared_numpy.SharedNDArray.from_shape(size, dtype=dtype)
-                self.array_pool.put(size, memory_buffer)
-            else:
-                memory_buffer = np.zeros(size, dtype=dtype)
-                self.array_pool.put(size, memory_buffer)
+            self.array_pool.put(size, self._new_buffer(size))
 
     def __call__(self, input_array, **kwargs):
         """
@@ -165,9 +282,9 @@ class PadArray2d:
         fill_value = kwargs.get("fill_value", None)
         if self.pad_mode == PadMode.CONST:
             memory_buffer = self.array_pool.pop(self.size)
-            # If Memory Buffer Is None, It's Definitely SharedNDArray
+            # Memory Buffer Is None If It's Still In Use Or Released By Pool
             if memory_buffer is None:
-                memory_buffer = shared_numpy.SharedNDArray.from_shape(self.size, dtype=self.dtype)
+                memory_buffer = self._new_buffer(self.size)
                 self.array_pool.put(self.size, memory_buffer)
 
             if self.pad_direction == PadDirection.ROW:
@@ -184,34 +301,33 @@ class PadArray2d:
             ##########################
             # Put Back To Memory Buffer
             ##########################
+            self.recorder.record(input_array.size, memory_buffer.size, self.size)
             self.array_pool.put(self.size, memory_buffer)
             return memory_buffer
         memory_buffer = None
         target_size = None
         if self.pad_direction == PadDirection.ROW:
-            bucket_length = math.ceil(math.log2(input_array.shape[1]))
-            target_size = [input_array.shape[0], 1 << bucket_length]
+            target_size = [input_array.shape[0], self.bucket(input_array.shape[1])]
             if fill_value is None:
-                fill_value = self.fill_value or (1 << bucket_length) - 1
+                fill_value = self.fill_value or target_size[1] - 1
 
             memory_buffer = self.array_pool.pop(target_size)
             if memory_buffer is None:
-                memory_buffer = shared_numpy.SharedNDArray.from_shape(target_size, self.dtype)
+                memory_buffer = self._new_buffer(target_size)
                 self.array_pool.put(target_size, memory_buffer)
 
             memory_buffer[:, :input_array.shape[1]] = input_array
             if self.reset_with_fill_value:
                 memory_buffer[:, input_array.shape[1]:] = fill_value
         else:
-            bucket_length = math.ceil(math.log2(input_array.shape[0]))
-            target_size = [1 << bucket_length, input_array.shape[1]]
+            target_size = [self.bucket(input_array.shape[0]), input_array.shape[1]]
 
             if fill_value is None:
-                fill_value = self.fill_value or (1 << bucket_length) - 1
+                fill_value = self.fill_value or target_size[0] - 1
             memory_buffer = self.array_pool.pop(target_size)
 
             if memory_buffer is None:
-                memory_buffer = shared_numpy.SharedNDArray.from_shape(target_size, self.dtype)
+                memory_buffer = self._new_buffer(target_size)
                 self.array_pool.put(target_size, memory_buffer)
 
             memory_buffer[:input_array.shape[0]] = input_array
@@ -220,6 +336,7 @@ class PadArray2d:
         ##########################
         # Put Back To Memory Buffer
         ##########################
+        self.recorder.record(input_array.size, memory_buffer.size, target_size)
         self.array_pool.put(target_size, memory_buffer)
         return memory_buffer
 
@@ -237,9 +354,9 @@ class PadArray2d:
         fill_value = kwargs.get("fill_value", None)
         if self.pad_mode == PadMode.CONST:
             memory_buffer = self.array_pool.pop(self.size)
-            # If Memory Buffer Is None, It's Definitely SharedNDArray
+            # Memory Buffer Is None If It's Still In Use Or Released By Pool
             if memory_buffer is None:
-                memory_buffer = shared_numpy.SharedNDArray.from_shape(self.size, dtype=self.dtype)
+                memory_buffer = self._new_buffer(self.size)
 
             if self.reset_with_fill_value:
 
@@ -250,41 +367,56 @@ class PadArray2d:
             ##########################
             # Put Back To Memory Buffer
             ##########################
+            self.recorder.record(np.prod(shape), memory_buffer.size, self.size)
             self.array_pool.put(self.size, memory_buffer)
             return memory_buffer
         memory_buffer = None
         target_size = None
         if self.pad_direction == PadDirection.ROW:
-            bucket_length = math.ceil(math.log2(shape[1]))
-            target_size = [shape[0], 1 << bucket_length]
+            target_size = [shape[0], self.bucket(shape[1])]
             if fill_value is None:
-                fill_value = self.fill_value or (1 << bucket_length) - 1
+                fill_value = self.fill_value or target_size[1] - 1
 
             memory_buffer = self.array_pool.pop(target_size)
             if memory_buffer is None:
-                memory_buffer = shared_numpy.SharedNDArray.from_shape(target_size, self.dtype)
+                memory_buffer = self._new_buffer(target_size)
 
             if self.reset_with_fill_value:
                 memory_buffer[:, shape[1]:] = fill_value
         else:
-            bucket_length = math.ceil(math.log2(shape[0]))
-            target_size = [1 << bucket_length, shape[1]]
+            target_size = [self.bucket(shape[0]), shape[1]]
 
             if fill_value is None:
-                fill_value = self.fill_value or (1 << bucket_length) - 1
+                fill_value = self.fill_value or target_size[0] - 1
             memory_buffer = self.array_pool.pop(target_size)
 
             if memory_buffer is None:
-                memory_buffer = shared_numpy.SharedNDArray.from_shape(target_size, self.dtype)
+                memory_buffer = self._new_buffer(target_size)
 
             if self.reset_with_fill_value:
                 memory_buffer[shape[0]:] = fill_value
         ##########################
         # Put Back To Memory Buffer
         ##########################
+        self.recorder.record(np.prod(shape), memory_buffer.size, target_size)
         self.array_pool.put(target_size, memory_buffer)
         return memory_buffer
 
+    def _new_buffer(self, size):
+        """allocate a buffer, in shared memory if use_shared_numpy"""
+        if self.use_shared_numpy:
+            return shared_numpy.SharedNDArray.from_shape(list(size), dtype=self.dtype)
+        return np.zeros(size, dtype=self.dtype)
+
+    def padding_stats(self) -> PaddingStats:
+        """
+        Statistics of the paddings done by this operator, see PaddingRecorder.stats.
+
+        Returns:
+            PaddingStats, padding overhead and number of distinct padded shapes.
+        """
+        return self.recorder.stats()
+
 
 class PadHomoGraph:
     """
@@ -297,12 +429,22 @@ class PadHomoGraph:
         n_edge(Union(int, None)): target graph's edge count
         mode(PadMode): Pad mode, if PadMode.CONST, target graph will have n_node nodes and n_edge edges. If PadMode.AUTO
             target graph's node_count and edge_count is calculated according to input graph's size by
+            `node_bucket` and `edge_bucket`, by default
             n_node = 2^ceil(log2(input_graph.node_count)),
             n_edge = 2^ceil(log2(input_graph.edge_count))
-
+        node_bucket(BucketPolicy): bucketing policy of node count in PadMode.AUTO. Default: GeometricBucket().
+        edge_bucket(BucketPolicy): bucketing policy of edge count in PadMode.AUTO. Default: GeometricBucket().
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.ops import PadHomoGraph, PadMode
+        >>> from mindspore_gl.graph.bucket import GeometricBucket
+        >>> pad_op = PadHomoGraph(mode=PadMode.AUTO, node_bucket=GeometricBucket(1.25, 16),
+        ...                       edge_bucket=GeometricBucket(1.25, 64))
     """
 
-    def __init__(self, n_node=None, mode=PadMode.AUTO, n_edge=None):
+    def __init__(self, n_node=None, mode=PadMode.AUTO, n_edge=None, node_bucket: BucketPolicy = None,
+                 edge_bucket: BucketPolicy = None):
         if mode == PadMode.CONST:
             assert n_edge is not None and n_node is not None, \
                 "n_node and n_edge should be given when padding with CONST Mode"
@@ -310,7 +452,10 @@ class PadHomoGraph:
         self.n_node = n_node
         self.mode = mode
         self.n_edge = n_edge
+        self.node_bucket = GeometricBucket() if node_bucket is None else node_bucket
+        self.edge_bucket = GeometricBucket() if edge_bucket is None else edge_bucket
         self.batch_op = BatchHomoGraph()
+        self.recorder = PaddingRecorder()
 
     def __call__(self, graph: MindHomoGraph, **kwargs) -> MindHomoGraph:
         """
@@ -325,105 +470,227 @@ class PadHomoGraph:
         ####################################
         # Check Input Graph is Valid To Pad
         ####################################
-        res_graph = MindHomoGraph()
         if self.mode is PadMode.CONST:
             assert graph.edge_count < self.n_edge, \
                 "Given graph is too large for the given padding"
+            n_node, n_edge = self.n_node, self.n_edge
+        else:
+            n_node, n_edge = self.node_bucket(graph.node_count), self.edge_bucket(graph.edge_count)
+        self.recorder.record(graph.node_count + graph.edge_count, n_node + n_edge, (n_node, n_edge))
+        if not graph.is_batched and (graph.edge_count != n_edge or graph.node_count != n_node):
+            return _pad_single_graph(graph, n_node, n_edge)
+        ####################################
+        # Determine Padded Graph
+        ####################################
+        if graph.edge_count == n_edge:
+            # no pad edges, an empty fake graph is still batched so the fake graph is always the last one
+            adj_coo = graph.adj_coo
+        else:
+            pad_graph_coo = np.full([2, n_edge - graph.edge_count], n_node - 1, dtype=get_index_dtype(n_node))
+            adj_coo = np.concatenate([graph.adj_coo, pad_graph_coo], axis=1)
         if graph.is_batched:
-            if self.mode == PadMode.CONST:
-                ###########################
-                # No Need To Pad
-                ###########################
-                if graph.edge_count == self.n_edge:
-                    return graph
-                ####################################
-                # Determine Padded Graph
-                ####################################
-                pad_graph_coo = np.full([2, self.n_edge - graph.edge_count], self.n_node - 1, dtype=np.int32)
-                pad_graph = MindHomoGraph()
-                pad_graph.adj_coo = pad_graph_coo
-                pad_graph.node_count = self.n_node - graph.node_count
-                pad_graph.edge_count = self.n_edge - graph.edge_count
-                ####################################
-                # Pad Graph
-                ####################################
-                res_graph.adj_coo = np.concatenate([graph.adj_coo, pad_graph.adj_coo], axis=1)
-                res_graph_graph_nodes = np.concatenate([graph.batch_meta.graph_nodes, np.array([self.n_node],
-                                                                                               dtype=np.int32)])
-                res_graph_graph_edges = np.concatenate([graph.batch_meta.graph_edges, np.array([self.n_edge],
-                                                                                               dtype=np.int32)])
-                res_graph.batch_meta = BatchMeta(graph_nodes=res_graph_graph_nodes, graph_edges=res_graph_graph_edges)
-                res_graph.edge_count = self.n_edge
-                res_graph.node_count = self.n_node
-                return res_graph
-            ###########################
-            # No Need To Pad
-            ###########################
-            if graph.edge_count == 1 << math.ceil(math.log2(graph.edge_count)):
-                return graph
-            #############################
-            # Determine Pad Graph
-            #############################
-            edge_bucket_length = math.ceil(math.log2(graph.edge_count))
-            padded_graph_edge_count = (1 << edge_bucket_length) - graph.edge_count
-            padded_graph_node_count = (1 << math.ceil(math.log2(graph.node_count))) - graph.node_count
-            pad_graph = MindHomoGraph()
-            pad_value = (1 << math.ceil(math.log2(graph.node_count))) - 1
-            pad_graph.adj_coo = np.full([2, padded_graph_edge_count], pad_value, dtype=np.int32)
-            pad_graph.node_count = padded_graph_node_count
-            pad_graph.edge_count = padded_graph_edge_count
-
-            ################################
-            # Pad Graph
-            ################################
-            res_graph.adj_coo = np.concatenate([graph.adj_coo, pad_graph.adj_coo], axis=1)
-            res_graph_graph_nodes = np.concatenate([graph.batch_meta.graph_nodes,
-                                                    np.array([1 << math.ceil(math.log2(graph.node_count))],
-                                                             dtype=np.int32)])
-            res_graph_graph_edges = np.concatenate([graph.batch_meta.graph_edges,
-                                                    np.array([1 << edge_bucket_length], dtype=np.int32)])
-            res_graph.batch_meta = BatchMeta(graph_nodes=res_graph_graph_nodes, graph_edges=res_graph_graph_edges)
-            res_graph.edge_count = graph.edge_count + pad_graph.edge_count
-            res_graph.node_count = graph.node_count + pad_graph.node_count
-
-            return res_graph
+            graph_nodes, graph_edges = graph.batch_meta.graph_nodes, graph.batch_meta.graph_edges
+        else:
+            graph_nodes, graph_edges = np.array([0, graph.node_count]), np.array([0, graph.edge_count])
+        ####################################
+        # Pad Graph
+        ####################################
+        res_graph = MindHomoGraph()
+        res_graph.adj_coo = adj_coo
+        res_graph_graph_nodes = np.concatenate([graph_nodes, [n_node]]).astype(get_index_dtype(n_node))
+        res_graph_graph_edges = np.concatenate([graph_edges, [n_edge]]).astype(get_index_dtype(n_edge))
+        res_graph.batch_meta = BatchMeta(graph_nodes=res_graph_graph_nodes, graph_edges=res_graph_graph_edges)
+        res_graph.edge_count = n_edge
+        res_graph.node_count = n_node
+        return res_graph
+
+    def padding_stats(self) -> PaddingStats:
+        """
+        Statistics of the paddings done by this operator, sizes are node count plus edge count and shapes are
+        (node count, edge count) pairs, see PaddingRecorder.stats.
+
+        Returns:
+            PaddingStats, padding overhead and number of distinct padded shapes.
+        """
+        return self.recorder.stats()
+
+
+def _pad_single_graph(graph: MindHomoGraph, n_node, n_edge) -> MindHomoGraph:
+    """batch graph with a pad graph whose edges all point to the last padded node"""
+    pad_node_count = n_node - graph.node_count
+    pad_edge_count = n_edge - graph.edge_count
+    # ids of pad graph are local, offset by graph.node_count in batching
+    adj_coo = np.concatenate([graph.adj_coo, np.full([2, pad_edge_count], pad_node_count - 1,
+                                                     dtype=get_index_dtype(n_node))], axis=1)
+    return BatchHomoGraph.from_coo(adj_coo, [graph.node_count, pad_node_count], [graph.edge_count, pad_edge_count],
+                                   out=adj_coo)
+
+
+class PadHeteroGraph:
+    """
+    Pad MindHeteroGraph with one padding plan for all node types and relations. Like PadHomoGraph, a fake graph is
+    batched after the input graph: it adds nodes of each type, and pad edges of each relation connect the last
+    padded node of the source type to the last padded node of the destination type. Padded graphs of the same
+    plan share the same shapes, so models are not recompiled for each batch.
+
+    Args:
+        n_nodes(Dict[str, int]): target node count of each node type.
+        n_edges(Dict[str, int]): target edge count of each relation type.
+        mode(PadMode): Pad mode, if PadMode.CONST, target graph has `n_nodes` nodes and `n_edges` edges. If
+            PadMode.AUTO, target counts are calculated according to input graph's size by
+            n_node = 2^ceil(log2(node_count + 1)) for each node type, so that there is at least one padded node,
+            n_edge = 2^ceil(log2(edge_count)) for each relation.
+    """
+
+    def __init__(self, n_nodes: Dict[str, int] = None, n_edges: Dict[str, int] = None, mode=PadMode.AUTO):
+        if mode == PadMode.CONST:
+            assert n_nodes is not None and n_edges is not None, \
+                "n_nodes and n_edges should be given when padding with CONST Mode"
+        self.n_nodes = n_nodes
+        self.n_edges = n_edges
+        self.mode = mode
+
+    def __call__(self, graph: MindHeteroGraph, **kwargs) -> MindHeteroGraph:
+        """
+        Do pad operation.
+
+        Args:
+            graph(MindHeteroGraph): input graph, batched or not.
+
+        Returns:
+            MindHeteroGraph, padded graph, batched with the fake graph as its last graph.
+        """
+        node_counts = {node_type: graph.node_count(node_type) for node_type in graph.node_types}
+        edge_counts = {relation_type: graph.get_graph(relation_type).edge_num
+                       for relation_type in graph.relation_types}
         if self.mode == PadMode.CONST:
-            ###############################
-            # No Need To Pad
-            ###############################
-            if graph.edge_count == self.n_edge:
-                return graph
-            ############################
-            # Determine Pad Graph
-            ############################
-            pad_graph_coo = np.full([2, self.n_edge - graph.edge_count], self.n_node - 1, dtype=np.int32)
-            pad_graph = MindHomoGraph()
-            pad_graph.adj_coo = pad_graph_coo
-            pad_graph.node_count = self.n_node - graph.node_count
-            pad_graph.edge_count = self.n_edge - graph.edge_count
-            return self.batch_op([graph, pad_graph])
-        ###########################
-        # No Need To Pad
-        ###########################
-        if graph.edge_count == 1 << math.ceil(math.log2(graph.edge_count)):
-            return graph
-
-        edge_bucket_length = math.ceil(math.log2(graph.edge_count))
-        padded_graph_edge_count = (1 << edge_bucket_length) - graph.edge_count
-        padded_graph_node_count = (1 << math.ceil(math.log2(graph.node_count))) - graph.node_count
-        pad_graph = MindHomoGraph()
-        pad_value = (1 << math.ceil(math.log2(graph.node_count))) - 1
-        pad_graph.adj_coo = np.full([2, padded_graph_edge_count], pad_value, dtype=np.int32)
-        pad_graph.node_count = padded_graph_node_count
-        pad_graph.edge_count = padded_graph_edge_count
-        return self.batch_op([graph, pad_graph])
+            n_nodes, n_edges = self.n_nodes, self.n_edges
+            for node_type, node_count in node_counts.items():
+                assert node_count < n_nodes[node_type], f"Given graph has too many {node_type} nodes for the padding"
+            for relation_type, edge_count in edge_counts.items():
+                assert edge_count <= n_edges[relation_type], \
+                    f"Given graph has too many {relation_type} edges for the padding"
+        else:
+            n_nodes = {key: 1 << math.ceil(math.log2(value + 1)) for key, value in node_counts.items()}
+            n_edges = {key: 1 << math.ceil(math.log2(max(value, 1))) for key, value in edge_counts.items()}
+
+        res_graph = MindHeteroGraph()
+        for relation_type in graph.relation_types:
+            rel_graph = graph.get_graph(relation_type)
+            src_type, dst_type = rel_graph.src_node_type, rel_graph.dst_node_type
+            adj_csr = _decompressed(rel_graph.adj_csr)
+            pad_edge_count = n_edges[relation_type] - edge_counts[relation_type]
+            index_dtype = get_index_dtype(n_nodes[dst_type])
+            edge_dtype = get_index_dtype(n_edges[relation_type])
+            # rows of padded source nodes are empty except the last one, which holds all pad edges
+            indptr = np.full([n_nodes[src_type] + 1], adj_csr.indptr[-1], dtype=edge_dtype)
+            indptr[:adj_csr.indptr.shape[0]] = adj_csr.indptr
+            indptr[-1] += pad_edge_count
+            indices = np.concatenate([adj_csr.indices.astype(index_dtype, copy=False),
+                                      np.full([pad_edge_count], n_nodes[dst_type] - 1, dtype=index_dtype)])
+            res_rel_graph = MindRelationGraph(src_type, dst_type, rel_graph.edge_type)
+            res_rel_graph.set_topo(CsrAdj(indptr=indptr, indices=indices), dst_node_num=n_nodes[dst_type])
+            res_graph.add_graph(res_rel_graph)
+        for node_type, node_count in n_nodes.items():
+            res_graph.set_node_count(node_type, node_count)
+
+        if graph.is_batched:
+            graph_nodes, graph_edges = graph.batch_meta.graph_nodes, graph.batch_meta.graph_edges
+        else:
+            graph_nodes = {key: np.array([0, value], dtype=np.int64) for key, value in node_counts.items()}
+            graph_edges = {key: np.array([0, value], dtype=np.int64) for key, value in edge_counts.items()}
+        res_graph.batch_meta = HeteroBatchMeta(
+            {key: np.append(value, n_nodes[key]).astype(get_index_dtype(n_nodes[key]))
+             for key, value in graph_nodes.items()},
+            {key: np.append(value, n_edges[key]).astype(get_index_dtype(n_edges[key]))
+             for key, value in graph_edges.items()})
+        return res_graph
 
 
 class UnPadHomoGraph:
-    """Empty placeholder"""
+    """
+    Remove the fake graph added by PadHomoGraph. The returned graph shares the coo of the padded graph, so no copy
+    is made. If only one real graph is left, e.g. a padded single graph, it is returned as an unbatched graph.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.graph import MindHomoGraph
+        >>> from mindspore_gl.graph.ops import PadHomoGraph, UnPadHomoGraph, PadMode
+        >>> graph = MindHomoGraph()
+        >>> graph.set_topo_coo(np.array([[0, 1, 2], [1, 2, 0]]))
+        >>> graph.node_count, graph.edge_count = 3, 3
+        >>> padded = PadHomoGraph(mode=PadMode.AUTO)(graph)
+        >>> unpadded = UnPadHomoGraph()(padded)
+        >>> print(padded.node_count, padded.edge_count, unpadded.node_count, unpadded.edge_count)
+        4 4 3 3
+    """
 
     def __init__(self):
         pass
 
     def __call__(self, graph: MindHomoGraph, **kwargs) -> MindHomoGraph:
-        pass
+        """
+        Do unpad operation.
+
+        Args:
+            graph(MindHomoGraph): padded graph, batched with the fake graph as its last graph.
+
+        Returns:
+            MindHomoGraph, graph without the fake graph.
+        """
+        assert graph.is_batched, "UnPadHomoGraph can only be operated on padded graph"
+        batch_meta = graph.batch_meta
+        node_count = int(batch_meta.graph_nodes[-2])
+        edge_count = int(batch_meta.graph_edges[-2])
+        res_graph = MindHomoGraph()
+        res_graph.set_topo_coo(graph.adj_coo[:, :edge_count])
+        res_graph.node_count = node_count
+        res_graph.edge_count = edge_count
+        if batch_meta.graph_count > 2:
+            res_graph.batch_meta = BatchMeta(graph_nodes=batch_meta.graph_nodes[:-1],
+                                             graph_edges=batch_meta.graph_edges[:-1])
+        return res_graph
+
+
+def unpad_node_feat(node_feat, batch_meta: BatchMeta):
+    """
+    Remove rows of padded nodes from node features or node outputs of a graph padded by PadHomoGraph.
+
+    Args:
+        node_feat(Union[numpy.ndarray, mindspore.Tensor]): node features, the first dim is padded node count.
+        batch_meta(BatchMeta): batch meta of the padded graph.
+
+    Returns:
+        Union[numpy.ndarray, mindspore.Tensor], features of real nodes, a view for numpy arrays.
+    """
+    return node_feat[:int(batch_meta.graph_nodes[-2])]
+
+
+def unpad_edge_feat(edge_feat, batch_meta: BatchMeta):
+    """
+    Remove rows of padded edges from edge features or edge outputs of a graph padded by PadHomoGraph.
+
+    Args:
+        edge_feat(Union[numpy.ndarray, mindspore.Tensor]): edge features, the first dim is padded edge count.
+        batch_meta(BatchMeta): batch meta of the padded graph.
+
+    Returns:
+        Union[numpy.ndarray, mindspore.Tensor], features of real edges, a view for numpy arrays.
+    """
+    return edge_feat[:int(batch_meta.graph_edges[-2])]
+
+
+def unpad_graph_feat(graph_feat, batch_meta: BatchMeta):
+    """
+    Remove the row of the fake graph from graph level outputs, e.g. readout results, of a graph padded by
+    PadHomoGraph.
+
+    Args:
+        graph_feat(Union[numpy.ndarray, mindspore.Tensor]): graph level features, the first dim is graph count
+            including the fake graph.
+        batch_meta(BatchMeta): batch meta of the padded graph.
+
+    Returns:
+        Union[numpy.ndarray, mindspore.Tensor], features of real graphs, a view for numpy arrays.
+    """
+    return graph_feat[:batch_meta.graph_count - 1]
@@ -0,0 +1,250 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Streaming edge-cut graph partition."""
+from typing import List
+import os.path as osp
+import numpy as np
+from .graph import MindHomoGraph, CsrAdj, gather_csr_rows, get_index_dtype
+from .node_map import NodeIdMap
+from .store import GraphStore, save_graph_store
+
+
+def _neighbor_part_counts(graph: MindHomoGraph, nodes: np.ndarray, parts: np.ndarray, num_parts: int):
+    """count assigned neighbors of each node in each part, edge direction is ignored"""
+    counts = np.zeros([nodes.shape[0] * num_parts], dtype=np.int64)
+    for adj in (graph.adj_csr, graph.adj_csc):
+        indptr, neighbors = gather_csr_rows(adj, nodes)
+        owner = parts[neighbors]
+        row = np.repeat(np.arange(nodes.shape[0]), np.diff(indptr))
+        assigned = owner >= 0
+        counts += np.bincount(row[assigned] * num_parts + owner[assigned], minlength=counts.shape[0])
+    return counts.reshape([nodes.shape[0], num_parts])
+
+
+def partition_graph(graph: MindHomoGraph, num_parts: int, method="ldg", balance_slack=0.05, chunk_size=1024,
+                    num_passes=1, shuffle=False, seed=0) -> np.ndarray:
+    """
+    Partition nodes by a streaming heuristic, each node is placed in the part holding most of its neighbors,
+    penalized by part size. Nodes are streamed in chunks, node placements of a chunk are computed together
+    from placements of previous chunks. More passes restream nodes with placements of the last pass.
+
+    - ldg: linear deterministic greedy, score is `|N(v) ∩ P| * (1 - |P| / capacity)`.
+    - fennel: score is `|N(v) ∩ P| - alpha * gamma * |P| ^ (gamma - 1)` with gamma = 1.5.
+
+    Args:
+        graph(MindHomoGraph): graph to partition.
+        num_parts(int): part count.
+        method(str): 'ldg' or 'fennel'.
+        balance_slack(float): parts hold at most `(1 + balance_slack) * node_count / num_parts` nodes.
+        chunk_size(int): node count placed together.
+        num_passes(int): streaming pass count.
+        shuffle(bool): if True, stream nodes in random order, else in node id order.
+        seed(int): random seed for shuffle.
+
+    Returns:
+        numpy.ndarray, part id of each node.
+
+    Raises:
+        ValueError: if `method` is not supported.
+    """
+    if method not in ("ldg", "fennel"):
+        raise ValueError(f"partition method should be 'ldg' or 'fennel', but got {method}")
+    node_count = graph.node_count
+    capacity = int(np.ceil((1 + balance_slack) * node_count / num_parts))
+    gamma = 1.5
+    alpha = graph.edge_count * num_parts ** (gamma - 1) / max(node_count, 1) ** gamma
+    order = np.random.RandomState(seed).permutation(node_count) if shuffle else np.arange(node_count)
+
+    parts = np.full([node_count], -1, dtype=np.int32)
+    sizes = np.zeros([num_parts], dtype=np.int64)
+    for _ in range(num_passes):
+        for start in range(0, node_count, chunk_size):
+            nodes = order[start: start + chunk_size]
+            old_parts = parts[nodes]
+            np.subtract.at(sizes, old_parts[old_parts >= 0], 1)
+            parts[nodes] = -1
+            counts = _neighbor_part_counts(graph, nodes, parts, num_parts)
+            if method == "ldg":
+                scores = counts * (1 - sizes / capacity)
+            else:
+                scores = counts - alpha * gamma * np.power(sizes, gamma - 1)
+            scores[:, sizes >= capacity] = -np.inf
+            choice = np.argmax(scores, axis=1)
+            # nodes without placed neighbors go round robin to the least loaded parts
+            lonely = np.flatnonzero(counts.max(axis=1) == 0)
+            open_parts = np.argsort(sizes, kind="stable")
+            open_parts = open_parts[sizes[open_parts] < capacity]
+            if open_parts.shape[0] > 0:
+                choice[lonely] = open_parts[np.arange(lonely.shape[0]) % open_parts.shape[0]]
+            choice = _enforce_capacity(choice, sizes, capacity)
+            parts[nodes] = choice
+            sizes += np.bincount(choice, minlength=num_parts)
+    return parts
+
+
+def _enforce_capacity(choice: np.ndarray, sizes: np.ndarray, capacity: int):
+    """move nodes placed over capacity in one chunk to the least loaded parts"""
+    num_parts = sizes.shape[0]
+    order = np.argsort(choice, kind="stable")
+    sorted_choice = choice[order]
+    rank = np.arange(choice.shape[0]) - np.searchsorted(sorted_choice, sorted_choice)
+    overflow = order[sizes[sorted_choice] + rank >= capacity]
+    if overflow.shape[0] == 0:
+        return choice
+    new_sizes = sizes + np.bincount(choice, minlength=num_parts)
+    new_sizes -= np.bincount(choice[overflow], minlength=num_parts)
+    free = np.maximum(capacity - new_sizes, 0)
+    choice[overflow] = np.repeat(np.arange(num_parts), free)[:overflow.shape[0]]
+    return choice
+
+
+def edge_cut(graph: MindHomoGraph, parts: np.ndarray) -> float:
+    """
+    Ratio of edges whose endpoints are in different parts.
+
+    Args:
+        graph(MindHomoGraph): partitioned graph.
+        parts(numpy.ndarray): part id of each node.
+
+    Returns:
+        float, edge cut ratio.
+    """
+    adj_coo = graph.adj_coo
+    return float(np.mean(parts[adj_coo[0]] != parts[adj_coo[1]])) if adj_coo.shape[1] > 0 else 0.
+
+
+class GraphPartition:
+    """
+    A part of a partitioned graph. Local nodes are the inner nodes of the part followed by its 1-hop halo
+    nodes, i.e. out neighbors of inner nodes placed in other parts. Inner nodes keep all their out edges,
+    halo nodes have no out edges. Global node ids and edge ids are kept in the node map and edge ids of
+    `graph`.
+
+    Args:
+        graph(MindHomoGraph): local graph of the part.
+        part_id(int): part id.
+        inner_node_count(int): inner node count.
+    """
+
+    def __init__(self, graph: MindHomoGraph, part_id: int, inner_node_count: int):
+        self.graph = graph
+        self.part_id = part_id
+        self.inner_node_count = inner_node_count
+
+    @property
+    def node_map(self) -> NodeIdMap:
+        """local<->global node id mapping"""
+        return self.graph.node_map
+
+    @property
+    def inner_nodes(self) -> np.ndarray:
+        """global ids of inner nodes"""
+        return self.node_map.global_ids[:self.inner_node_count]
+
+    @property
+    def halo_nodes(self) -> np.ndarray:
+        """global ids of halo nodes"""
+        return self.node_map.global_ids[self.inner_node_count:]
+
+    def is_inner(self, local_ids):
+        """if local nodes are inner nodes"""
+        return local_ids < self.inner_node_count
+
+
+def build_partitions(graph: MindHomoGraph, parts: np.ndarray, num_parts: int = None) -> List[GraphPartition]:
+    """
+    Build local csr with halo nodes for each part.
+
+    Args:
+        graph(MindHomoGraph): graph to split, node ids of `parts` are local ids of `graph`.
+        parts(numpy.ndarray): part id of each node.
+        num_parts(int): part count, inferred from `parts` if not given.
+
+    Returns:
+        List[GraphPartition], partition of each part.
+    """
+    num_parts = int(parts.max()) + 1 if num_parts is None else num_parts
+    adj_csr = graph.adj_csr
+    global_ids = graph.node_map.global_ids
+    node_order = np.argsort(parts, kind="stable")
+    part_offsets = np.searchsorted(parts[node_order], np.arange(num_parts + 1))
+    res = []
+    for part_id in range(num_parts):
+        inner = node_order[part_offsets[part_id]: part_offsets[part_id + 1]]
+        indptr, neighbors, positions = gather_csr_rows(adj_csr, inner, return_positions=True)
+        halo = np.unique(neighbors[parts[neighbors] != part_id])
+        local_nodes = np.concatenate([inner, halo])
+        local_map = NodeIdMap(global_ids=local_nodes)
+        index_dtype = get_index_dtype(local_nodes.shape[0])
+        local_indptr = np.concatenate([indptr, np.full([halo.shape[0]], indptr[-1], dtype=indptr.dtype)])
+        local_csr = CsrAdj(indptr=local_indptr, indices=local_map.to_local(neighbors).astype(index_dtype))
+        edge_ids = graph.csr_edge_ids(positions)
+        part_graph = MindHomoGraph()
+        part_graph.set_topo(local_csr, NodeIdMap(global_ids=global_ids[local_nodes]), edge_ids)
+        res.append(GraphPartition(part_graph, part_id, inner.shape[0]))
+    return res
+
+
+def save_partitions(path: str, graph: MindHomoGraph, parts: np.ndarray, num_parts: int = None, **arrays):
+    """
+    Split graph and node arrays by part and save them into graph stores, part `i` is saved in
+    `path/part_{i}` and the part id of each node in `path`. A rank can then load only its own part by
+    :func:`load_partition`.
+
+    Args:
+        path(str): directory of the partition.
+        graph(MindHomoGraph): graph to split.
+        parts(numpy.ndarray): part id of each node.
+        num_parts(int): part count, inferred from `parts` if not given.
+        arrays(numpy.ndarray): node arrays such as features, labels or masks, sliced for local nodes of each part.
+    """
+    partitions = build_partitions(graph, parts, num_parts)
+    for partition in partitions:
+        local_nodes = partition.node_map.global_ids if graph.node_map.is_identity else \
+            graph.node_map.to_local(partition.node_map.global_ids)
+        partition.graph.to_store(osp.join(path, f"part_{partition.part_id}"),
+                                 meta={"part_id": partition.part_id, "inner_node_count": partition.inner_node_count},
+                                 **{name: array[local_nodes] for name, array in arrays.items()})
+    save_graph_store(path, {"parts": parts}, {"format": "partition", "num_parts": len(partitions),
+                                              "edge_cut": edge_cut(graph, parts)})
+
+
+def load_partition(path: str, part_id: int, mmap=True) -> GraphPartition:
+    """
+    Load a part saved by :func:`save_partitions`, node arrays are available in `partition.graph.store`.
+
+    Args:
+        path(str): directory of the partition.
+        part_id(int): part id to load.
+        mmap(bool): if True, memory map the arrays.
+
+    Returns:
+        GraphPartition, the loaded part.
+    """
+    graph = MindHomoGraph.from_store(osp.join(path, f"part_{part_id}"), mmap)
+    return GraphPartition(graph, part_id, graph.store.meta["inner_node_count"])
+
+
+def load_parts(path: str) -> np.ndarray:
+    """
+    Load part id of each node saved by :func:`save_partitions`.
+
+    Args:
+        path(str): directory of the partition.
+
+    Returns:
+        numpy.ndarray, part id of each node.
+    """
+    return GraphStore(path)["parts"]
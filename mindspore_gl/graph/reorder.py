@@ -0,0 +1,314 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Locality improving node reordering."""
+from typing import Tuple
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import reverse_cuthill_mckee, connected_components
+from .graph import MindHomoGraph, CsrAdj, gather_csr_rows, node_index_dtype, _decompressed
+from .node_map import NodeIdMap
+
+
+class NodePermutation:
+    """
+    Node permutation of a graph, new node `i` is old node `perm[i]`. Gather and scatter of node features
+    along edges touch memory in node id order, so a permutation placing neighbors close to each other
+    improves cache locality.
+
+    Args:
+        perm(numpy.ndarray): old node id of each new node.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.reorder import NodePermutation
+        >>> permutation = NodePermutation(np.array([2, 0, 1]))
+        >>> feat = np.array([10., 20., 30.])
+        >>> new_feat = permutation.apply(feat)
+        >>> print(new_feat, permutation.restore(new_feat))
+        [30. 10. 20.] [10. 20. 30.]
+    """
+
+    def __init__(self, perm: np.ndarray):
+        self._perm = np.asarray(perm)
+
+        #######################
+        # For Lazy Computation
+        #######################
+        self._inv_perm = None
+
+    @property
+    def perm(self) -> np.ndarray:
+        """old node id of each new node"""
+        return self._perm
+
+    @property
+    def inv_perm(self) -> np.ndarray:
+        """new node id of each old node"""
+        if self._inv_perm is None:
+            self._inv_perm = np.empty_like(self._perm)
+            self._inv_perm[self._perm] = np.arange(self._perm.shape[0], dtype=self._perm.dtype)
+        return self._inv_perm
+
+    def to_new(self, old_ids):
+        """map old node ids to new node ids"""
+        return self.inv_perm[old_ids]
+
+    def to_old(self, new_ids):
+        """map new node ids to old node ids"""
+        return self._perm[new_ids]
+
+    def apply(self, array: np.ndarray, axis=0) -> np.ndarray:
+        """
+        Reorder node array, e.g. features, labels or masks.
+
+        Args:
+            array(numpy.ndarray): array indexed by old node id along `axis`.
+            axis(int): node axis of `array`.
+
+        Returns:
+            numpy.ndarray, array indexed by new node id.
+        """
+        return np.take(array, self._perm, axis=axis)
+
+    def restore(self, array: np.ndarray, axis=0) -> np.ndarray:
+        """
+        Map node array back to old node order, e.g. predictions on the reordered graph.
+
+        Args:
+            array(numpy.ndarray): array indexed by new node id along `axis`.
+            axis(int): node axis of `array`.
+
+        Returns:
+            numpy.ndarray, array indexed by old node id.
+        """
+        return np.take(array, self.inv_perm, axis=axis)
+
+    def apply_coo(self, adj_coo: np.ndarray) -> np.ndarray:
+        """
+        Relabel nodes of coo format adjacent matrix, edge order is kept.
+
+        Args:
+            adj_coo(numpy.ndarray): coo with old node ids.
+
+        Returns:
+            numpy.ndarray, coo with new node ids.
+        """
+        return self.inv_perm[adj_coo].astype(adj_coo.dtype, copy=False)
+
+    def apply_csr(self, adj_csr: CsrAdj) -> Tuple[CsrAdj, np.ndarray]:
+        """
+        Reorder rows and relabel columns of csr format adjacent matrix.
+
+        Args:
+            adj_csr(Union[CsrAdj, CompressedCsrAdj]): csr with old node ids, compressed csr is decoded.
+
+        Returns:
+            - **adj_csr** (CsrAdj) - csr with new node ids.
+            - **positions** (numpy.ndarray) - old csr position of each new csr edge.
+        """
+        indptr, indices, positions = gather_csr_rows(adj_csr, self._perm, return_positions=True)
+        indices = self.inv_perm[indices].astype(node_index_dtype(adj_csr), copy=False)
+        return CsrAdj(indptr=indptr, indices=indices), positions
+
+    def apply_graph(self, graph: MindHomoGraph) -> MindHomoGraph:
+        """
+        Reorder graph. Global node ids and edge ids are kept, so queries by global id on the reordered
+        graph give the same result.
+
+        Args:
+            graph(MindHomoGraph): graph to reorder.
+
+        Returns:
+            MindHomoGraph, the reordered graph.
+        """
+        adj_csr, positions = self.apply_csr(graph.adj_csr)
+        edge_ids = graph.csr_edge_ids(positions)
+        node_map = graph.node_map
+        global_ids = self._perm if node_map.is_identity else node_map.global_ids[self._perm]
+        res = MindHomoGraph()
+        res.set_topo(adj_csr, NodeIdMap(global_ids=global_ids), edge_ids)
+        return res
+
+
+def degree_order(graph: MindHomoGraph) -> NodePermutation:
+    """
+    Order nodes by descending degree, so that frequently gathered hub nodes share cache lines.
+
+    Args:
+        graph(MindHomoGraph): graph to reorder.
+
+    Returns:
+        NodePermutation, the permutation.
+    """
+    degree = np.diff(graph.adj_csr.indptr) + np.diff(graph.adj_csc.indptr)
+    return NodePermutation(np.argsort(-degree, kind='stable'))
+
+
+def bfs_order(graph: MindHomoGraph) -> NodePermutation:
+    """
+    Order nodes by breadth first search ignoring edge direction, each level is expanded in one vectorized step.
+    Components are visited from their lowest degree node, isolated nodes are placed last.
+
+    Args:
+        graph(MindHomoGraph): graph to reorder.
+
+    Returns:
+        NodePermutation, the permutation.
+    """
+    adj_csr, adj_csc = graph.adj_csr, graph.adj_csc
+    node_count = adj_csr.indptr.shape[0] - 1
+    degree = np.diff(adj_csr.indptr) + np.diff(adj_csc.indptr)
+    visited = degree == 0
+    isolated = np.flatnonzero(visited)
+    roots = np.argsort(degree, kind='stable')[isolated.shape[0]:]
+    order = np.empty([node_count], dtype=np.int64)
+    order[node_count - isolated.shape[0]:] = isolated
+    count = 0
+    root_idx = 0
+    while count < node_count - isolated.shape[0]:
+        while visited[roots[root_idx]]:
+            root_idx += 1
+        frontier = roots[root_idx: root_idx + 1]
+        while frontier.shape[0] > 0:
+            visited[frontier] = True
+            order[count: count + frontier.shape[0]] = frontier
+            count += frontier.shape[0]
+            neighbors = np.concatenate([gather_csr_rows(adj_csr, frontier)[1], gather_csr_rows(adj_csc, frontier)[1]])
+            neighbors = neighbors[~visited[neighbors]]
+            # keep first visit order of each new node
+            _, first_idx = np.unique(neighbors, return_index=True)
+            frontier = neighbors[np.sort(first_idx)]
+    return NodePermutation(order)
+
+
+def rcm_order(graph: MindHomoGraph) -> NodePermutation:
+    """
+    Order nodes by reverse Cuthill-McKee, which reduces bandwidth of the adjacent matrix.
+
+    Args:
+        graph(MindHomoGraph): graph to reorder.
+
+    Returns:
+        NodePermutation, the permutation.
+    """
+    adj_csr = _decompressed(graph.adj_csr)
+    node_count = adj_csr.indptr.shape[0] - 1
+    matrix = sp.csr_matrix((np.ones(adj_csr.indices.shape[0], dtype=np.int8), adj_csr.indices, adj_csr.indptr),
+                           shape=(node_count, node_count))
+    return NodePermutation(reverse_cuthill_mckee(matrix, symmetric_mode=False).astype(np.int64))
+
+
+def _merge_round(matrix: sp.csr_matrix, total_weight: float):
+    """
+    one aggregation round, each community joins the neighbor community of the largest positive modularity
+    gain, returns the community of each input community and the community count
+    """
+    count = matrix.shape[0]
+    strength = np.asarray(matrix.sum(axis=1)).ravel()
+    coo = sp.triu(matrix, k=1).tocoo()
+    row = np.concatenate([coo.row, coo.col])
+    col = np.concatenate([coo.col, coo.row])
+    weight = np.concatenate([coo.data, coo.data])
+    gain = weight / total_weight - strength[row] * strength[col] / (2 * total_weight * total_weight)
+    positive = gain > 0
+    row, col, gain = row[positive], col[positive], gain[positive]
+    if row.shape[0] == 0:
+        return np.arange(count), count
+    # best neighbor of each row, the last of each row after sorting by (row, gain)
+    order = np.lexsort((gain, row))
+    row, col = row[order], col[order]
+    last = np.append(row[1:] != row[:-1], True)
+    best = sp.csr_matrix((np.ones(np.count_nonzero(last), dtype=np.int8), (row[last], col[last])),
+                         shape=(count, count))
+    return connected_components(best, directed=True, connection="weak")[::-1]
+
+
+def rabbit_order(graph: MindHomoGraph, max_levels=16) -> NodePermutation:
+    """
+    Rabbit style ordering. Communities are built bottom up by rounds of modularity gain aggregation, where
+    each community joins its best neighbor community, like the incremental aggregation of Rabbit Order.
+    Nodes are then ordered by the community hierarchy from the top level down, so each community at every
+    level is a contiguous id range. Aggregation rounds are vectorized instead of run concurrently per vertex.
+
+    Args:
+        graph(MindHomoGraph): graph to reorder.
+        max_levels(int): maximum aggregation rounds.
+
+    Returns:
+        NodePermutation, the permutation.
+    """
+    adj_csr = _decompressed(graph.adj_csr)
+    node_count = adj_csr.indptr.shape[0] - 1
+    matrix = sp.csr_matrix((np.ones(adj_csr.indices.shape[0]), adj_csr.indices, adj_csr.indptr),
+                           shape=(node_count, node_count))
+    # undirected weights, self loops only add to community strength
+    matrix = (matrix + matrix.T).tocsr()
+    total_weight = matrix.sum() / 2
+    community = np.arange(node_count)
+    levels = []
+    for _ in range(max_levels):
+        if total_weight == 0:
+            break
+        merged, count = _merge_round(matrix, total_weight)
+        if count == matrix.shape[0]:
+            break
+        community = merged[community]
+        levels.append(community)
+        assign = sp.csr_matrix((np.ones(merged.shape[0]), (np.arange(merged.shape[0]), merged)),
+                               shape=(merged.shape[0], count))
+        matrix = (assign.T @ matrix @ assign).tocsr()
+    # lexsort uses the last key as primary key, so top level communities come last
+    return NodePermutation(np.lexsort([np.arange(node_count)] + levels).astype(np.int64))
+
+
+_ORDERS = {
+    "degree": degree_order,
+    "bfs": bfs_order,
+    "rcm": rcm_order,
+    "rabbit": rabbit_order,
+}
+
+
+def reorder(graph: MindHomoGraph, method="rcm") -> Tuple[MindHomoGraph, NodePermutation]:
+    """
+    Reorder nodes of graph to improve memory locality of gather and scatter along edges.
+    Node features, labels and masks should be reordered by the returned permutation as well, and
+    predictions can be mapped back by :func:`NodePermutation.restore`.
+
+    Args:
+        graph(MindHomoGraph): graph to reorder.
+        method(str): ordering method, one of 'degree', 'bfs', 'rcm' and 'rabbit'.
+
+    Returns:
+        - **graph** (MindHomoGraph) - the reordered graph.
+        - **permutation** (NodePermutation) - the node permutation.
+
+    Raises:
+        ValueError: if `method` is not supported.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.graph import MindHomoGraph
+        >>> from mindspore_gl.graph.reorder import reorder
+        >>> graph = MindHomoGraph()
+        >>> graph.set_topo_coo(np.array([[0, 2, 1], [2, 0, 3]]))
+        >>> new_graph, permutation = reorder(graph, "bfs")
+        >>> print(permutation.perm)
+        [1 3 0 2]
+    """
+    if method not in _ORDERS:
+        raise ValueError(f"reorder method should be one of {list(_ORDERS)}, but got {method}")
+    permutation = _ORDERS[method](graph)
+    return permutation.apply_graph(graph), permutation
@@ -0,0 +1,177 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Graph statistics and profiling report."""
+from collections import namedtuple
+import argparse
+import importlib
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+
+DegreeSummary = namedtuple("DegreeSummary", ['min', 'mean', 'p50', 'p90', 'p99', 'max', 'histogram'])
+
+
+def _degree_summary(degrees: np.ndarray) -> DegreeSummary:
+    """summary of degrees, histogram[i] counts degrees in [2^(i-1), 2^i), histogram[0] counts zero degrees"""
+    if degrees.shape[0] == 0:
+        return DegreeSummary(0, 0., 0, 0, 0, 0, np.zeros([1], dtype=np.int64))
+    # the "higher" percentile, np.percentile only takes a method argument from numpy 1.22
+    sorted_degrees = np.sort(degrees)
+    p50, p90, p99 = sorted_degrees[np.ceil(np.array([0.5, 0.9, 0.99]) * (degrees.shape[0] - 1)).astype(np.int64)]
+    # exponent of frexp is the bit length of an integer
+    histogram = np.bincount(np.frexp(degrees.astype(np.float64))[1])
+    return DegreeSummary(int(degrees.min()), float(degrees.mean()), int(p50), int(p90), int(p99),
+                         int(degrees.max()), histogram)
+
+
+def _varint_bytes(values: np.ndarray) -> int:
+    """total size of values encoded as base-128 varints"""
+    size = values.shape[0]
+    for shift in range(7, 64, 7):
+        size += int(np.count_nonzero(values >= (1 << shift)))
+    return size
+
+
+class GraphStats:
+    """
+    Statistics of a graph topology, computed from csr with vectorized numpy operations.
+
+    Args:
+        indptr(numpy.ndarray): csr indptr.
+        indices(numpy.ndarray): csr indices.
+        node_count(int): node count, at least the row count of csr.
+        block_size(int): block size for the compressed csr size estimation.
+
+    Attributes:
+        node_count(int): node count.
+        edge_count(int): edge count.
+        out_degree(DegreeSummary): out degree min, mean, percentiles, max and power of two histogram.
+        in_degree(DegreeSummary): in degree summary.
+        isolated_node_count(int): nodes without any in or out edge.
+        self_loop_count(int): edges from a node to itself.
+        duplicate_edge_count(int): edges that repeat an earlier edge with the same end nodes.
+        component_count(int): weakly connected component count.
+        largest_component_size(int): node count of the largest weakly connected component.
+        format_bytes(Dict[str, int]): estimated memory of csr, csc, coo and compressed csr topology.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, node_count=None, block_size=64):
+        row_count = indptr.shape[0] - 1
+        node_count = row_count if node_count is None else node_count
+        edge_count = int(indptr[-1])
+        out_degrees = np.zeros([node_count], dtype=np.int64)
+        out_degrees[:row_count] = np.diff(indptr)
+        in_degrees = np.bincount(indices, minlength=node_count)
+        rows = np.repeat(np.arange(row_count, dtype=np.int64), out_degrees[:row_count])
+
+        self.node_count = node_count
+        self.edge_count = edge_count
+        self.out_degree = _degree_summary(out_degrees)
+        self.in_degree = _degree_summary(in_degrees)
+        self.isolated_node_count = int(np.count_nonzero((out_degrees == 0) & (in_degrees == 0)))
+        self.self_loop_count = int(np.count_nonzero(rows == indices))
+
+        keys = rows * max(node_count, 1) + indices
+        keys.sort()
+        is_first = np.concatenate([[True], keys[1:] != keys[:-1]]) if edge_count > 0 else keys.astype(bool)
+        self.duplicate_edge_count = edge_count - int(np.count_nonzero(is_first))
+
+        adj = sp.csr_matrix((np.ones([edge_count], dtype=np.int8), indices, indptr), shape=(row_count, node_count))
+        if row_count < node_count:
+            adj.resize((node_count, node_count))
+        self.component_count, labels = connected_components(adj, directed=True, connection='weak')
+        self.largest_component_size = int(np.bincount(labels).max()) if node_count > 0 else 0
+
+        # compressed csr stores the first neighbor of each block and gaps between sorted neighbors as varints,
+        # keys are sorted by row first, so row of each sorted key is unchanged
+        sorted_cols = keys - rows * max(node_count, 1)
+        rank = np.arange(edge_count, dtype=np.int64) - np.repeat(indptr[:-1], out_degrees[:row_count])
+        block_starts = rank % block_size == 0
+        gaps = np.diff(sorted_cols, prepend=np.int64(0))
+        gaps[block_starts] = sorted_cols[block_starts]
+        block_count = int(np.count_nonzero(block_starts))
+        csr_bytes = indptr.nbytes + indices.nbytes
+        self.format_bytes = {
+            "csr": csr_bytes,
+            "csc": csr_bytes,
+            "coo": 2 * indices.nbytes,
+            "compressed_csr": 16 * (row_count + 1) + 8 * (block_count + 1) + _varint_bytes(gaps),
+        }
+
+    def to_dict(self):
+        """
+        Statistics as a dict.
+
+        Returns:
+            Dict, statistics keyed by attribute name, degree summaries are dicts as well.
+        """
+        res = dict(self.__dict__)
+        for key in ("out_degree", "in_degree"):
+            res[key] = res[key]._asdict()
+            res[key]["histogram"] = res[key]["histogram"].tolist()
+        return res
+
+    def report(self) -> str:
+        """
+        Human readable report.
+
+        Returns:
+            str, the report.
+        """
+        lines = [f"nodes: {self.node_count}, edges: {self.edge_count}",
+                 f"isolated nodes: {self.isolated_node_count}, self loops: {self.self_loop_count}, "
+                 f"duplicate edges: {self.duplicate_edge_count}",
+                 f"weakly connected components: {self.component_count}, "
+                 f"largest component: {self.largest_component_size} nodes"]
+        for name, summary in (("out degree", self.out_degree), ("in degree", self.in_degree)):
+            lines.append(f"{name}: min {summary.min}, mean {summary.mean:.2f}, p50 {summary.p50}, "
+                         f"p90 {summary.p90}, p99 {summary.p99}, max {summary.max}")
+            buckets = [f"{0 if bit == 0 else 1 << (bit - 1)}-{0 if bit == 0 else (1 << bit) - 1}: {count}"
+                       for bit, count in enumerate(summary.histogram.tolist()) if count > 0]
+            lines.append(f"  {name} histogram: " + ", ".join(buckets))
+        lines.append("estimated topology memory: " + ", ".join(
+            f"{name} {size / (1 << 20):.2f}MB" for name, size in self.format_bytes.items()))
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.report()
+
+
+def main(args=None):
+    """print statistics of the graph of a dataset class"""
+    parser = argparse.ArgumentParser(description="Print graph statistics of a dataset.")
+    parser.add_argument("dataset", type=str,
+                        help="dataset class, e.g. CoraV2 or reddit.Reddit for classes in mindspore_gl.dataset modules")
+    parser.add_argument("root", type=str, help="root directory of the dataset")
+    parser.add_argument("--name", type=str, default=None, help="dataset name passed to the dataset class")
+    args = parser.parse_args(args)
+
+    module_name, _, class_name = args.dataset.rpartition(".")
+    module = importlib.import_module("mindspore_gl.dataset" + (f".{module_name}" if module_name else ""))
+    dataset_cls = getattr(module, class_name)
+    dataset = dataset_cls(args.root) if args.name is None else dataset_cls(args.root, args.name)
+    graph_count = getattr(dataset, "graph_count", 1)
+    if graph_count > 1:
+        # graphs of multi graph datasets are batched into one graph
+        from .ops import BatchHomoGraph
+        graph = BatchHomoGraph()([dataset[idx] for idx in range(graph_count)])
+    else:
+        graph = dataset[0]
+    print(f"{class_name}({args.root}), graphs: {graph_count}")
+    print(graph.stats().report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Directory based on-disk graph store."""
+from typing import Dict
+import os
+import os.path as osp
+import json
+import numpy as np
+
+MANIFEST_FILE = "manifest.json"
+STORE_VERSION = 1
+
+
+def save_graph_store(path: str, arrays: Dict[str, np.ndarray], meta: Dict = None):
+    """
+    Save arrays into a graph store directory, each array is saved as a raw .npy file and
+    described in a json manifest.
+
+    Args:
+        path(str): directory of the graph store, created if not exists.
+        arrays(Dict[str, numpy.ndarray]): arrays to save, keyed by name.
+        meta(Dict): json serializable meta information of the store.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.store import save_graph_store, GraphStore
+        >>> save_graph_store("path/to/store", {"feat": np.ones([4, 2], np.float32)}, {"node_count": 4})
+        >>> store = GraphStore("path/to/store")
+        >>> print(store["feat"].shape, store.meta["node_count"])
+        (4, 2) 4
+    """
+    os.makedirs(path, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(osp.join(path, f"{name}.npy"), np.ascontiguousarray(array))
+    _write_manifest(path, arrays, meta)
+
+
+def _write_manifest(path: str, arrays: Dict[str, np.ndarray], meta: Dict = None):
+    """write manifest for arrays already saved as `{name}.npy` in path"""
+    manifest = {"version": STORE_VERSION, "meta": meta or {}, "arrays": {}}
+    for name, array in arrays.items():
+        manifest["arrays"][name] = {"file": f"{name}.npy", "dtype": array.dtype.str, "shape": list(array.shape)}
+    # manifest is written last, so a store with manifest is always complete
+    tmp_manifest = osp.join(path, MANIFEST_FILE + ".tmp")
+    with open(tmp_manifest, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_manifest, osp.join(path, MANIFEST_FILE))
+
+
+def _coo_to_csr_on_disk(path: str, prefix: str, row: np.ndarray, col: np.ndarray, node_count: int,
+                        chunk_size: int):
+    """counting sort of (row, col) into `{prefix}indptr`, `{prefix}indices` and `{prefix}edge_ids` files"""
+    edge_count = row.shape[0]
+    index_dtype = np.int32 if max(node_count, edge_count) < np.iinfo(np.int32).max else np.int64
+
+    # pass 1: count degrees and check if rows are already sorted
+    counts = np.zeros([node_count], dtype=np.int64)
+    is_sorted = True
+    last_row = -1
+    for start in range(0, edge_count, chunk_size):
+        chunk = np.asarray(row[start: start + chunk_size])
+        counts += np.bincount(chunk, minlength=node_count)
+        is_sorted = is_sorted and chunk[0] >= last_row and bool(np.all(chunk[1:] >= chunk[:-1]))
+        last_row = chunk[-1]
+    indptr = np.zeros([node_count + 1], dtype=index_dtype)
+    np.cumsum(counts, out=indptr[1:])
+    del counts
+
+    # pass 2: scatter each chunk to its csr position
+    indices = np.lib.format.open_memmap(osp.join(path, f"{prefix}indices.npy"), mode="w+",
+                                        dtype=index_dtype, shape=(edge_count,))
+    arrays = {f"{prefix}indptr": indptr, f"{prefix}indices": indices}
+    if is_sorted:
+        for start in range(0, edge_count, chunk_size):
+            indices[start: start + chunk_size] = col[start: start + chunk_size]
+    else:
+        edge_ids = np.lib.format.open_memmap(osp.join(path, f"{prefix}edge_ids.npy"), mode="w+",
+                                             dtype=index_dtype, shape=(edge_count,))
+        arrays[f"{prefix}edge_ids"] = edge_ids
+        cursor = indptr[:-1].astype(np.int64)
+        for start in range(0, edge_count, chunk_size):
+            chunk_row = np.asarray(row[start: start + chunk_size])
+            order = np.argsort(chunk_row, kind="stable")
+            sorted_row = chunk_row[order]
+            run_starts = np.flatnonzero(np.concatenate([[True], sorted_row[1:] != sorted_row[:-1]]))
+            run_lengths = np.diff(np.append(run_starts, sorted_row.shape[0]))
+            rank = np.arange(sorted_row.shape[0]) - np.repeat(run_starts, run_lengths)
+            positions = cursor[sorted_row] + rank
+            indices[positions] = np.asarray(col[start: start + chunk_size])[order]
+            edge_ids[positions] = order + start
+            cursor[sorted_row[run_starts]] += run_lengths
+        edge_ids.flush()
+    indices.flush()
+    np.save(osp.join(path, f"{prefix}indptr.npy"), indptr)
+    return arrays
+
+
+def build_csr_store(path: str, edge_index: np.ndarray, src_node_count: int, dst_node_count: int,
+                    reverse=True, chunk_size=1 << 24) -> 'GraphStore':
+    """
+    Build csr and optionally reverse csr of a coo edge index into a graph store, chunk by chunk.
+    Edge index can be a memory mapped array, memory usage is bounded by node count and `chunk_size`
+    rather than edge count. Rows already sorted by source node are copied without sorting.
+
+    The store has arrays `indptr`, `indices` and, if edges are reordered, `edge_ids` holding the coo
+    position of each csr edge. Reverse csr arrays are saved with prefix `rev_`.
+
+    Args:
+        path(str): directory of the graph store.
+        edge_index(numpy.ndarray): coo edge index with shape [2, edge_count].
+        src_node_count(int): source node count.
+        dst_node_count(int): destination node count.
+        reverse(bool): if True, also build csr of the reversed edges.
+        chunk_size(int): edge count processed in each chunk.
+
+    Returns:
+        GraphStore, memory mapped store of the built csr.
+    """
+    os.makedirs(path, exist_ok=True)
+    arrays = _coo_to_csr_on_disk(path, "", edge_index[0], edge_index[1], src_node_count, chunk_size)
+    if reverse:
+        arrays.update(_coo_to_csr_on_disk(path, "rev_", edge_index[1], edge_index[0], dst_node_count, chunk_size))
+    _write_manifest(path, arrays, {"format": "relation_csr", "src_node_count": src_node_count,
+                                   "dst_node_count": dst_node_count, "edge_count": int(edge_index.shape[1])})
+    return GraphStore(path)
+
+
+def is_graph_store(path: str) -> bool:
+    """
+    Check if path is a complete graph store.
+
+    Args:
+        path(str): directory to check.
+
+    Returns:
+        bool, if `path` contains a graph store manifest.
+    """
+    return osp.isfile(osp.join(path, MANIFEST_FILE))
+
+
+class GraphStore:
+    """
+    Read only graph store, arrays are loaded lazily and memory mapped by default. Memory mapped arrays
+    are backed by the page cache, so processes reading the same store share physical memory instead of
+    holding private copies. GraphStore can be indexed by array name like a NpzFile.
+
+    Args:
+        path(str): directory of the graph store.
+        mmap(bool): if True, arrays are memory mapped read only, else arrays are loaded into memory.
+
+    Raises:
+        RuntimeError: if `path` does not contain a graph store.
+    """
+
+    def __init__(self, path: str, mmap=True):
+        if not is_graph_store(path):
+            raise RuntimeError(f"{path} is not a graph store, {MANIFEST_FILE} is missing.")
+        self.path = path
+        self.mmap = mmap
+        with open(osp.join(path, MANIFEST_FILE)) as f:
+            self._manifest = json.load(f)
+        self._arrays = {}
+
+    @classmethod
+    def from_npz(cls, npz_path: str, path: str, mmap=True) -> 'GraphStore':
+        """
+        Convert a npz file into a graph store.
+
+        Args:
+            npz_path(str): path of the npz file.
+            path(str): directory of the graph store.
+            mmap(bool): if True, arrays of returned store are memory mapped.
+
+        Returns:
+            GraphStore, the converted graph store.
+        """
+        with np.load(npz_path) as npz_file:
+            save_graph_store(path, {name: npz_file[name] for name in npz_file.files})
+        return cls(path, mmap)
+
+    @property
+    def meta(self) -> Dict:
+        """meta information of the store"""
+        return self._manifest["meta"]
+
+    @property
+    def files(self):
+        """names of the arrays in the store"""
+        return list(self._manifest["arrays"].keys())
+
+    def keys(self):
+        return self._manifest["arrays"].keys()
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def __contains__(self, name):
+        return name in self._manifest["arrays"]
+
+    def __getitem__(self, name) -> np.ndarray:
+        array = self._arrays.get(name, None)
+        if array is not None:
+            return array
+        info = self._manifest["arrays"].get(name, None)
+        if info is None:
+            raise KeyError(f"{name} is not in graph store {self.path}")
+        array = np.load(osp.join(self.path, info["file"]), mmap_mode="r" if self.mmap else None)
+        self._arrays[name] = array
+        return array
+
+    def __getstate__(self):
+        # opened arrays are not pickled, child processes map the files again
+        state = self.__dict__.copy()
+        state["_arrays"] = {}
+        return state
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path!r}, mmap={self.mmap})"
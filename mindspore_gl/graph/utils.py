@@ -13,33 +13,67 @@
 # limitations under the License.
 # ============================================================================
 """Graph Utils."""
+from collections import OrderedDict, namedtuple
 from typing import Union, List, Tuple, Iterable
 import numpy as np
 import mindspore_gl.dataloader.shared_numpy as shared_numpy
 import mindspore_gl.memory_kernel as memory_kernel
 
 
+PoolStats = namedtuple("PoolStats", ['hits', 'misses', 'evictions', 'array_count', 'nbytes', 'max_bytes'])
+
+DEFAULT_POOL_BYTES = 1 << 30
+
+
 class ArrayPool:
     """
-    Memory pool for reuse
+    Memory pool for reuse. Arrays are kept in a free list per size and in a pool wide least recently used order,
+    both are ordered dicts keyed by array identity, so put, pop and eviction are O(1). When the pooled arrays
+    take more than `max_bytes`, least recently put arrays are dropped from the pool.
+
+    Args:
+        max_bytes(Union[int, None]): max total bytes of the pooled arrays, None means unbounded.
+            Default: 1 GiB.
     """
-    def __init__(self):
+    def __init__(self, max_bytes=DEFAULT_POOL_BYTES):
+        self.max_bytes = max_bytes
         self.array_pool = {}
+        self._lru = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _key(size):
+        return tuple(int(dim) for dim in size)
 
-    def put(self, size, array: np.ndarray):
+    def put(self, size: Union[List, Tuple, Iterable], array: np.ndarray):
         """
-        put a array into array pool
+        put a array into array pool, putting a pooled array again only marks it as recently used.
 
         Args:
             size(Union[List, Tuple]): input array size
             array(numpy.array): input array
         """
-        key = "_".join(list(map(str, size)))
-        if self.array_pool.get(key, None) is None:
-            self.array_pool[key] = []
-        self.array_pool[key].append(array)
-
-    def pop(self, size) -> np.ndarray:
+        array_id = id(array)
+        key = self._lru.get(array_id, None)
+        if key is not None:
+            self._lru.move_to_end(array_id)
+            self.array_pool[key].move_to_end(array_id)
+            return
+        key = self._key(size)
+        bucket = self.array_pool.get(key, None)
+        if bucket is None:
+            bucket = self.array_pool[key] = OrderedDict()
+        bucket[array_id] = array
+        self._lru[array_id] = key
+        self._nbytes += array.nbytes
+        if self.max_bytes is not None:
+            while self._nbytes > self.max_bytes:
+                self._evict()
+
+    def pop(self, size: Union[List, Tuple, Iterable]) -> np.ndarray:
         """
         pop a array from array pool
 
@@ -50,33 +84,72 @@ class ArrayPool:
             Union[numpy.array, None], return None is request size has no array left, else return the array.
 
         """
-        key = "_".join(list(map(str, size)))
-        buckets = self.array_pool.get(key, None)
-        if buckets is None:
+        bucket = self.array_pool.get(self._key(size), None)
+        if not bucket:
+            self._misses += 1
             return None
+        array_id, array = bucket.popitem(last=False)
+        if not self._available(array):
+            # oldest array is still in use, so are the newer ones most likely, check it again last
+            bucket[array_id] = array
+            self._misses += 1
+            return None
+        self._remove(array_id, array)
+        self._hits += 1
+        return array
 
-        return buckets.pop()
-
-
-class SharedArrayPool:
-    """
-    Shared memory pool for reuse, this is recommended for interprocess communication
-    """
-    def __init__(self):
-        self.array_pool = {}
+    def clear(self):
+        """drop all pooled arrays"""
+        for array_id in list(self._lru.keys()):
+            self._evict(array_id)
 
-    def put(self, size: Union[List, Tuple, Iterable], shared_array: shared_numpy.SharedNDArray):
+    def stats(self) -> PoolStats:
         """
-         put a array into array pool
+        Pool statistics for monitoring.
 
-        Args:
-            size(Union[List, Tuple]): input array size
-            shared_array(shared_numpy.SharedNDArray): input array
+        Returns:
+            PoolStats, with fields
+
+            - **hits** (int) - pops returning a pooled array.
+            - **misses** (int) - pops returning None.
+            - **evictions** (int) - arrays dropped for the memory cap or by clear.
+            - **array_count** (int) - pooled array count.
+            - **nbytes** (int) - total bytes of pooled arrays.
+            - **max_bytes** (Union[int, None]) - memory cap.
         """
-        key = "_".join(list(map(str, size)))
-        if self.array_pool.get(key, None) is None:
-            self.array_pool[key] = []
-        self.array_pool[key].append(shared_array)
+        return PoolStats(self._hits, self._misses, self._evictions, len(self._lru), self._nbytes, self.max_bytes)
+
+    def _available(self, array) -> bool:
+        """if a pooled array can be reused"""
+        return True
+
+    def _remove(self, array_id, array):
+        del self._lru[array_id]
+        self._nbytes -= array.nbytes
+
+    def _evict(self, array_id=None):
+        """drop the least recently used array or the given one from the pool"""
+        if array_id is None:
+            array_id = next(iter(self._lru))
+        key = self._lru[array_id]
+        bucket = self.array_pool[key]
+        array = bucket.pop(array_id)
+        if not bucket:
+            del self.array_pool[key]
+        self._remove(array_id, array)
+        self._evictions += 1
+
+
+class SharedArrayPool(ArrayPool):
+    """
+    Shared memory pool for reuse, this is recommended for interprocess communication. Pooled arrays may still be
+    used by other processes, they are reused only when the pool holds the only reference. Evicted arrays are
+    released by dropping the pool's reference, the shm segment is unlinked once no process references it.
+
+    Args:
+        max_bytes(Union[int, None]): max total bytes of the pooled arrays, None means unbounded.
+            Default: 1 GiB.
+    """
 
     def check_avaliable(self, shared_array: shared_numpy.SharedNDArray):
         """
@@ -90,23 +163,5 @@ class SharedArrayPool:
         """
         return memory_kernel.py_ref_count(shared_array.shm.buf) == 1 and not shared_array.shared
 
-    def pop(self, size: Union[List, Tuple, Iterable]) -> shared_numpy.SharedNDArray:
-        """
-        pop a array from array pool
-
-        Args:
-            size(Union[List, Tuple]): request array's size
-
-        Returns:
-            Union[numpy.array, None], return None is request size has no array left, else return the array.
-
-        """
-        key = "_".join(list(map(str, size)))
-        bucket = self.array_pool.get(key, None)
-        if bucket is None:
-            return None
-        # pylint: disable=consider-using-enumerate
-        for idx in range(len(bucket)):
-            if self.check_avaliable(bucket[idx]):
-                return bucket.pop(idx)
-        return None
+    def _available(self, array) -> bool:
+        return self.check_avaliable(array)
@@ -0,0 +1,143 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Layer-wise importance sampling"""
+from typing import List
+import numpy as np
+from mindspore_gl.graph.graph import MindHomoGraph, CompressedCsrAdj, gather_csr_rows, node_index_dtype
+from .neighbor import SampledBlock, _reindex
+
+__all__ = ['LayerWiseSampler']
+
+
+class LayerWiseSampler:
+    """
+    Layer-wise importance sampling of FastGCN and LADIES on MindHomoGraph. Each layer draws at most a fixed
+    number of nodes among the neighbors of its destination nodes, so the cost of a batch is bounded by the
+    layer sizes and the degrees of the sampled nodes instead of growing with fanout^depth.
+
+    Entries of the symmetric normalized adjacency :math:`\\hat{A}_{vu} = 1 / \\sqrt{d_v d_u}` are used as edge
+    values, with :math:`d_v` the out degree of destination node v and :math:`d_u` the in degree of neighbor u.
+    Neighbors are drawn without replacement with probability :math:`p_u` proportional to
+
+    - `fastgcn`: :math:`\\|\\hat{A}_{:u}\\|^2` over the whole graph, computed once.
+    - `ladies`: :math:`\\|\\hat{A}_{Du}\\|^2` over destination nodes D of the layer.
+
+    Each kept edge is weighted by :math:`\\hat{A}_{vu} / \\min(1, s p_u)` with s the layer size, so summing
+    messages with the weights estimates the full aggregation.
+
+    Args:
+        homo_graph(MindHomoGraph): input graph, neighbors are the csr successors.
+        layer_sizes(List[int]): node count drawn for each layer, the first one is sampled around the seeds.
+        mode(str): 'ladies' or 'fastgcn'. Default: 'ladies'.
+
+    Raises:
+        TypeError: If 'homo_graph' is not a MindHomoGraph.
+        ValueError: If 'mode' is not 'ladies' or 'fastgcn', or a layer size is not positive.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.graph import MindHomoGraph
+        >>> from mindspore_gl.sampling.layerwise import LayerWiseSampler
+        >>> graph = MindHomoGraph()
+        >>> graph.set_topo_coo(np.array([[0, 0, 0, 1, 2, 3], [1, 2, 3, 0, 3, 0]], dtype=np.int32))
+        >>> graph.node_count = 4
+        >>> sampler = LayerWiseSampler(graph, [8, 8])
+        >>> blocks, seeds_idx = sampler(np.array([0], dtype=np.int32))
+        >>> print([(block.src_nodes.shape[0], block.dst_count) for block in blocks])
+        [(4, 4), (4, 1)]
+        >>> print(blocks[-1].edge_weight)
+        [0.57735027 0.57735027 0.40824829]
+    """
+
+    def __init__(self, homo_graph: MindHomoGraph, layer_sizes: List[int], mode='ladies'):
+        if not isinstance(homo_graph, MindHomoGraph):
+            raise TypeError("For LayerWiseSampler, the 'homo_graph' must a MindHomoGraph, but got "
+                            f"{type(homo_graph).__name__}.")
+        if mode not in ('ladies', 'fastgcn'):
+            raise ValueError(f"For LayerWiseSampler, the 'mode' must be 'ladies' or 'fastgcn', but got {mode}.")
+        if any(size <= 0 for size in layer_sizes):
+            raise ValueError(f"For LayerWiseSampler, the 'layer_sizes' must be positive, but got {layer_sizes}.")
+        self.graph = homo_graph
+        self.layer_sizes = list(layer_sizes)
+        self.mode = mode
+        adj_csr = homo_graph.adj_csr
+        node_count = homo_graph.node_count
+        indptr = adj_csr.indptr
+        indices = adj_csr.to_csr().indices if isinstance(adj_csr, CompressedCsrAdj) else adj_csr.indices
+        self.out_degrees = np.zeros([node_count], dtype=np.int64)
+        self.out_degrees[:indptr.shape[0] - 1] = np.diff(indptr)
+        self.in_degrees = np.bincount(indices, minlength=node_count)
+        self.column_norm = None
+        if mode == 'fastgcn':
+            # squared column norm of normalized adjacency, sum of 1 / (d_v d_u) over in edges of u
+            row_inv = 1. / np.repeat(self.out_degrees[:indptr.shape[0] - 1], np.diff(indptr))
+            self.column_norm = np.bincount(indices, weights=row_inv, minlength=node_count) / \
+                np.maximum(self.in_degrees, 1)
+
+    def __call__(self, seeds: np.ndarray):
+        """
+        Sample blocks around seeds.
+
+        Args:
+            seeds(numpy.ndarray): start nodes for sampling.
+
+        Returns:
+            - **blocks** (List[SampledBlock]) - one block for each layer in computation order, with importance
+              weights as `edge_weight`. Destination nodes of a block come first in its source nodes and are
+              the source nodes of the next block, destination nodes of `blocks[-1]` are the distinct seeds.
+            - **seeds_idx** (numpy.ndarray) - local id of each seed among destination nodes of `blocks[-1]`.
+        """
+        adj_csr = self.graph.adj_csr
+        node_count = self.graph.node_count
+        seeds = np.asarray(seeds).astype(node_index_dtype(adj_csr), copy=False)
+        dst_nodes, seeds_idx, _ = _reindex(seeds, seeds.shape[0], [], node_count)
+        blocks = []
+        for layer_size in self.layer_sizes:
+            indptr, neighbors, positions = gather_csr_rows(adj_csr, dst_nodes, return_positions=True)
+            dst = np.repeat(dst_nodes, np.diff(indptr))
+            edge_value = 1. / np.sqrt(self.out_degrees[dst] * self.in_degrees[neighbors])
+            candidates, inverse = np.unique(neighbors, return_inverse=True)
+            if self.mode == 'ladies':
+                score = np.bincount(inverse, weights=edge_value * edge_value, minlength=candidates.shape[0])
+            else:
+                score = self.column_norm[candidates]
+            chosen, inclusion = self._choose(score / score.sum(), layer_size)
+
+            kept = chosen[inverse]
+            inverse = inverse[kept]
+            edge_index = np.stack([dst[kept], neighbors[kept]])
+            src_nodes, _, (local_edges,) = _reindex(np.concatenate([dst_nodes, candidates[chosen]]), 0,
+                                                    [edge_index], node_count)
+            blocks.append(SampledBlock(src_nodes, dst_nodes.shape[0], local_edges[[1, 0]],
+                                       self.graph.csr_edge_ids(positions[kept]),
+                                       edge_value[kept] / inclusion[inverse]))
+            dst_nodes = src_nodes
+        return blocks[::-1], seeds_idx
+
+    @staticmethod
+    def _choose(probability, layer_size):
+        """
+        draw layer_size candidates without replacement by Efraimidis-Spirakis keys, returns the chosen mask and
+        approximate inclusion probability min(1, layer_size * p) of each candidate
+        """
+        candidate_count = probability.shape[0]
+        if candidate_count <= layer_size:
+            return np.ones([candidate_count], dtype=bool), np.ones([candidate_count])
+        chosen = np.zeros([candidate_count], dtype=bool)
+        with np.errstate(divide='ignore'):
+            # log of u^(1/p), u is shifted into (0, 1], zero probability candidates get -inf
+            keys = np.log(1. - np.random.random(candidate_count)) / probability
+        chosen[np.argpartition(-keys, layer_size - 1)[:layer_size]] = True
+        return chosen, np.minimum(1., layer_size * probability)
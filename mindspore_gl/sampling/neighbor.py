@@ -14,18 +14,48 @@
 # ============================================================================
 """Sampling neighbor"""
 from typing import List
+from collections import namedtuple
 import numpy as np
-from mindspore_gl.graph.graph import MindHomoGraph
+from mindspore_gl.graph.graph import MindHomoGraph, CompressedCsrAdj, CsrWeight, node_index_dtype
 from mindspore_gl import sample_kernel
 
+# bipartite message flow graph of one layer, src_nodes holds the dst nodes first, edges are
+# [src local id, dst local id] pairs in message direction and eids are their graph edge ids,
+# edge_weight is the importance weight of each edge for layer-wise sampling
+SampledBlock = namedtuple("SampledBlock", ['src_nodes', 'dst_count', 'edges', 'eids', 'edge_weight'],
+                          defaults=(None,))
 
-def map_edge_index(layered_edges, reindex_dict):
-    for layer_index, layer_edge in enumerate(layered_edges):
-        layered_edges[layer_index] = sample_kernel.map_edges(layer_edge, reindex_dict)
-    return layered_edges
 
+def _reindex(nodes, seed_count, layered_edges, node_count):
+    """
+    relabel nodes to 0, 1, ... in the order they first appear, seeds first, with array operations only,
+    returns the deduplicated nodes, local ids of seeds and local edges
+    """
+    _, first_pos = np.unique(nodes, return_index=True)
+    first_pos.sort()
+    unique_nodes = nodes[first_pos]
+    # scratch lookup of node count entries, only entries of sampled nodes are written and read
+    local_ids = np.empty([node_count], dtype=nodes.dtype)
+    local_ids[unique_nodes] = np.arange(unique_nodes.shape[0], dtype=nodes.dtype)
+    return unique_nodes, local_ids[nodes[:seed_count]], [local_ids[edges] for edges in layered_edges]
+
+
+def _sample_one_hop(adj_csr, neighbor_num, seeds, csr_weight: CsrWeight = None, replace=False):
+    """sample neighbors of seeds on csr, compressed csr is decoded on the fly"""
+    if csr_weight is not None:
+        if isinstance(adj_csr, CompressedCsrAdj):
+            raise TypeError("Weighted sampling does not support CompressedCsrAdj.")
+        return sample_kernel.sample_one_hop_weighted(adj_csr.indptr, adj_csr.indices, csr_weight.cum_weight,
+                                                     csr_weight.positive_degree, neighbor_num, seeds, replace)
+    if isinstance(adj_csr, CompressedCsrAdj):
+        return sample_kernel.sample_one_hop_unbias_compressed(adj_csr.indptr, adj_csr.block_indptr,
+                                                              adj_csr.block_offsets, adj_csr.data,
+                                                              adj_csr.block_size, neighbor_num, seeds)
+    return sample_kernel.sample_one_hop_unbias(adj_csr.indptr, adj_csr.indices, neighbor_num, seeds)
 
-def sage_sampler_on_homo(homo_graph: MindHomoGraph, seeds: np.array, neighbor_nums: List[int]):
+
+def sage_sampler_on_homo(homo_graph: MindHomoGraph, seeds: np.array, neighbor_nums: List[int], weighted=False,
+                         replace=False):
     """
     GraphSage sampling on MindHomoGraph
 
@@ -33,11 +63,15 @@ def sage_sampler_on_homo(homo_graph: MindHomoGraph, seeds: np.array, neighbor_nu
         homo_graph(MindHomoGraph): input graph
         seeds(numpy.array): start nodes for neighbor sampling
         neighbor_nums(List): neighbor nums for each hop
+        weighted(bool): if True, neighbors are sampled with probability proportional to the edge weights set by
+            `MindHomoGraph.set_edge_weight`, using the cumulative weight table cached on the graph.
+        replace(bool): if True, weighted sampling draws exactly neighbor num neighbors with replacement for each
+            node with positive weight edges. Unweighted sampling is always without replacement.
 
     Returns:
-        - layered_edges_{idx}(numpy.array): edge array for hop idx
+        - layered_edges_{idx}(numpy.array): edge array for hop idx, in local ids
         - layered_eids_{idx}(numpy.array): edge id array for hop idx
-        - all_nodes: all nodes' global ids
+        - all_nodes: ids of the distinct sampled nodes, seeds first and then new nodes of each hop
         - seeds_idx: seeds local ids
 
     Raises:
@@ -72,14 +106,12 @@ def sage_sampler_on_homo(homo_graph: MindHomoGraph, seeds: np.array, neighbor_nu
         >>> res = sage_sampler_on_homo(homo_graph=generated_graph, seeds=nodes[:3].astype(np.int32),\
         ... neighbor_nums=[2, 2])
         >>> print(res)
-        {'seeds_idx': array([0, 3, 2], dtype=int32), 'all_nodes': array([0, 1, 2, 1, 4, 5, 6, 5, 6, 7, 8, 9],
-               dtype=int32), 'layered_edges_0': array([[0, 0, 3, 3, 2],
-               [3, 4, 7, 8, 7]], dtype=int32), 'layered_eids_0': array([[0, 0, 3, 3, 2],
-               [3, 4, 7, 8, 7]], dtype=int32), 'layered_edges_1': array([[ 3,  3,  4,  4,  7,  8,  8],
-               [ 7,  8, 10, 11,  9, 10, 11]], dtype=int32), 'layered_eids_1': array([[ 3,  3,  4,  4,  7,  8,  8],
-               [ 7,  8, 10, 11,  9, 10, 11]], dtype=int32)}
-
-
+        {'seeds_idx': array([0, 1, 2], dtype=int32), 'all_nodes': array([0, 1, 2, 4, 5, 6, 7, 8, 9], dtype=int32),
+        'layered_edges_0': array([[0, 0, 1, 1, 2],
+               [1, 3, 4, 5, 4]], dtype=int32), 'layered_eids_0': array([0, 1, 2, 3, 4], dtype=int32),
+        'layered_edges_1': array([[1, 1, 3, 3, 4, 5, 5],
+               [4, 5, 7, 5, 6, 7, 8]], dtype=int32), 'layered_eids_1': array([ 2,  3, 10,  8, 12, 13, 14],
+               dtype=int32)}
     """
     if not isinstance(homo_graph, MindHomoGraph):
         raise TypeError("For sage_sampler_on_homo, the 'homo_graph' must a MindHomoGraph, but got "
@@ -90,36 +122,93 @@ def sage_sampler_on_homo(homo_graph: MindHomoGraph, seeds: np.array, neighbor_nu
     if not isinstance(neighbor_nums, list):
         raise TypeError("For sage_sampler_on_homo, the 'seeds' must a list, but got "
                         f"{type(neighbor_nums).__name__}.")
+    seeds = seeds.astype(node_index_dtype(homo_graph.adj_csr), copy=False)
+    csr_weight = homo_graph.csr_weight() if weighted else None
     saved_seeds = seeds
     all_nodes = [seeds]
     layered_edges = []
     layered_eids = []
     for neighbor_num in neighbor_nums:
-        edge_index, edge_ids = sample_kernel.sample_one_hop_unbias(homo_graph.adj_csr.indptr,
-                                                                   homo_graph.adj_csr.indices,
-                                                                   neighbor_num,
-                                                                   seeds)
+        edge_index, edge_ids = _sample_one_hop(homo_graph.adj_csr, neighbor_num, seeds, csr_weight, replace)
         layered_edges.append(edge_index)
         layered_eids.append(edge_ids)
         seeds = np.unique(edge_index[1])
 
         all_nodes.append(seeds)
 
-    # get_node_features:
-    all_nodes = np.concatenate(all_nodes, axis=0)
-
     # reindex sampled result
-    reindex_dict = {all_nodes[index]: index for index in range(all_nodes.shape[0])}
-    layered_edges = map_edge_index(layered_edges, reindex_dict)
-
-    seeds_idx = np.zeros(saved_seeds.shape, dtype=np.int32)
-    for idx in range(saved_seeds.shape[0]):
-        seeds_idx[idx] = reindex_dict[saved_seeds[idx]]
+    all_nodes, seeds_idx, layered_edges = _reindex(np.concatenate(all_nodes, axis=0), saved_seeds.shape[0],
+                                                   layered_edges, homo_graph.node_count)
     res = {
         "seeds_idx": seeds_idx,
         "all_nodes": all_nodes,
     }
-    for layer_idx, layer in enumerate(layered_edges):
+    for layer_idx, (layer, eids) in enumerate(zip(layered_edges, layered_eids)):
         res[f'layered_edges_{layer_idx}'] = layer
-        res[f'layered_eids_{layer_idx}'] = layer
+        res[f'layered_eids_{layer_idx}'] = homo_graph.csr_edge_ids(eids)
     return res
+
+
+def sage_block_sampler_on_homo(homo_graph: MindHomoGraph, seeds: np.ndarray, neighbor_nums: List[int],
+                               weighted=False, replace=False):
+    """
+    GraphSage sampling on MindHomoGraph into per layer bipartite blocks. Starting from the seeds, each hop
+    samples neighbors of all source nodes of the previous hop, so the destination nodes of a block are exactly
+    the nodes whose outputs the next layer needs. Layer i then only computes `dst_count` rows from
+    `src_nodes.shape[0]` input rows instead of running over all sampled nodes.
+
+    Args:
+        homo_graph(MindHomoGraph): input graph
+        seeds(numpy.ndarray): start nodes for neighbor sampling
+        neighbor_nums(List): neighbor nums for each hop, the first hop is sampled around the seeds
+        weighted(bool): if True, neighbors are sampled with probability proportional to the edge weights.
+        replace(bool): if True, weighted sampling draws neighbors with replacement.
+
+    Returns:
+        - **blocks** (List[SampledBlock]) - one block for each layer in computation order, i.e. the block of
+          the last hop comes first. `blocks[0].src_nodes` are the input nodes and the destination nodes of
+          `blocks[-1]` are the distinct seeds. Source nodes of a block are the destination nodes of the
+          previous block.
+        - **seeds_idx** (numpy.ndarray) - local id of each seed among destination nodes of `blocks[-1]`.
+
+    Raises:
+        TypeError: If 'homo_graph' is not a MindHomoGraph.
+        TypeError: If 'seeds' is not a np.ndarray.
+        TypeError: If 'neighbor_nums' is not a list.
+
+    Examples:
+        >>> import numpy as np
+        >>> from mindspore_gl.graph.graph import MindHomoGraph
+        >>> from mindspore_gl.sampling.neighbor import sage_block_sampler_on_homo
+        >>> graph = MindHomoGraph()
+        >>> graph.set_topo_coo(np.array([[0, 0, 1, 2, 3], [1, 2, 3, 3, 0]], dtype=np.int32))
+        >>> graph.node_count = 4
+        >>> blocks, seeds_idx = sage_block_sampler_on_homo(graph, np.array([0], dtype=np.int32), [2, 2])
+        >>> print([(block.src_nodes.shape[0], block.dst_count) for block in blocks])
+        [(4, 3), (3, 1)]
+        >>> print(blocks[-1].edges)
+        [[1 2]
+         [0 0]]
+    """
+    if not isinstance(homo_graph, MindHomoGraph):
+        raise TypeError("For sage_block_sampler_on_homo, the 'homo_graph' must a MindHomoGraph, but got "
+                        f"{type(homo_graph).__name__}.")
+    if not isinstance(seeds, np.ndarray):
+        raise TypeError("For sage_block_sampler_on_homo, the 'seeds' must a numpy array, but got "
+                        f"{type(seeds).__name__}.")
+    if not isinstance(neighbor_nums, list):
+        raise TypeError("For sage_block_sampler_on_homo, the 'neighbor_nums' must a list, but got "
+                        f"{type(neighbor_nums).__name__}.")
+    seeds = seeds.astype(node_index_dtype(homo_graph.adj_csr), copy=False)
+    csr_weight = homo_graph.csr_weight() if weighted else None
+    dst_nodes, seeds_idx, _ = _reindex(seeds, seeds.shape[0], [], homo_graph.node_count)
+    blocks = []
+    for neighbor_num in neighbor_nums:
+        edge_index, edge_ids = _sample_one_hop(homo_graph.adj_csr, neighbor_num, dst_nodes, csr_weight, replace)
+        # dst nodes are distinct and come first, so they keep their ids as source nodes
+        src_nodes, _, (local_edges,) = _reindex(np.concatenate([dst_nodes, edge_index[1]]), 0, [edge_index],
+                                                homo_graph.node_count)
+        blocks.append(SampledBlock(src_nodes, dst_nodes.shape[0], local_edges[[1, 0]],
+                                   homo_graph.csr_edge_ids(edge_ids)))
+        dst_nodes = src_nodes
+    return blocks[::-1], seeds_idx
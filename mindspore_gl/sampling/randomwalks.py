@@ -14,10 +14,10 @@
 # ============================================================================
 """random walks on graphs"""
 import numpy as np
-from mindspore_gl.graph.graph import MindHomoGraph
+from mindspore_gl.graph.graph import MindHomoGraph, CompressedCsrAdj, node_index_dtype
 from mindspore_gl import sample_kernel
 
-__all__ = ['random_walk_unbias_on_homo']
+__all__ = ['random_walk_unbias_on_homo', 'random_walk_weighted_on_homo']
 
 
 def random_walk_unbias_on_homo(homo_graph: MindHomoGraph,
@@ -35,7 +35,39 @@ def random_walk_unbias_on_homo(homo_graph: MindHomoGraph,
     """
     default_node = int(default_node)
     # sample
-    out = sample_kernel.random_walk_cpu_unbias(homo_graph.adj_csr.indptr,
-                                               homo_graph.adj_csr.indices,
+    adj_csr = homo_graph.adj_csr
+    seeds = seeds.astype(node_index_dtype(adj_csr), copy=False)
+    if isinstance(adj_csr, CompressedCsrAdj):
+        return sample_kernel.random_walk_cpu_unbias_compressed(adj_csr.indptr, adj_csr.block_indptr,
+                                                               adj_csr.block_offsets, adj_csr.data,
+                                                               adj_csr.block_size, walk_length, seeds, default_node)
+    out = sample_kernel.random_walk_cpu_unbias(adj_csr.indptr,
+                                               adj_csr.indices,
                                                walk_length, seeds, default_node)
     return out
+
+
+def random_walk_weighted_on_homo(homo_graph: MindHomoGraph,
+                                 seeds: np.ndarray,
+                                 walk_length: int,
+                                 default_node: int = -1):
+    """
+    weighted random walks on homo graph, each step moves along an out edge with probability proportional to its
+    weight set by `MindHomoGraph.set_edge_weight`, the cumulative weight table is cached on the graph
+
+    Args:
+        homo_graph(MindHomoGraph): the source graph which is sampled from, with edge weights set
+        seeds(np.ndarray) : random seeds for sampling
+        walk_length(int): sample path length
+        default_node(int): node index padding walks which reach a node without positive weight out edges
+
+    Raises:
+        TypeError: If topology of 'homo_graph' is a CompressedCsrAdj.
+    """
+    default_node = int(default_node)
+    adj_csr = homo_graph.adj_csr
+    if isinstance(adj_csr, CompressedCsrAdj):
+        raise TypeError("Weighted random walk does not support CompressedCsrAdj.")
+    seeds = seeds.astype(node_index_dtype(adj_csr), copy=False)
+    return sample_kernel.random_walk_cpu_weighted(adj_csr.indptr, adj_csr.indices, homo_graph.csr_weight().cum_weight,
+                                                  walk_length, seeds, default_node)
@@ -19,6 +19,7 @@ from mindspore_gl.sampling.neighbor import sage_sampler_on_homo
 from mindspore_gl.dataloader.dataset import Dataset
 import mindspore_gl.array_kernel as array_kernel
 from mindspore_gl.graph.ops import PadArray2d, PadMode, PadDirection
+from mindspore_gl.graph.bucket import FixedBucket, GeometricBucket, PaddingRecorder
 
 
 class GraphSAGEDataset(Dataset):
@@ -31,7 +32,12 @@ class GraphSAGEDataset(Dataset):
         self.y = graph_dataset.node_label
         self.batch_size = batch_size
         self.max_sampled_nodes_num = neighbor_nums[0] * neighbor_nums[1] * batch_size
-
+        # 20%, 40%, ..., 100% of max sampled node count for both node count and edge count,
+        # rare larger samples get extra buckets instead of failing
+        self.bucket = FixedBucket([floor(ratio * self.max_sampled_nodes_num) for ratio in (0.2, 0.4, 0.6, 0.8)] +
+                                  [self.max_sampled_nodes_num],
+                                  fallback=GeometricBucket(1.2, self.max_sampled_nodes_num))
+        self.recorder = PaddingRecorder()
 
     def __getitem__(self, batch_nodes):
         res = sage_sampler_on_homo(self.graph, batch_nodes, self.neighbor_nums)
@@ -43,32 +49,11 @@ class GraphSAGEDataset(Dataset):
         num_sample_edges = sample_edges.shape[1]
 
         num_sample_nodes = len(res['all_nodes'])
-        max_sampled_nodes_num = self.max_sampled_nodes_num
-
-        if num_sample_nodes < floor(0.2*max_sampled_nodes_num):
-            pad_node_num = floor(0.2*max_sampled_nodes_num)
-        elif num_sample_nodes < floor(0.4*max_sampled_nodes_num):
-            pad_node_num = floor(0.4 * max_sampled_nodes_num)
-        elif num_sample_nodes < floor(0.6*max_sampled_nodes_num):
-            pad_node_num = floor(0.6 * max_sampled_nodes_num)
-        elif num_sample_nodes < floor(0.8*max_sampled_nodes_num):
-            pad_node_num = floor(0.8 * max_sampled_nodes_num)
-        else:
-            pad_node_num = max_sampled_nodes_num
-
-        if num_sample_edges < floor(0.2*max_sampled_nodes_num):
-            pad_edge_num = floor(0.2*max_sampled_nodes_num)
-        elif num_sample_edges < floor(0.4*max_sampled_nodes_num):
-            pad_edge_num = floor(0.4 * max_sampled_nodes_num)
-        elif num_sample_edges < floor(0.6*max_sampled_nodes_num):
-            pad_edge_num = floor(0.6 * max_sampled_nodes_num)
-        elif num_sample_edges < floor(0.8*max_sampled_nodes_num):
-            pad_edge_num = floor(0.8 * max_sampled_nodes_num)
-        else:
-            pad_edge_num = max_sampled_nodes_num
-
-
-
+        # pad edges point to the last node, so at least one node is padded
+        pad_node_num = self.bucket(num_sample_nodes + 1)
+        pad_edge_num = self.bucket(num_sample_edges)
+        self.recorder.record(num_sample_nodes + num_sample_edges, pad_node_num + pad_edge_num,
+                             (pad_node_num, pad_edge_num))
 
         layered_edges_pad_op = PadArray2d(mode=PadMode.CONST, size=[2, pad_edge_num],
                                           dtype=np.int32, direction=PadDirection.ROW,
@@ -88,3 +73,7 @@ class GraphSAGEDataset(Dataset):
         array_kernel.float_2d_gather_with_dst(feat, self.graph_dataset.node_feat, res['all_nodes'])
         graph_dict = {"seeds_ids": res['seeds_idx'], "label": label, "feat": feat, "pad_sample_edges": pad_sample_edges}
         return graph_dict
+
+    def padding_stats(self):
+        """padding overhead and number of distinct padded (node, edge) shapes of sampled batches"""
+        return self.recorder.stats()
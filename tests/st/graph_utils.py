@@ -0,0 +1,43 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" graph helpers shared by tests """
+import numpy as np
+from mindspore_gl.graph.graph import MindHomoGraph
+from mindspore_gl.graph.node_map import NodeIdMap
+
+
+def random_homo_graph(node_count, edge_count, node_map: NodeIdMap = None, dtype=np.int32, return_coo=False):
+    """
+    random homo graph built from unsorted coo, edges are identified by their coo position
+
+    Args:
+        node_count(int): node count.
+        edge_count(int): edge count.
+        node_map(NodeIdMap): global ids of the nodes, identity if not given.
+        dtype(numpy.dtype): data type of the coo.
+        return_coo(bool): if True, also return the coo with global node ids.
+
+    Returns:
+        - **graph** (MindHomoGraph) - the graph.
+        - **global_coo** (numpy.ndarray) - coo with global node ids, only returned if `return_coo` is True.
+    """
+    adj_coo = np.random.randint(0, node_count, [2, edge_count]).astype(dtype)
+    graph = MindHomoGraph()
+    graph.set_topo_coo(adj_coo, node_dict=node_map)
+    graph.node_count = node_count
+    graph.edge_count = edge_count
+    if return_coo:
+        return graph, adj_coo if node_map is None else node_map.to_global(adj_coo)
+    return graph
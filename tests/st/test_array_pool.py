@@ -0,0 +1,89 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test bounded array pool """
+import os
+import numpy as np
+import pytest
+import mindspore_gl.dataloader.shared_numpy as shared_numpy
+import mindspore_gl.memory_kernel as memory_kernel
+from mindspore_gl.graph.utils import ArrayPool, SharedArrayPool
+
+
+def _shm_exists(name):
+    return os.path.exists(os.path.join("/dev/shm", name.lstrip("/")))
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_array_pool_lru():
+    """
+    Feature: test array pool with memory cap
+    Description: put arrays of two sizes beyond the cap, pop them and put the same array twice
+    Expectation: least recently put arrays are evicted, counters and bytes are tracked
+    """
+    pool = ArrayPool(max_bytes=3 * 800)
+    arrays = [np.zeros([100], dtype=np.float64) for _ in range(3)] + [np.zeros([10, 10], dtype=np.float64)]
+    for array in arrays[:3]:
+        pool.put([100], array)
+    pool.put(arrays[0].shape, arrays[0])
+    stats = pool.stats()
+    assert stats.array_count == 3 and stats.nbytes == 2400 and stats.evictions == 0
+
+    # arrays[1] is the least recently used
+    pool.put([10, 10], arrays[3])
+    stats = pool.stats()
+    assert stats.array_count == 3 and stats.nbytes == 2400 and stats.evictions == 1
+    assert pool.pop([100]) is arrays[2]
+    assert pool.pop([100]) is arrays[0]
+    assert pool.pop([100]) is None
+    assert pool.pop((10, 10)) is arrays[3]
+    stats = pool.stats()
+    assert (stats.hits, stats.misses, stats.array_count, stats.nbytes) == (3, 1, 0, 0)
+
+    pool.put([100], arrays[0])
+    pool.clear()
+    assert pool.stats().array_count == 0 and pool.pop([100]) is None
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_shared_array_pool():
+    """
+    Feature: test shared array pool
+    Description: pool shared arrays beyond the cap, with one of them still referenced by another holder
+    Expectation: arrays in use are not reused, evicted shm segments are unlinked
+    """
+    pool = SharedArrayPool(max_bytes=2 * 4000)
+    arrays = [shared_numpy.SharedNDArray.from_shape([1000], np.float32) for _ in range(3)]
+    names = [array.shm.name for array in arrays]
+    for array in arrays:
+        pool.put([1000], array)
+    del arrays, array
+    assert not _shm_exists(names[0])
+    assert _shm_exists(names[1]) and _shm_exists(names[2])
+
+    in_use = pool.pop([1000])
+    assert in_use.shm.name == names[1]
+    pool.put([1000], in_use)
+    memory_kernel.py_inc_ref(in_use.shm.buf)
+    # the oldest array is in use, it is skipped and checked again after the others
+    assert pool.pop([1000]).shm.name == names[2]
+    assert pool.pop([1000]) is None
+    memory_kernel.py_dec_ref(in_use.shm.buf)
+    assert pool.pop([1000]) is in_use
+    stats = pool.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (3, 1, 1)
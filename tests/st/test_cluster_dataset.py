@@ -0,0 +1,66 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test cluster gcn dataset """
+import os
+import numpy as np
+import pytest
+from mindspore_gl.graph.node_map import NodeIdMap
+from mindspore_gl.graph.partition import partition_graph
+from mindspore_gl.graph.store import GraphStore, save_graph_store
+from mindspore_gl.dataloader.cluster_dataset import ClusterGCNDataset
+from graph_utils import random_homo_graph
+
+
+def _random_graph(node_count=400, edge_count=3000):
+    global_ids = np.random.permutation(node_count * 2)[:node_count]
+    return random_homo_graph(node_count, edge_count, NodeIdMap(global_ids=global_ids), return_coo=True)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_cluster_gcn_dataset(tmp_path):
+    """
+    Feature: test Cluster-GCN dataset
+    Description: partition a random graph into clusters and build batches of several clusters
+    Expectation: batch is the relabeled subgraph induced by the clusters with original node and edge ids
+    """
+    graph, global_coo = _random_graph()
+    cache_path = os.path.join(str(tmp_path), "parts")
+    dataset = ClusterGCNDataset(graph, 8, cache_path=cache_path)
+    assert len(dataset) == 8
+    assert np.array_equal(np.sort(np.concatenate([dataset.cluster_nodes(i) for i in range(8)])), np.arange(400))
+
+    for clusters in [[3], [5, 0, 2], list(range(8))]:
+        batch = dataset[clusters]
+        local_nodes = np.concatenate([dataset.cluster_nodes(i) for i in clusters])
+        nodes = graph.node_map.global_ids[local_nodes]
+        assert np.array_equal(batch.node_map.global_ids, nodes)
+        assert batch.node_count == nodes.shape[0]
+        mask = np.isin(global_coo[0], nodes) & np.isin(global_coo[1], nodes)
+        batch_coo = batch.node_map.to_global(batch.adj_coo)
+        assert np.array_equal(global_coo[:, batch.edge_ids], batch_coo)
+        assert np.array_equal(np.sort(batch.edge_ids), np.flatnonzero(mask))
+
+    # part ids are cached and reloaded, a different method or graph partitions again
+    cached_parts = np.random.randint(0, 8, [400]).astype(dataset.parts.dtype)
+    save_graph_store(cache_path, {"parts": cached_parts}, GraphStore(cache_path).meta)
+    assert np.array_equal(ClusterGCNDataset(graph, 8, cache_path=cache_path).parts, cached_parts)
+    assert np.array_equal(ClusterGCNDataset(graph, 8, method="fennel", cache_path=cache_path).parts,
+                          partition_graph(graph, 8, "fennel"))
+    assert GraphStore(cache_path).meta["method"] == "fennel"
+    other_graph, _ = _random_graph(edge_count=2500)
+    ClusterGCNDataset(other_graph, 8, method="fennel", cache_path=cache_path)
+    assert GraphStore(cache_path).meta["edge_count"] == 2500
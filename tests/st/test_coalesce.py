@@ -0,0 +1,100 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test coalesce """
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHomoGraph, BatchMeta
+from mindspore_gl.graph.coalesce import coalesce, coalesce_graph, gather_edge_feat
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("self_loop", [None, "remove", "add"])
+@pytest.mark.parametrize("reduce", ["sum", "mean", "max", "first"])
+def test_coalesce(self_loop, reduce):
+    """
+    Feature: test coalesce of coo edges
+    Description: coalesce random coo with duplicate edges and self loops
+    Expectation: edges are unique and sorted by (dst, src), weights are merged and perm points to input edges
+    """
+    node_count = 20
+    adj_coo = np.random.randint(0, node_count, [2, 300])
+    weight = np.random.rand(300, 2)
+    res_coo, res_weight, perm = coalesce(adj_coo, node_count, weight, reduce, self_loop, fill_value=-1.,
+                                         return_perm=True)
+    keys = res_coo[1] * node_count + res_coo[0]
+    assert np.all(keys[1:] > keys[:-1])
+
+    expected = {}
+    for idx, (src, dst) in enumerate(adj_coo.T):
+        if self_loop != "remove" or src != dst:
+            expected.setdefault((src, dst), []).append(idx)
+    if self_loop == "add":
+        for node in range(node_count):
+            expected.setdefault((node, node), [])
+    assert len(expected) == res_coo.shape[1]
+    for (src, dst), edge_weight, pos in zip(res_coo.T, res_weight, perm):
+        idx = expected[(src, dst)]
+        if not idx:
+            assert pos == -1 and np.all(edge_weight == -1.)
+            continue
+        assert pos == idx[0]
+        reduced = {"sum": weight[idx].sum(0), "mean": weight[idx].mean(0), "max": weight[idx].max(0),
+                   "first": weight[idx[0]]}[reduce]
+        assert np.allclose(edge_weight, reduced)
+
+    edge_feat = gather_edge_feat(np.arange(300), perm)
+    assert np.array_equal(edge_feat[perm >= 0], perm[perm >= 0])
+    assert np.all(edge_feat[perm < 0] == 0)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_coalesce_batched_graph():
+    """
+    Feature: test coalesce of batched graph
+    Description: coalesce a batched graph of two graphs with duplicate edges and add self loops
+    Expectation: edges stay grouped by graph and batch meta is updated
+    """
+    adj_coo = np.array([[0, 0, 1, 3, 4, 3], [1, 1, 0, 4, 3, 4]], dtype=np.int32)
+    graph = MindHomoGraph()
+    graph.set_topo_coo(adj_coo)
+    graph.node_count = 5
+    graph.edge_count = 6
+    graph.batch_meta = BatchMeta(np.array([0, 3, 5]), np.array([0, 3, 6]))
+
+    res = coalesce_graph(graph, self_loop="add")
+    assert np.array_equal(res.batch_meta.graph_edges, [0, 5, 9])
+    assert res.edge_count == 9
+    assert np.array_equal(res[0].adj_coo, [[0, 1, 0, 1, 2], [0, 0, 1, 1, 2]])
+    assert np.array_equal(res[1].adj_coo, [[0, 1, 0, 1], [0, 0, 1, 1]])
+    assert np.array_equal(res.edge_ids, [-1, 2, 0, -1, -1, -1, 4, 3, -1])
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_coalesce_invalid_args():
+    """
+    Feature: test coalesce argument check
+    Description: coalesce with unknown reduce, self loop mode and sort order
+    Expectation: ValueError is raised
+    """
+    adj_coo = np.array([[0, 1], [1, 0]])
+    for kwargs in [{"reduce": "prod"}, {"self_loop": "keep"}, {"sort_by": "edge"}]:
+        with pytest.raises(ValueError):
+            coalesce(adj_coo, **kwargs)
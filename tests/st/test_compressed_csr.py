@@ -0,0 +1,83 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test compressed csr """
+import os
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHomoGraph, MindRelationGraph, CompressedCsrAdj
+from mindspore_gl.sampling.neighbor import sage_sampler_on_homo
+from mindspore_gl.sampling.randomwalks import random_walk_unbias_on_homo
+from graph_utils import random_homo_graph
+
+
+def _random_csr(node_count, edge_count):
+    # block heads above 127 and small in-block gaps give both two and one byte varints
+    return random_homo_graph(node_count, edge_count).adj_csr
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_compressed_csr():
+    """
+    Feature: test gap and varint compressed csr
+    Description: compress a csr with small blocks and decode rows and the full csr
+    Expectation: decoded neighbor lists equal the sorted original ones
+    """
+    csr = _random_csr(300, 5000)
+    csr.indptr[5:8] = csr.indptr[5]
+    adj, perm = CompressedCsrAdj.from_csr(csr, 300, block_size=4, return_perm=True)
+    decoded = adj.to_csr()
+    assert np.array_equal(decoded.indptr, csr.indptr)
+    assert np.array_equal(decoded.indices, csr.indices[perm])
+    for row in [0, 5, 6, 299]:
+        assert np.array_equal(adj.row(row), np.sort(csr.indices[csr.indptr[row]: csr.indptr[row + 1]]))
+    indptr, indices, positions = adj.gather_rows(np.array([7, 3, 3]), return_positions=True)
+    assert np.array_equal(indices, decoded.indices[positions])
+    assert np.array_equal(np.diff(indptr), np.diff(csr.indptr)[[7, 3, 3]])
+
+    relation_graph = MindRelationGraph("a", "b", "c")
+    relation_graph.set_topo(adj)
+    assert np.array_equal(relation_graph.successors(3), decoded.indices[decoded.indptr[3]: decoded.indptr[4]])
+    assert np.array_equal(relation_graph.in_degrees(), np.bincount(csr.indices, minlength=300))
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_sample_on_compressed_csr(tmp_path):
+    """
+    Feature: test sampling on compressed csr
+    Description: sample neighbors and random walks on a compressed graph loaded from graph store
+    Expectation: sampled edges exist in the graph
+    """
+    graph = MindHomoGraph()
+    graph.set_topo(CompressedCsrAdj.from_csr(_random_csr(200, 3000), 200, block_size=8))
+    store_path = os.path.join(str(tmp_path), "graph")
+    graph.to_store(store_path)
+    graph = MindHomoGraph.from_store(store_path)
+    assert isinstance(graph.adj_csr, CompressedCsrAdj)
+    decoded = graph.adj_csr.to_csr()
+    seeds = np.arange(20, dtype=np.int32)
+
+    res = sage_sampler_on_homo(graph, seeds, [5])
+    edges = res["all_nodes"][res["layered_edges_0"]]
+    for src, dst in edges.T:
+        assert dst in decoded.indices[decoded.indptr[src]: decoded.indptr[src + 1]]
+
+    walks = random_walk_unbias_on_homo(graph, seeds, 6)
+    for walk in walks:
+        for src, dst in zip(walk[:-1], walk[1:]):
+            assert dst == -1 or dst in graph.neighbors(src)
@@ -102,6 +102,27 @@ def test_distribute_random_batch_sample():
     assert np_ret.shape[1] == 3
 
 
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_distribute_random_batch_sample_with_parts():
+    """
+    Feature: use `DistributeRandomBatchSampler` with node parts of different sizes
+    Description: part 0 has 9 nodes and part 1 has 5 nodes, batch_size = 2, world_size = 2
+    Expectation: both ranks run the same number of steps over nodes of their own part
+    """
+    parts = np.array([0] * 9 + [1] * 5)
+    dataset = list(range(14))
+    steps = []
+    for rank_id in range(2):
+        dist_sampler = DistributeRandomBatchSampler(rank_id, 2, dataset, 2, parts=parts)
+        ret = np.array(list(dist_sampler))
+        assert ret.shape == (2, 2) and len(dist_sampler) == 2
+        assert np.all(parts[ret] == rank_id)
+        steps.append(len(ret))
+    assert steps[0] == steps[1]
+
+
 @pytest.mark.level0
 @pytest.mark.platform_x86_gpu_training
 @pytest.mark.env_onecard
@@ -0,0 +1,115 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test dynamic graph """
+import pickle
+from collections import Counter
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHomoGraph, coo_to_csr
+from mindspore_gl.graph.dynamic import DynamicHomoGraph
+from mindspore_gl.sampling.neighbor import sage_sampler_on_homo
+
+
+def _edges(adj_csr, edge_ids):
+    """multiset of (src, dst, edge id) of csr"""
+    rows = np.repeat(np.arange(adj_csr.indptr.shape[0] - 1), np.diff(adj_csr.indptr))
+    return Counter(zip(rows.tolist(), adj_csr.indices.tolist(), edge_ids.tolist()))
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("background", [False, True])
+def test_dynamic_graph(background):
+    """
+    Feature: test incremental edge updates
+    Description: add and remove random edges with compaction in between, compare with a python edge list
+    Expectation: neighbors, merged csr and edge ids match the edge list before and after compaction
+    """
+    node_count = 50
+    adj_coo = np.random.randint(0, node_count, [2, 300])
+    graph = MindHomoGraph()
+    graph.set_topo(coo_to_csr(adj_coo, node_count))
+    graph.node_count = node_count
+    dynamic_graph = DynamicHomoGraph(graph)
+    rows = np.repeat(np.arange(node_count), np.diff(graph.adj_csr.indptr))
+    expected = list(zip(rows.tolist(), graph.adj_csr.indices.tolist(), range(300)))
+
+    max_node = node_count
+    for step in range(6):
+        src, dst = np.random.randint(0, node_count + 5 * step, [2, 40])
+        new_ids = dynamic_graph.add_edges(src, dst)
+        expected += list(zip(src.tolist(), dst.tolist(), new_ids.tolist()))
+        removed = expected[::7][:10]
+        dynamic_graph.remove_edges(np.array([e[0] for e in removed]), np.array([e[1] for e in removed]))
+        removed = {e[:2] for e in removed}
+        expected = [e for e in expected if e[:2] not in removed]
+        if step % 2 == 1:
+            dynamic_graph.compact(background)
+            assert dynamic_graph.log_size == 0 or background
+
+        assert dynamic_graph.node_count == max(node_count, int(src.max()) + 1, int(dst.max()) + 1, max_node)
+        max_node = dynamic_graph.node_count
+        for node in range(0, dynamic_graph.node_count, 3):
+            assert sorted(dynamic_graph.neighbors(node).tolist()) == sorted(e[1] for e in expected if e[0] == node)
+        assert _edges(dynamic_graph.adj_csr, dynamic_graph.edge_ids) == Counter(expected)
+        assert dynamic_graph.edge_count == len(expected)
+
+    dynamic_graph.wait_compact()
+    restored = pickle.loads(pickle.dumps(dynamic_graph))
+    assert _edges(restored.adj_csr, restored.edge_ids) == Counter(expected)
+    res = sage_sampler_on_homo(dynamic_graph.to_graph(), np.arange(5), [3])
+    assert np.all(res["all_nodes"] < dynamic_graph.node_count)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_dynamic_graph_readd():
+    """
+    Feature: test order of updates
+    Description: remove an edge and add it again
+    Expectation: the edge added after removal is kept
+    """
+    graph = MindHomoGraph()
+    graph.set_topo_coo(np.array([[0, 0, 1], [1, 1, 2]]))
+    dynamic_graph = DynamicHomoGraph(graph)
+    dynamic_graph.remove_edges(np.array([0]), np.array([1]))
+    dynamic_graph.add_edges(np.array([0]), np.array([1]))
+    assert dynamic_graph.neighbors(0).tolist() == [1]
+    assert dynamic_graph.edge_ids.tolist() == [3, 2]
+    dynamic_graph.compact()
+    assert dynamic_graph.neighbors(0).tolist() == [1]
+    dynamic_graph.remove_edges(np.array([0]), np.array([1]))
+    assert dynamic_graph.neighbors(0).tolist() == []
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_dynamic_graph_remove_missing_node():
+    """
+    Feature: test removing edges with nodes outside the graph
+    Description: remove edges whose keys would collide with the self loop (1, 1) of a 4 node graph
+    Expectation: no existing edge is removed
+    """
+    graph = MindHomoGraph()
+    graph.set_topo_coo(np.array([[0, 1, 2], [1, 1, 3]]))
+    dynamic_graph = DynamicHomoGraph(graph)
+    dynamic_graph.remove_edges(np.array([0, 2, -1]), np.array([5, -3, 1]))
+    assert dynamic_graph.neighbors(1).tolist() == [1]
+    dynamic_graph.compact()
+    assert dynamic_graph.neighbors(1).tolist() == [1]
+    assert dynamic_graph.edge_ids.tolist() == [0, 1, 2]
@@ -27,7 +27,8 @@ from mindspore_gl.dataloader.dataloader import DataLoader
 from mindspore_gl.dataloader.samplers import RandomBatchSampler
 from mindspore_gl.dataset.imdb_binary import IMDBBinary
 from mindspore_gl import BatchedGraph, BatchedGraphField
-from mindspore_gl.graph.ops import BatchHomoGraph, PadArray2d, PadHomoGraph, PadMode, PadDirection
+from mindspore_gl.graph.ops import BatchHomoGraph, PadArray2d, PadHomoGraph, PadMode, PadDirection, \
+    unpad_graph_feat
 
 data_path = "/home/workspace/mindspore_dataset/GNN_Dataset/"
 
@@ -325,9 +326,10 @@ def test_gin():
                 constant_graph_mask
             )
             output = net(node_feat, edge_feat, *batch_homo.get_batched_graph()).asnumpy()
-            label = label
+            output = unpad_graph_feat(output, batch_graph.batch_meta)
+            label = unpad_graph_feat(label, batch_graph.batch_meta)
             predict = np.argmax(output, axis=1)
-            test_count += np.sum(np.equal(predict, label) * np_graph_mask)
+            test_count += np.sum(np.equal(predict, label))
         test_acc = test_count / len(test_dataloader) / batch_size
         best_acc = test_acc if test_acc > best_acc else best_acc
     assert best_acc > 0.63
@@ -0,0 +1,130 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test graph format conversion """
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHomoGraph, MindRelationGraph, MindHeteroGraph, coo_to_csr, csr_to_coo, \
+    csr_to_csc
+from mindspore_gl.dataset.utils import get_indptr_from_coo_src
+
+coo_array = np.array([[3, 0, 1, 1, 2, 0, 3, 4, 2, 5],
+                      [4, 1, 0, 2, 1, 3, 0, 3, 5, 2]], dtype=np.int32)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_coo_to_csr():
+    """
+    Feature: test coo to csr conversion
+    Description: convert an unsorted coo array
+    Expectation: indptr counts out degrees and edges keep coo order inside each row
+    """
+    adj_csr, perm = coo_to_csr(coo_array, node_count=7, return_perm=True)
+    assert (adj_csr.indptr == np.array([0, 2, 4, 6, 8, 9, 10, 10])).all()
+    assert (adj_csr.indices == np.array([1, 3, 0, 2, 1, 5, 4, 0, 3, 2])).all()
+    assert (coo_array[:, perm] == csr_to_coo(adj_csr)).all()
+
+    chunked_csr = coo_to_csr(coo_array, node_count=7, chunk_size=3, num_workers=2)
+    assert (chunked_csr.indptr == adj_csr.indptr).all()
+    assert (chunked_csr.indices == adj_csr.indices).all()
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_csr_to_csc():
+    """
+    Feature: test csr to csc conversion
+    Description: reverse the csr of a coo array
+    Expectation: csc indptr counts in degrees and perm maps csc edges to csr edges
+    """
+    adj_csr = coo_to_csr(coo_array)
+    adj_csc, perm = csr_to_csc(adj_csr, return_perm=True)
+    assert (np.diff(adj_csc.indptr) == np.bincount(coo_array[1], minlength=6)).all()
+    assert (adj_csc.indices == csr_to_coo(adj_csr)[0][perm]).all()
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_lazy_format():
+    """
+    Feature: test lazy format properties of graphs
+    Description: build graphs from coo and csr then query other formats
+    Expectation: each format describes the same edge set
+    """
+    graph = MindHomoGraph()
+    graph.set_topo_coo(coo_array)
+    assert graph.node_count == 6
+    assert graph.degree(0) == 2
+    assert (np.sort(graph.neighbors(2)) == np.array([1, 5])).all()
+    assert graph.adj_csc.indptr.shape[0] == 7
+
+    relation_graph = MindRelationGraph("user", "user", "follow")
+    relation_graph.set_topo(graph.adj_csr)
+    assert relation_graph.node_num == 6
+    assert (relation_graph.format('coo') == csr_to_coo(graph.adj_csr)).all()
+    assert (relation_graph.format('csc').indptr == graph.adj_csc.indptr).all()
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_batched_neighbor_query():
+    """
+    Feature: test batched neighbor and degree queries on relation graph
+    Description: query successors, predecessors and degrees of a batch of nodes
+    Expectation: batched results equal to per-node results
+    """
+    relation_graph = MindRelationGraph("user", "user", "follow")
+    relation_graph.set_topo(coo_to_csr(coo_array))
+    hetero_graph = MindHeteroGraph()
+    hetero_graph.add_graph(relation_graph)
+    relation_type = relation_graph.relation_type
+    nodes = np.array([0, 3, 5, 3])
+
+    assert (hetero_graph.in_degrees(relation_type, nodes) == np.array([2, 2, 1, 2])).all()
+    assert (hetero_graph.out_degrees(relation_type, nodes) == np.array([2, 2, 1, 2])).all()
+    assert (hetero_graph.in_degrees(relation_type) == np.bincount(coo_array[1])).all()
+    indptr, indices = hetero_graph.predecessors_batch(relation_type, nodes)
+    for idx, node in enumerate(nodes):
+        assert hetero_graph.in_degree(relation_type, node) == indptr[idx + 1] - indptr[idx]
+        assert (np.sort(indices[indptr[idx]: indptr[idx + 1]]) ==
+                np.sort(hetero_graph.predecessors(relation_type, node))).all()
+        assert (np.sort(hetero_graph.predecessors(relation_type, node)) ==
+                np.sort(coo_array[0][coo_array[1] == node])).all()
+    indptr, indices = hetero_graph.successors_batch(relation_type, nodes)
+    assert (indices[indptr[1]: indptr[2]] == hetero_graph.successors(relation_type, 3)).all()
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_indptr_from_coo_src():
+    """
+    Feature: test building csr indptr from coo source nodes
+    Description: build indptr from sorted and unsorted sources with isolated nodes
+    Expectation: result equals coo_to_csr
+    """
+    coo_array = np.stack([np.random.randint(0, 100, [2000]), np.random.randint(0, 100, [2000])])
+    coo_array[:, coo_array[0] == 7] = 8
+    csr, perm = coo_to_csr(coo_array, 101, return_perm=True)
+    indptr, src_perm = get_indptr_from_coo_src(coo_array[0], node_count=101, return_perm=True)
+    assert np.array_equal(indptr, csr.indptr)
+    assert np.array_equal(src_perm, perm)
+    result_array = np.zeros([102], dtype=np.int64)
+    get_indptr_from_coo_src(np.sort(coo_array[0]), result_array)
+    assert np.array_equal(result_array, csr.indptr)
@@ -0,0 +1,59 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test graph statistics """
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+from mindspore_gl.graph.graph import MindHomoGraph, CompressedCsrAdj
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_graph_stats():
+    """
+    Feature: test graph statistics
+    Description: compute statistics of a random graph with isolated nodes, self loops and duplicate edges
+    Expectation: statistics match a direct computation and are cached until topology changes
+    """
+    node_count = 300
+    adj_coo = np.random.randint(0, 200, [2, 500])
+    graph = MindHomoGraph()
+    graph.set_topo_coo(adj_coo)
+    graph.node_count = node_count
+    stats = graph.stats()
+    assert graph.stats() is stats
+
+    out_degrees = np.bincount(adj_coo[0], minlength=node_count)
+    in_degrees = np.bincount(adj_coo[1], minlength=node_count)
+    assert stats.node_count == node_count and stats.edge_count == 500
+    assert stats.out_degree.max == out_degrees.max() and stats.in_degree.min == in_degrees.min()
+    assert stats.out_degree.p90 == np.sort(out_degrees)[int(np.ceil(0.9 * (node_count - 1)))]
+    assert stats.out_degree.histogram.sum() == node_count
+    assert stats.out_degree.histogram[0] == np.count_nonzero(out_degrees == 0)
+    assert stats.isolated_node_count == np.count_nonzero(out_degrees + in_degrees == 0)
+    assert stats.self_loop_count == np.count_nonzero(adj_coo[0] == adj_coo[1])
+    assert stats.duplicate_edge_count == 500 - len(set(zip(adj_coo[0].tolist(), adj_coo[1].tolist())))
+    adj = sp.coo_matrix((np.ones(500), (adj_coo[0], adj_coo[1])), shape=(node_count, node_count))
+    component_count, labels = connected_components(adj, directed=True, connection='weak')
+    assert stats.component_count == component_count
+    assert stats.largest_component_size == np.bincount(labels).max()
+    compressed = CompressedCsrAdj.from_csr(graph.adj_csr, node_count)
+    assert stats.format_bytes["compressed_csr"] == compressed.nbytes
+    assert "duplicate edges" in stats.report()
+
+    graph.set_topo_coo(adj_coo[:, :100])
+    assert graph.stats().edge_count == 100
@@ -0,0 +1,123 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test graph store """
+import os
+import pickle
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHomoGraph, coo_to_csr
+from mindspore_gl.graph.node_map import NodeIdMap
+from mindspore_gl.graph.store import GraphStore, build_csr_store, is_graph_store
+from mindspore_gl.dataset.utils import load_npz_or_store
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_homo_graph_store(tmp_path):
+    """
+    Feature: test saving and memory mapping MindHomoGraph from graph store
+    Description: save a graph with features, load it back and pickle it
+    Expectation: loaded arrays are memory mapped and equal to the saved ones
+    """
+    coo_array = np.array([[0, 0, 1, 2], [1, 2, 2, 0]], dtype=np.int32)
+    graph = MindHomoGraph()
+    graph.set_topo(coo_to_csr(coo_array), NodeIdMap(global_ids=np.array([30, 10, 20])),
+                   np.arange(4, dtype=np.int32))
+    feat = np.random.rand(3, 4).astype(np.float32)
+    store_path = os.path.join(str(tmp_path), "graph")
+    graph.to_store(store_path, feat=feat)
+
+    loaded_graph = MindHomoGraph.from_store(store_path)
+    assert isinstance(loaded_graph.adj_csr.indices, np.memmap)
+    assert (loaded_graph.adj_csr.indptr == graph.adj_csr.indptr).all()
+    assert (loaded_graph.neighbors(30) == np.array([10, 20])).all()
+    assert (loaded_graph.store["feat"] == feat).all()
+    assert loaded_graph.store.meta["edge_count"] == 4
+
+    unpickled_graph = pickle.loads(pickle.dumps(loaded_graph))
+    assert isinstance(unpickled_graph.adj_csr.indices, np.memmap)
+    assert (unpickled_graph.neighbors(20) == np.array([30])).all()
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_store_from_npz(tmp_path):
+    """
+    Feature: test converting npz file into graph store
+    Description: convert a npz file with two arrays
+    Expectation: store can be indexed like the npz file
+    """
+    npz_path = os.path.join(str(tmp_path), "data.npz")
+    np.savez(npz_path, edge_array=np.arange(6).reshape(2, 3), label=np.array([1, 0]))
+    store = GraphStore.from_npz(npz_path, os.path.join(str(tmp_path), "data"))
+    assert sorted(store.files) == ["edge_array", "label"]
+    assert (store["edge_array"] == np.arange(6).reshape(2, 3)).all()
+    assert store.get("feat") is None
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_build_csr_store(tmp_path):
+    """
+    Feature: test out-of-core csr build of a memory mapped edge index
+    Description: build csr and reverse csr in small chunks from sorted and unsorted edges
+    Expectation: result equals in-memory coo_to_csr
+    """
+    src = np.random.randint(0, 50, [1000])
+    dst = np.random.randint(0, 30, [1000])
+    for name, edge_index in (("unsorted", np.stack([src, dst])), ("sorted", np.stack([np.sort(src), dst]))):
+        edge_path = os.path.join(str(tmp_path), f"{name}.npy")
+        np.save(edge_path, edge_index)
+        store = build_csr_store(os.path.join(str(tmp_path), name), np.load(edge_path, mmap_mode="r"),
+                                50, 30, chunk_size=128)
+        csr, perm = coo_to_csr(edge_index, 50, return_perm=True)
+        assert np.array_equal(store["indptr"], csr.indptr)
+        assert np.array_equal(store["indices"], csr.indices)
+        assert np.array_equal(store.get("edge_ids", np.arange(1000)), perm)
+        rev_csr, rev_perm = coo_to_csr(edge_index[::-1], 30, return_perm=True)
+        assert np.array_equal(store["rev_indptr"], rev_csr.indptr)
+        assert np.array_equal(store["rev_indices"], rev_csr.indices)
+        assert np.array_equal(store["rev_edge_ids"], rev_perm)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_load_npz_or_store(tmp_path):
+    """
+    Feature: test dataset loading from npz
+    Description: load a npz dataset file twice, and once where the store can not be written
+    Expectation: npz is converted into a memory mapped store on first load, else arrays are read into memory
+    """
+    feat = np.random.rand(5, 3).astype(np.float32)
+    npz_path = os.path.join(str(tmp_path), "data.npz")
+    np.savez(npz_path, feat=feat, graph_nodes=np.arange(6))
+    arrays = load_npz_or_store(npz_path)
+    assert isinstance(arrays, GraphStore) and is_graph_store(os.path.join(str(tmp_path), "data"))
+    assert isinstance(arrays["feat"], np.memmap) and np.array_equal(arrays["feat"], feat)
+    assert isinstance(load_npz_or_store(npz_path), GraphStore)
+    assert sorted(os.listdir(str(tmp_path))) == ["data", "data.npz"]
+
+    # store path taken by a file, the store can not be written
+    blocked = os.path.join(str(tmp_path), "blocked")
+    os.makedirs(blocked)
+    np.savez(os.path.join(blocked, "data.npz"), feat=feat)
+    open(os.path.join(blocked, "data"), "w").close()
+    arrays = load_npz_or_store(os.path.join(blocked, "data.npz"))
+    assert np.array_equal(arrays["feat"], feat)
+    assert sorted(os.listdir(blocked)) == ["data", "data.npz"]
@@ -0,0 +1,103 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test batch and pad of heterogeneous graphs """
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHeteroGraph, MindRelationGraph, coo_to_csr
+from mindspore_gl.graph.ops import BatchHeteroGraph, PadHeteroGraph, PadMode
+
+RELATIONS = [("user", "click", "item"), ("item", "clicked", "user"), ("user", "follow", "user")]
+
+
+def _random_hetero_graph(skip_relation=None):
+    node_counts = {"user": np.random.randint(1, 10), "item": np.random.randint(1, 10)}
+    graph = MindHeteroGraph()
+    for src_type, edge_type, dst_type in RELATIONS:
+        if edge_type == skip_relation:
+            continue
+        # relation rows may be fewer than source nodes
+        src_count = np.random.randint(1, node_counts[src_type] + 1)
+        adj_coo = np.stack([np.random.randint(0, src_count, 12), np.random.randint(0, node_counts[dst_type], 12)])
+        rel_graph = MindRelationGraph(src_type, dst_type, edge_type)
+        rel_graph.set_topo(coo_to_csr(adj_coo, src_count), dst_node_num=node_counts[dst_type])
+        graph.add_graph(rel_graph)
+    for node_type, node_count in node_counts.items():
+        graph.set_node_count(node_type, node_count)
+    return graph
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_batch_hetero_graph():
+    """
+    Feature: test batch of heterogeneous graphs
+    Description: batch random heterogeneous graphs, some without a relation
+    Expectation: each relation has the edges of all graphs offset by node counts of its node types
+    """
+    graphs = [_random_hetero_graph("follow" if idx % 3 == 1 else None) for idx in range(7)]
+    batch_graph = BatchHeteroGraph()(graphs)
+    batch_meta = batch_graph.batch_meta
+    assert batch_meta.graph_count == 7
+    for node_type in ["user", "item"]:
+        counts = [graph.node_count(node_type) for graph in graphs]
+        assert batch_graph.node_count(node_type) == sum(counts)
+        assert np.array_equal(np.diff(batch_meta.graph_nodes[node_type]), counts)
+        assert np.array_equal(batch_meta.node_map_idx(node_type), np.repeat(np.arange(7), counts))
+    for src_type, edge_type, dst_type in RELATIONS:
+        relation_type = f"{src_type}_{edge_type}_{dst_type}"
+        expected = []
+        for idx, graph in enumerate(graphs):
+            if relation_type in graph.relation_types:
+                adj_coo = graph.get_graph(relation_type).adj_coo
+                expected.append(adj_coo + np.array([[batch_meta.graph_nodes[src_type][idx]],
+                                                    [batch_meta.graph_nodes[dst_type][idx]]]))
+        assert np.array_equal(batch_graph.get_graph(relation_type).adj_coo, np.concatenate(expected, axis=1))
+        node_counts, edge_counts = batch_meta[1]
+        assert edge_counts[relation_type] == (12 if relation_type in graphs[1].relation_types else 0)
+        assert node_counts["user"] == graphs[1].node_count("user")
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("mode", [PadMode.AUTO, PadMode.CONST])
+def test_pad_hetero_graph(mode):
+    """
+    Feature: test pad of heterogeneous graphs
+    Description: pad a batched heterogeneous graph with one plan for all relations
+    Expectation: node and edge counts match the plan, original edges are kept and pad edges join padded nodes
+    """
+    batch_graph = BatchHeteroGraph()([_random_hetero_graph() for _ in range(3)])
+    n_nodes = {"user": 64, "item": 64}
+    n_edges = {f"{src}_{edge}_{dst}": 64 for src, edge, dst in RELATIONS}
+    pad_graph = PadHeteroGraph(n_nodes, n_edges, mode)(batch_graph)
+    if mode == PadMode.AUTO:
+        n_nodes = {key: 1 << int(np.ceil(np.log2(batch_graph.node_count(key) + 1))) for key in n_nodes}
+        n_edges = {key: 64 for key in n_edges}
+    assert pad_graph.batch_meta.graph_count == 4
+    src_idx, dst_idx, field_nodes, field_edges = pad_graph.to_field_inputs()
+    for idx, (src_type, _, dst_type) in enumerate(RELATIONS):
+        relation_type = pad_graph.relation_types[idx]
+        edge_count = batch_graph.get_graph(relation_type).edge_num
+        assert field_edges[idx] == n_edges[relation_type] == src_idx[idx].shape[0]
+        assert field_nodes[idx] == n_nodes[dst_type]
+        assert np.array_equal(np.stack([src_idx[idx][:edge_count], dst_idx[idx][:edge_count]]),
+                              batch_graph.get_graph(relation_type).adj_coo)
+        assert np.all(src_idx[idx][edge_count:] == n_nodes[src_type] - 1)
+        assert np.all(dst_idx[idx][edge_count:] == n_nodes[dst_type] - 1)
+    for node_type, node_count in n_nodes.items():
+        assert pad_graph.node_count(node_type) == node_count
+        assert pad_graph.batch_meta.graph_nodes[node_type][-1] == node_count
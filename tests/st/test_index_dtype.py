@@ -0,0 +1,92 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test index data type policy """
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHomoGraph, CsrAdj, get_index_dtype
+from mindspore_gl.graph.ops import BatchHomoGraph, PadHomoGraph, PadMode
+from mindspore_gl.dataset.utils import as_index_array
+from mindspore_gl.sampling.neighbor import sage_sampler_on_homo
+from mindspore_gl.sampling.randomwalks import random_walk_unbias_on_homo
+from mindspore_gl import sample_kernel
+from graph_utils import random_homo_graph
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_index_dtype_policy():
+    """
+    Feature: test choosing index data type from element counts
+    Description: choose index data type for small and large counts
+    Expectation: int32 is used only when all counts fit in it
+    """
+    assert get_index_dtype(100, 1000) == np.int32
+    assert get_index_dtype(100, 1 << 31) == np.int64
+    assert as_index_array(np.array([0, 5, 9], dtype=np.int64)).dtype == np.int32
+    assert as_index_array(np.array([0, 5, 9]), 1 << 32).dtype == np.int64
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("dtype", [np.int32, np.int64])
+def test_sample_with_index_dtype(dtype):
+    """
+    Feature: test sampling kernels on int32 and int64 csr
+    Description: sample neighbors and random walks on csr of the given data type
+    Expectation: results keep the index data type, sampled edges exist and are not repeated
+    """
+    csr = random_homo_graph(100, 3000).adj_csr
+    csr = CsrAdj(csr.indptr.astype(dtype), csr.indices.astype(dtype))
+    seeds = np.arange(10, dtype=dtype)
+    edge_index, edge_ids = sample_kernel.sample_one_hop_unbias(csr.indptr, csr.indices, 5, seeds)
+    assert edge_index.dtype == dtype and edge_ids.dtype == dtype
+    assert np.array_equal(csr.indices[edge_ids], edge_index[1])
+    assert np.all(csr.indptr[edge_index[0]] <= edge_ids) and np.all(edge_ids < csr.indptr[edge_index[0] + 1])
+    assert np.unique(edge_ids).shape[0] == edge_ids.shape[0]
+
+    graph = MindHomoGraph()
+    graph.set_topo(csr)
+    res = sage_sampler_on_homo(graph, np.arange(10), [3, 3])
+    assert res["all_nodes"].dtype == dtype
+    walks = random_walk_unbias_on_homo(graph, np.arange(10), 4)
+    assert walks.dtype == dtype
+    for walk in walks:
+        for src, dst in zip(walk[:-1], walk[1:]):
+            assert dst in graph.neighbors(src)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("mode", [PadMode.CONST, PadMode.AUTO])
+def test_batch_and_pad_index_dtype(mode):
+    """
+    Feature: test index data type of batch and pad ops
+    Description: batch int64 graphs and pad single graphs
+    Expectation: results use the smallest fitting index type, padded edges point to padded nodes in range
+    """
+    graphs = [random_homo_graph(node_count, edge_count, dtype=np.int64) for node_count, edge_count in [(5, 7), (3, 4)]]
+    batch_graph = BatchHomoGraph()(graphs)
+    assert batch_graph.adj_coo.dtype == np.int32
+    assert np.array_equal(batch_graph.adj_coo[:, 7:], graphs[1].adj_coo + 5)
+
+    pad_op = PadHomoGraph(n_node=12, n_edge=20, mode=mode)
+    pad_graph = pad_op(graphs[0])
+    assert pad_graph.adj_coo.shape[1] == pad_graph.edge_count
+    assert np.all(pad_graph.adj_coo < pad_graph.node_count)
+    assert np.array_equal(pad_graph.adj_coo[:, :7], graphs[0].adj_coo)
+    assert np.all(pad_graph.adj_coo[:, 7:] == pad_graph.node_count - 1)
@@ -0,0 +1,76 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test layer-wise sampler """
+import numpy as np
+import pytest
+from mindspore_gl.sampling.layerwise import LayerWiseSampler
+from graph_utils import random_homo_graph
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("mode", ['ladies', 'fastgcn'])
+def test_layerwise_sampler(mode):
+    """
+    Feature: test layer-wise importance sampling
+    Description: sample 3 layers of 40 nodes around seeds on a random graph
+    Expectation: layer node count is bounded by layer size, blocks chain and edges are graph edges
+    """
+    graph, adj_coo = random_homo_graph(500, 6000, return_coo=True)
+    out_degrees = np.bincount(adj_coo[0], minlength=500)
+    in_degrees = np.bincount(adj_coo[1], minlength=500)
+    seeds = np.array([3, 17, 3, 250, 499], dtype=np.int32)
+    blocks, seeds_idx = LayerWiseSampler(graph, [40, 40, 40], mode)(seeds)
+
+    assert np.array_equal(blocks[-1].src_nodes[:blocks[-1].dst_count][seeds_idx], seeds)
+    for block, next_block in zip(blocks[:-1], blocks[1:]):
+        assert np.array_equal(block.src_nodes[:block.dst_count], next_block.src_nodes)
+    for block in blocks:
+        src_nodes = block.src_nodes
+        assert np.unique(src_nodes).shape[0] == src_nodes.shape[0]
+        assert src_nodes.shape[0] <= block.dst_count + 40
+        assert np.all(block.edges[1] < block.dst_count)
+        src, dst = src_nodes[block.edges]
+        assert np.array_equal(adj_coo[:, block.eids], np.stack([dst, src]))
+        # all edges of dst nodes to sampled nodes are kept, weights are at least the normalized adjacency
+        sampled = src_nodes[block.dst_count:]
+        assert np.unique(src[~np.isin(src, src_nodes[:block.dst_count])]).shape[0] == sampled.shape[0]
+        normalized = 1. / np.sqrt(out_degrees[dst] * in_degrees[src])
+        assert np.all(block.edge_weight >= normalized - 1e-12)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_layerwise_sampler_full_layer():
+    """
+    Feature: test layer-wise sampling with layer size above candidate count
+    Description: sample 2 layers with a large layer size
+    Expectation: all out edges of dst nodes are kept with normalized adjacency weights
+    """
+    graph, adj_coo = random_homo_graph(200, 600, return_coo=True)
+    out_degrees = np.bincount(adj_coo[0], minlength=200)
+    in_degrees = np.bincount(adj_coo[1], minlength=200)
+    blocks, _ = LayerWiseSampler(graph, [1000, 1000])(np.array([1, 2], dtype=np.int32))
+    for block in blocks:
+        src, dst = block.src_nodes[block.edges]
+        assert block.eids.shape[0] == np.sum(out_degrees[block.src_nodes[:block.dst_count]])
+        assert np.allclose(block.edge_weight, 1. / np.sqrt(out_degrees[dst] * in_degrees[src]))
+
+    with pytest.raises(ValueError):
+        LayerWiseSampler(graph, [10], 'uniform')
+    with pytest.raises(ValueError):
+        LayerWiseSampler(graph, [10, 0])
@@ -0,0 +1,75 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test neighbor sampler """
+import numpy as np
+import pytest
+from mindspore_gl.sampling.neighbor import sage_sampler_on_homo, sage_block_sampler_on_homo
+from graph_utils import random_homo_graph
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_sage_sampler_reindex():
+    """
+    Feature: test reindex of sage sampler
+    Description: sample 2 hops on a random graph built from unsorted coo, with repeated seeds
+    Expectation: nodes are distinct with seeds first, local edges and edge ids match the graph edges
+    """
+    node_count, edge_count = 300, 4000
+    graph, adj_coo = random_homo_graph(node_count, edge_count, return_coo=True)
+    seeds = np.array([7, 3, 7, 120, 3], dtype=np.int32)
+
+    res = sage_sampler_on_homo(graph, seeds, [5, 4])
+    all_nodes = res['all_nodes']
+    assert np.unique(all_nodes).shape[0] == all_nodes.shape[0]
+    assert np.array_equal(all_nodes[:3], [7, 3, 120])
+    assert np.array_equal(all_nodes[res['seeds_idx']], seeds)
+    hop_sources = np.unique(seeds)
+    for idx in range(2):
+        edges = all_nodes[res[f'layered_edges_{idx}']]
+        eids = res[f'layered_eids_{idx}']
+        assert np.array_equal(adj_coo[:, eids], edges)
+        assert np.all(np.isin(edges[0], hop_sources))
+        hop_sources = np.unique(edges[1])
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_sage_block_sampler():
+    """
+    Feature: test bipartite block output of sage sampler
+    Description: sample 3 hops into blocks on a random graph built from unsorted coo
+    Expectation: blocks chain from input to seeds with dst nodes first, edges are sampled graph edges
+    """
+    node_count, edge_count = 300, 2000
+    graph, adj_coo = random_homo_graph(node_count, edge_count, return_coo=True)
+    seeds = np.array([5, 9, 5, 200], dtype=np.int32)
+    out_degrees = np.bincount(adj_coo[0], minlength=node_count)
+
+    blocks, seeds_idx = sage_block_sampler_on_homo(graph, seeds, [4, 3, 2])
+    assert len(blocks) == 3
+    assert np.array_equal(blocks[-1].src_nodes[:blocks[-1].dst_count][seeds_idx], seeds)
+    for block, next_block in zip(blocks[:-1], blocks[1:]):
+        assert np.array_equal(block.src_nodes[:block.dst_count], next_block.src_nodes)
+    for block, neighbor_num in zip(blocks, [2, 3, 4]):
+        src_nodes = block.src_nodes
+        assert np.unique(src_nodes).shape[0] == src_nodes.shape[0]
+        assert np.all(block.edges[1] < block.dst_count)
+        # messages flow from sampled neighbor to dst node along graph edge src -> neighbor
+        assert np.array_equal(adj_coo[:, block.eids], src_nodes[block.edges[[1, 0]]])
+        in_counts = np.bincount(block.edges[1], minlength=block.dst_count)
+        assert np.array_equal(in_counts, np.minimum(out_degrees[src_nodes[:block.dst_count]], neighbor_num))
@@ -0,0 +1,75 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test node id map """
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHomoGraph, coo_to_csr
+from mindspore_gl.graph.node_map import NodeIdMap
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_node_id_map():
+    """
+    Feature: test node id mapping
+    Description: map ids with identity, sparse global ids and dict built mappings
+    Expectation: to_local and to_global are inverse of each other
+    """
+    identity_map = NodeIdMap(5)
+    assert identity_map.is_identity
+    assert (identity_map.to_local(np.array([4, 0])) == np.array([4, 0])).all()
+    assert (identity_map.contains(np.array([-1, 2, 5])) == np.array([False, True, False])).all()
+
+    global_ids = np.array([100, 7, 42, 1000000007])
+    sparse_map = NodeIdMap(global_ids=global_ids)
+    assert (sparse_map.to_local(np.array([42, 100, 1000000007])) == np.array([2, 0, 3])).all()
+    assert (sparse_map.to_global(sparse_map.to_local(global_ids)) == global_ids).all()
+    assert (sparse_map.to_local(np.array([8, 7, 2000000000]), check=False) == np.array([-1, 1, -1])).all()
+    assert 7 in sparse_map and 8 not in sparse_map
+
+    dict_map = NodeIdMap.from_dict({100: 0, 7: 1, 42: 2})
+    assert (dict_map.global_ids == np.array([100, 7, 42])).all()
+    assert NodeIdMap.from_dict({idx: idx for idx in range(4)}).is_identity
+
+    empty_map = NodeIdMap(global_ids=np.array([], dtype=np.int64))
+    assert (empty_map.to_local(np.array([3, 0]), check=False) == np.array([-1, -1])).all()
+    assert empty_map.to_local(np.array([], dtype=np.int64)).shape == (0,)
+    assert 3 not in empty_map
+    with pytest.raises(AssertionError):
+        empty_map.to_local(np.array([3]))
+
+    graph = MindHomoGraph()
+    graph.set_topo_coo(np.array([[0, 1], [1, 2]]), node_dict=NodeIdMap(global_ids=np.array([5, 6, 7])))
+    empty_graph = graph.subgraph(np.array([], dtype=np.int64))
+    assert len(empty_graph.node_map) == 0 and not empty_graph.has_node(5)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_graph_with_node_map():
+    """
+    Feature: test graph queries through node id mapping
+    Description: build graph whose local nodes have sparse global ids
+    Expectation: neighbors, degree and has_node work on global ids
+    """
+    coo_array = np.array([[0, 0, 1, 2], [1, 2, 2, 0]])
+    graph = MindHomoGraph()
+    graph.set_topo(coo_to_csr(coo_array), node_dict=NodeIdMap(global_ids=np.array([30, 10, 20])))
+    assert (graph.neighbors(30) == np.array([10, 20])).all()
+    assert graph.degree(10) == 1
+    assert graph.has_node(20)
+    assert not graph.has_node(0)
@@ -0,0 +1,115 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test padding bucket policies """
+import itertools
+import math
+import numpy as np
+import pytest
+from mindspore_gl.graph.bucket import GeometricBucket, FixedBucket, LearnedBucket
+from mindspore_gl.graph.ops import PadHomoGraph, PadArray2d, PadMode, PadDirection
+from graph_utils import random_homo_graph
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_geometric_and_fixed_bucket():
+    """
+    Feature: test geometric and fixed bucket
+    Description: bucket sizes with ratio 2, ratio 1.25 and a fixed list with and without fallback
+    Expectation: ratio 2 gives powers of two, buckets are the smallest not less than the size
+    """
+    bucket = GeometricBucket()
+    for size in [1, 2, 3, 1000, 1024, 1025, 123457]:
+        assert bucket(size) == 1 << math.ceil(math.log2(size))
+    bucket = GeometricBucket(1.25, 10)
+    sizes = np.random.randint(1, 5000, 200)
+    buckets = np.array([bucket(size) for size in sizes])
+    assert np.all(buckets >= sizes)
+    assert np.all(buckets < np.maximum(sizes * 1.25 + 1, 10 + 1))
+
+    bucket = FixedBucket([400, 100, 200])
+    assert [bucket(100), bucket(101), bucket(400)] == [100, 200, 400]
+    with pytest.raises(ValueError):
+        bucket(401)
+    bucket = FixedBucket([100, 200], fallback=GeometricBucket(2, 200))
+    assert bucket(201) == 400
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_learned_bucket():
+    """
+    Feature: test learned bucket
+    Description: learn buckets from small random sizes and compare with all bucket choices
+    Expectation: learned buckets have the minimal total padding
+    """
+    sizes = np.random.randint(1, 40, 60)
+    bucket = LearnedBucket(sizes, bucket_count=3)
+    assert len(bucket.sizes) <= 3 and bucket.sizes[-1] == sizes.max()
+    learned = sum(bucket(size) - size for size in sizes)
+    candidates = np.unique(sizes)
+    best = min(sum(next(b for b in choice + (candidates[-1],) if b >= size) - size for size in sizes)
+               for count in range(3) for choice in itertools.combinations(candidates[:-1].tolist(), count))
+    assert learned == best
+    assert bucket(sizes.max() + 1) == 1 << math.ceil(math.log2(sizes.max() + 1))
+
+    # more distinct sizes than candidates, boundaries are chosen among quantiles of the sizes
+    sizes = np.random.lognormal(6, 1, 10000).astype(np.int64) + 1
+    assert np.unique(sizes).shape[0] > 64
+    bucket = LearnedBucket(sizes, bucket_count=8, max_candidates=64)
+    assert len(bucket.sizes) <= 8 and bucket.sizes[-1] == sizes.max()
+    quantiles = np.sort(sizes)[np.ceil(np.linspace(0, 1, 64) * (sizes.shape[0] - 1)).astype(np.int64)]
+    assert set(bucket.sizes) <= set(quantiles.tolist())
+    assert all(bucket(size) >= size for size in sizes)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_pad_with_bucket():
+    """
+    Feature: test pad operators with bucket policy
+    Description: pad random graphs and arrays with a geometric bucket of ratio 1.25
+    Expectation: padded sizes follow the policy and padding stats count overhead and shapes
+    """
+    pad_op = PadHomoGraph(mode=PadMode.AUTO, node_bucket=GeometricBucket(1.25, 8),
+                          edge_bucket=GeometricBucket(1.25, 16))
+    shapes = set()
+    size = padded_size = 0
+    for _ in range(20):
+        node_count = np.random.randint(10, 100)
+        edge_count = np.random.randint(20, 400)
+        res = pad_op(random_homo_graph(node_count, edge_count))
+        assert res.node_count == pad_op.node_bucket(node_count)
+        assert res.edge_count == pad_op.edge_bucket(edge_count)
+        assert res.adj_coo.shape[1] == res.edge_count
+        shapes.add((res.node_count, res.edge_count))
+        size += node_count + edge_count
+        padded_size += res.node_count + res.edge_count
+    stats = pad_op.padding_stats()
+    assert stats.count == 20 and stats.shape_count == len(shapes)
+    assert stats.size == size and stats.padded_size == padded_size
+    assert stats.overhead < 0.25
+
+    pad_op = PadArray2d(dtype=np.float32, direction=PadDirection.COL, mode=PadMode.AUTO, fill_value=5,
+                        bucket=GeometricBucket(1.25, 8))
+    res = pad_op(np.ones([100, 4], dtype=np.float32))
+    assert res.shape == (pad_op.bucket(100), 4)
+    assert np.all(res[:100] == 1) and np.all(res[100:] == 5)
+    assert pad_op.lazy([90, 4]).shape == (pad_op.bucket(90), 4)
+    stats = pad_op.padding_stats()
+    assert stats.count == 2 and stats.size == 760
@@ -0,0 +1,101 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test graph partition """
+import os
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHomoGraph, coo_to_csr
+from mindspore_gl.graph.partition import partition_graph, build_partitions, edge_cut, save_partitions, \
+    load_partition, load_parts
+
+
+def _community_graph(node_count, avg_degree, community_size=16):
+    community = np.random.randint(0, node_count // community_size, [node_count * avg_degree])
+    coo_array = community * community_size + np.random.randint(0, community_size, [2, node_count * avg_degree])
+    coo_array = np.random.permutation(node_count)[coo_array].astype(np.int32)
+    graph = MindHomoGraph()
+    graph.set_topo(coo_to_csr(coo_array, node_count))
+    return graph
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("method", ["ldg", "fennel"])
+def test_partition_graph(method):
+    """
+    Feature: test streaming graph partition
+    Description: partition a graph with community structure
+    Expectation: parts are balanced and cut fewer edges than random placement
+    """
+    graph = _community_graph(4096, 8)
+    parts = partition_graph(graph, 4, method, num_passes=2, chunk_size=256)
+    assert np.all(np.bincount(parts, minlength=4) <= np.ceil(1.05 * 4096 / 4))
+    assert edge_cut(graph, parts) < 0.5 * edge_cut(graph, np.random.randint(0, 4, [4096]))
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_save_and_load_partition(tmp_path):
+    """
+    Feature: test splitting graph into parts with halo nodes
+    Description: split a graph and its features, save and load each part
+    Expectation: inner nodes keep their neighbors and features, halo nodes are in other parts
+    """
+    graph = _community_graph(512, 4)
+    feat = np.random.rand(512, 3).astype(np.float32)
+    parts = partition_graph(graph, 3)
+    path = os.path.join(str(tmp_path), "partition")
+    save_partitions(path, graph, parts, feat=feat)
+    assert np.array_equal(load_parts(path), parts)
+    inner_count = 0
+    for part_id, partition in enumerate(build_partitions(graph, parts)):
+        loaded = load_partition(path, part_id)
+        assert np.array_equal(loaded.inner_nodes, partition.inner_nodes)
+        assert np.array_equal(loaded.halo_nodes, partition.halo_nodes)
+        assert np.all(parts[partition.inner_nodes] == part_id)
+        assert np.all(parts[partition.halo_nodes] != part_id)
+        assert np.array_equal(loaded.graph.store["feat"], feat[loaded.node_map.global_ids])
+        for node in partition.inner_nodes[:10]:
+            assert np.array_equal(loaded.graph.neighbors(node), graph.neighbors(node))
+        inner_count += partition.inner_node_count
+    assert inner_count == 512
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_partition_edge_ids_and_isolated_part(tmp_path):
+    """
+    Feature: test partition of a graph built from coo with a part of isolated nodes
+    Description: split a coo graph where part 1 holds only isolated nodes, save and load the parts
+    Expectation: edge ids of parts are coo positions, the part without edges is saved and loaded
+    """
+    coo_array = np.array([[3, 0, 2, 1], [0, 1, 3, 2]], dtype=np.int32)
+    graph = MindHomoGraph()
+    graph.set_topo_coo(coo_array)
+    graph.node_count = 6
+    parts = np.array([0, 0, 0, 0, 1, 1])
+    for partition in build_partitions(graph, parts):
+        part_graph = partition.graph
+        local_coo = part_graph.node_map.to_global(part_graph.adj_coo)
+        assert np.array_equal(local_coo, coo_array[:, part_graph.edge_ids])
+
+    path = os.path.join(str(tmp_path), "partition")
+    save_partitions(path, graph, parts)
+    loaded = load_partition(path, 1)
+    assert np.array_equal(loaded.inner_nodes, [4, 5])
+    assert loaded.graph.adj_csr.indices.shape[0] == 0
@@ -0,0 +1,108 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test graph reorder """
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHomoGraph, CompressedCsrAdj, coo_to_csr
+from mindspore_gl.graph.reorder import reorder, degree_order, rabbit_order
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("method", ["degree", "bfs", "rcm", "rabbit"])
+def test_reorder(method):
+    """
+    Feature: test locality improving node reordering
+    Description: reorder a random graph and its node features
+    Expectation: permutation is valid, edges and features are consistent and can be mapped back
+    """
+    node_count = 200
+    coo_array = np.random.randint(0, node_count, [2, 1000]).astype(np.int32)
+    coo_array[:, coo_array[0] == 5] = 6
+    graph = MindHomoGraph()
+    graph.set_topo(coo_to_csr(coo_array, node_count))
+    feat = np.random.rand(node_count, 4).astype(np.float32)
+
+    new_graph, permutation = reorder(graph, method)
+    assert np.array_equal(np.sort(permutation.perm), np.arange(node_count))
+    new_feat = permutation.apply(feat)
+    assert np.array_equal(permutation.restore(new_feat), feat)
+
+    old_coo = graph.adj_coo[:, new_graph.edge_ids]
+    assert np.array_equal(permutation.to_old(new_graph.adj_coo), old_coo)
+    assert np.array_equal(new_feat[new_graph.adj_coo[0]], feat[old_coo[0]])
+    for node in [0, 5, 199]:
+        assert np.array_equal(np.sort(new_graph.neighbors(node)), np.sort(graph.neighbors(node)))
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_reorder_edge_ids():
+    """
+    Feature: test edge ids of reordered graphs
+    Description: reorder a graph built from unsorted coo and a graph with compressed csr
+    Expectation: edge ids of the reordered graph point to the same edges of the original topology
+    """
+    coo_array = np.array([[2, 0, 1, 0], [0, 1, 2, 2]], dtype=np.int32)
+    graph = MindHomoGraph()
+    graph.set_topo_coo(coo_array)
+    permutation = degree_order(graph)
+    new_graph = permutation.apply_graph(graph)
+    assert np.array_equal(permutation.to_old(new_graph.adj_coo), coo_array[:, new_graph.edge_ids])
+
+    adj_csr = coo_to_csr(np.random.randint(0, 50, [2, 300]).astype(np.int32), 50)
+    compressed, perm = CompressedCsrAdj.from_csr(adj_csr, 50, block_size=4, return_perm=True)
+    graph = MindHomoGraph()
+    graph.set_topo(compressed, edge_ids=perm)
+    new_graph, permutation = reorder(graph, "rabbit")
+    old_coo = np.stack([np.repeat(np.arange(50), np.diff(adj_csr.indptr)), adj_csr.indices])
+    assert new_graph.adj_csr.indices.dtype == np.int32
+    assert np.array_equal(permutation.to_old(new_graph.adj_coo), old_coo[:, new_graph.edge_ids])
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_rabbit_order_communities():
+    """
+    Feature: test rabbit style ordering
+    Description: reorder two shuffled cliques joined by one edge
+    Expectation: each clique gets a contiguous id range
+    """
+    clique = np.array([(i, j) for i in range(10) for j in range(10) if i != j]).T
+    coo_array = np.concatenate([clique, clique + 10, [[0], [10]]], axis=1)
+    shuffle = np.random.permutation(20)
+    graph = MindHomoGraph()
+    graph.set_topo_coo(shuffle[coo_array])
+    permutation = rabbit_order(graph)
+    first_clique = np.isin(permutation.perm, shuffle[:10])
+    assert np.all(first_clique[:10]) or np.all(first_clique[10:])
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_reorder_invalid_method():
+    """
+    Feature: test reorder argument check
+    Description: reorder with an unknown method
+    Expectation: ValueError is raised
+    """
+    graph = MindHomoGraph()
+    graph.set_topo_coo(np.array([[0, 1], [1, 0]]))
+    with pytest.raises(ValueError):
+        reorder(graph, "unknown")
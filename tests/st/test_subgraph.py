@@ -0,0 +1,78 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test subgraph extraction """
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHomoGraph, coo_to_csr
+from mindspore_gl.graph.node_map import NodeIdMap
+from graph_utils import random_homo_graph
+
+
+def _random_graphs(node_count=100, edge_count=800):
+    """same random graph built from unsorted coo and from csr with shuffled edge ids"""
+    global_ids = np.random.permutation(node_count * 3)[:node_count]
+    coo_graph, expected = random_homo_graph(node_count, edge_count, NodeIdMap(global_ids=global_ids),
+                                            return_coo=True)
+
+    edge_ids = np.random.permutation(edge_count) + 1000
+    adj_csr, perm = coo_to_csr(coo_graph.adj_coo, node_count, return_perm=True)
+    csr_graph = MindHomoGraph()
+    csr_graph.set_topo(adj_csr, node_dict=NodeIdMap(global_ids=global_ids), edge_ids=edge_ids[perm])
+    return [(coo_graph, expected, np.arange(edge_count)), (csr_graph, expected, edge_ids)]
+
+
+def _global_edges(graph):
+    """(src, dst, edge id) of each edge with global node ids"""
+    global_coo = graph.node_map.to_global(graph.adj_coo)
+    return set(zip(global_coo[0].tolist(), global_coo[1].tolist(), graph.edge_ids.tolist()))
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_subgraph():
+    """
+    Feature: test node induced subgraph
+    Description: extract subgraph of random nodes from graphs built from coo and csr
+    Expectation: subgraph has exactly the edges between the nodes, with original node and edge ids
+    """
+    for graph, global_coo, edge_ids in _random_graphs():
+        nodes = np.random.choice(graph.node_map.global_ids, 30, replace=False)
+        sub_graph = graph.subgraph(nodes)
+        assert np.array_equal(sub_graph.node_map.global_ids, nodes)
+        assert sub_graph.node_count == 30
+        mask = np.isin(global_coo[0], nodes) & np.isin(global_coo[1], nodes)
+        expected = set(zip(global_coo[0, mask].tolist(), global_coo[1, mask].tolist(), edge_ids[mask].tolist()))
+        assert _global_edges(sub_graph) == expected
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_edge_subgraph():
+    """
+    Feature: test edge induced subgraph
+    Description: extract subgraph of random edges from graphs built from coo and csr
+    Expectation: subgraph has the edges and their end nodes in graph order, with original ids
+    """
+    for graph, global_coo, edge_ids in _random_graphs():
+        selected = np.random.choice(edge_ids.shape[0], 50, replace=False)
+        sub_graph = graph.edge_subgraph(edge_ids[selected])
+        sub_nodes = sub_graph.node_map.global_ids
+        assert np.array_equal(np.sort(sub_nodes), np.unique(global_coo[:, selected]))
+        assert np.all(np.diff(graph.node_map.to_local(sub_nodes)) > 0)
+        expected = set(zip(global_coo[0, selected].tolist(), global_coo[1, selected].tolist(),
+                           edge_ids[selected].tolist()))
+        assert _global_edges(sub_graph) == expected
@@ -0,0 +1,70 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test unbatch graph """
+import numpy as np
+import pytest
+from mindspore_gl.graph.ops import BatchHomoGraph, UnBatchHomoGraph
+from graph_utils import random_homo_graph
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_unbatch():
+    """
+    Feature: test unbatching a batched homo graph
+    Description: batch random graphs, then unbatch, index and split per graph arrays
+    Expectation: unbatched graphs equal the original ones and batched coo is not modified
+    """
+    graphs = [random_homo_graph(n, e) for n, e in [(3, 5), (1, 1), (6, 10), (4, 7)]]
+    batch_graph = BatchHomoGraph()(graphs)
+    batch_coo = batch_graph.adj_coo.copy()
+    unbatched = UnBatchHomoGraph()(batch_graph)
+    assert len(unbatched) == len(graphs)
+    for idx, graph in enumerate(graphs):
+        assert unbatched[idx].node_count == graph.node_count
+        assert unbatched[idx].edge_count == graph.edge_count
+        assert np.array_equal(unbatched[idx].adj_coo, graph.adj_coo)
+        assert np.array_equal(batch_graph[idx].adj_coo, graph.adj_coo)
+    assert np.array_equal(batch_graph.adj_coo, batch_coo)
+
+    batch_meta = batch_graph.batch_meta
+    assert np.array_equal(batch_meta.node_map_idx, [0, 0, 0, 1, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3])
+    assert np.array_equal(batch_meta.edge_map_idx, np.repeat(np.arange(4), [5, 1, 10, 7]))
+    node_split = batch_meta.split_nodes(np.arange(batch_graph.node_count))
+    assert [x.shape[0] for x in node_split] == [3, 1, 6, 4]
+    edge_split = batch_meta.split_edges(np.arange(batch_graph.edge_count))
+    assert [x.shape[0] for x in edge_split] == [5, 1, 10, 7]
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_batch_from_coo():
+    """
+    Feature: test batching a concatenated coo into a caller provided buffer
+    Description: batch concatenated coo of random graphs into a larger buffer
+    Expectation: result is a view of the buffer and equals batching graph list
+    """
+    graphs = [random_homo_graph(n, e) for n, e in [(3, 5), (1, 1), (6, 10)]]
+    expected = BatchHomoGraph()(graphs)
+    out = np.zeros([2, 20], dtype=np.int32)
+    batch_graph = BatchHomoGraph.from_coo(np.concatenate([graph.adj_coo for graph in graphs], axis=1),
+                                          np.array([3, 1, 6]), np.array([5, 1, 10]), out=out)
+    assert np.shares_memory(batch_graph.adj_coo, out)
+    assert np.array_equal(batch_graph.adj_coo, expected.adj_coo)
+    assert np.array_equal(batch_graph.batch_meta.graph_nodes, [0, 3, 4, 10])
+    assert batch_graph.node_count == 10
+    assert batch_graph.edge_count == 16
@@ -0,0 +1,71 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test unpad graph """
+import numpy as np
+import pytest
+from mindspore_gl.graph.ops import BatchHomoGraph, PadHomoGraph, UnPadHomoGraph, PadMode, unpad_node_feat, \
+    unpad_edge_feat, unpad_graph_feat
+from graph_utils import random_homo_graph
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("mode", [PadMode.AUTO, PadMode.CONST])
+def test_unpad_batched_graph(mode):
+    """
+    Feature: test unpad batched homo graph
+    Description: pad a batch of random graphs, then unpad the graph and padded features
+    Expectation: unpadded graph and features equal the batched ones and are views of padded arrays
+    """
+    graphs = [random_homo_graph(n, e) for n, e in [(3, 5), (1, 1), (6, 10), (4, 7)]]
+    batch_graph = BatchHomoGraph()(graphs)
+    padded = PadHomoGraph(n_node=20, n_edge=40, mode=mode)(batch_graph)
+    assert padded.batch_meta.graph_count == 5
+    unpadded = UnPadHomoGraph()(padded)
+    assert unpadded.is_batched and unpadded.batch_meta.graph_count == 4
+    assert (unpadded.node_count, unpadded.edge_count) == (14, 23)
+    assert np.array_equal(unpadded.adj_coo, batch_graph.adj_coo)
+    assert np.shares_memory(unpadded.adj_coo, padded.adj_coo)
+    assert np.array_equal(unpadded.batch_meta.graph_nodes, batch_graph.batch_meta.graph_nodes)
+
+    node_feat = np.random.rand(padded.node_count, 4)
+    edge_feat = np.random.rand(padded.edge_count, 2)
+    graph_feat = np.random.rand(padded.batch_meta.graph_count, 3)
+    for feat, unpadded_feat, count in [(node_feat, unpad_node_feat(node_feat, padded.batch_meta), 14),
+                                       (edge_feat, unpad_edge_feat(edge_feat, padded.batch_meta), 23),
+                                       (graph_feat, unpad_graph_feat(graph_feat, padded.batch_meta), 4)]:
+        assert unpadded_feat.shape[0] == count
+        assert np.shares_memory(unpadded_feat, feat)
+        assert np.array_equal(unpadded_feat, feat[:count])
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_unpad_single_graph():
+    """
+    Feature: test unpad single homo graph
+    Description: pad single graphs needing padding or not, then unpad them
+    Expectation: padded graphs always end with the fake graph, unpadded graph is the unbatched input graph
+    """
+    for node_count, edge_count in [(5, 13), (8, 16)]:
+        graph = random_homo_graph(node_count, edge_count)
+        padded = PadHomoGraph(mode=PadMode.AUTO)(graph)
+        assert padded.is_batched and padded.batch_meta.graph_count == 2
+        unpadded = UnPadHomoGraph()(padded)
+        assert not unpadded.is_batched
+        assert (unpadded.node_count, unpadded.edge_count) == (node_count, edge_count)
+        assert np.array_equal(unpadded.adj_coo, graph.adj_coo)
@@ -0,0 +1,147 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test weighted sampling """
+import numpy as np
+import pytest
+from mindspore_gl.graph.graph import MindHomoGraph, CompressedCsrAdj, coo_to_csr
+from mindspore_gl.sampling.neighbor import sage_sampler_on_homo, _sample_one_hop
+from mindspore_gl.sampling.randomwalks import random_walk_weighted_on_homo
+from graph_utils import random_homo_graph
+
+
+def _star_graph():
+    """node 0 points to nodes 1..4 with weights 1, 2, 3, 0, nodes 1..4 have no out edges"""
+    adj_coo = np.array([[0, 0, 0, 0], [3, 1, 4, 2]], dtype=np.int32)
+    graph = MindHomoGraph()
+    graph.set_topo_coo(adj_coo)
+    graph.node_count = 5
+    graph.set_edge_weight(np.array([3., 1., 0., 2.]))
+    return graph
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_weighted_sample_with_replacement():
+    """
+    Feature: test weighted neighbor sampling with replacement
+    Description: sample many neighbors of a node with weights 1, 2, 3 and 0
+    Expectation: neighbors are drawn in proportion to weights, zero weight edge is never drawn
+    """
+    graph = _star_graph()
+    edge_index, _ = _sample_one_hop(graph.adj_csr, 60000, np.array([0], np.int32), graph.csr_weight(), True)
+    assert edge_index.shape == (2, 60000)
+    freq = np.bincount(edge_index[1], minlength=5) / 60000
+    assert np.allclose(freq, [0, 1 / 6, 2 / 6, 3 / 6, 0], atol=0.01)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_weighted_sample_without_replacement():
+    """
+    Feature: test weighted neighbor sampling without replacement
+    Description: sample 2 of the neighbors with weights 1, 2, 3 and 0 of many seeds
+    Expectation: each seed gets 2 distinct positive weight neighbors, inclusion follows successive sampling
+    """
+    graph = _star_graph()
+    seeds = np.zeros([30000], np.int32)
+    edge_index, _ = _sample_one_hop(graph.adj_csr, 2, seeds, graph.csr_weight(), False)
+    pairs = edge_index[1].reshape(-1, 2)
+    assert np.all(pairs[:, 0] != pairs[:, 1])
+    assert not np.any(pairs == 4)
+    # node 1 is left out when 2 and 3 are drawn in either order
+    excluded = 2 / 6 * 3 / 4 + 3 / 6 * 2 / 3
+    assert abs(np.mean(np.all(pairs != 1, axis=1)) - excluded) < 0.01
+
+    # few positive weight neighbors are all taken
+    edge_index, _ = _sample_one_hop(graph.adj_csr, 5, np.array([0, 1], np.int32), graph.csr_weight(), False)
+    assert sorted(edge_index[1].tolist()) == [1, 2, 3]
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_weighted_sage_sampler():
+    """
+    Feature: test weighted sage sampler on random graph
+    Description: sample with random weights on a graph built from unsorted coo
+    Expectation: sampled edges exist in graph and have positive weight
+    """
+    node_count, edge_count = 200, 3000
+    graph, adj_coo = random_homo_graph(node_count, edge_count, return_coo=True)
+    weight = np.random.rand(edge_count) * (np.random.rand(edge_count) > 0.3)
+    graph.set_edge_weight(weight)
+    positive_edges = set(zip(adj_coo[0, weight > 0].tolist(), adj_coo[1, weight > 0].tolist()))
+
+    seeds = np.random.choice(node_count, 20, replace=False)
+    for replace in [False, True]:
+        res = sage_sampler_on_homo(graph, seeds, [5, 3], weighted=True, replace=replace)
+        all_nodes = res['all_nodes']
+        for idx in range(2):
+            edges = all_nodes[res[f'layered_edges_{idx}']]
+            assert set(zip(edges[0].tolist(), edges[1].tolist())) <= positive_edges
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_weighted_random_walk():
+    """
+    Feature: test weighted random walk
+    Description: walk on a cycle where each node has a heavy and a zero weight out edge
+    Expectation: walks only follow positive weight edges and stop at nodes without them
+    """
+    adj_coo = np.array([[0, 0, 1, 1, 2, 2, 3], [1, 3, 2, 0, 3, 1, 0]], dtype=np.int32)
+    weight = np.array([1., 0., 2., 0., 5., 0., 0.])
+    adj_csr, perm = coo_to_csr(adj_coo, 4, return_perm=True)
+    graph = MindHomoGraph()
+    graph.set_topo(adj_csr, edge_ids=perm)
+    graph.node_count = 4
+    graph.set_edge_weight(weight[perm])
+    out = random_walk_weighted_on_homo(graph, np.array([0, 2], np.int32), 4)
+    assert out.tolist() == [[0, 1, 2, 3, -1], [2, 3, -1, -1, -1]]
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_edge_weight_cache():
+    """
+    Feature: test edge weight validation and cache
+    Description: set invalid weights, reset topology and sample on compressed csr
+    Expectation: invalid weights and compressed csr raise, topology change drops weights
+    """
+    graph = _star_graph()
+    with pytest.raises(ValueError):
+        graph.set_edge_weight(np.ones([3]))
+    with pytest.raises(ValueError):
+        graph.set_edge_weight(np.array([1., -1., 1., 1.]))
+    with pytest.raises(ValueError):
+        graph.set_edge_weight(np.array([1., np.nan, 1., 1.]))
+
+    csr_weight = graph.csr_weight()
+    assert graph.csr_weight() is csr_weight
+    graph.set_edge_weight(np.ones([4]))
+    assert np.array_equal(graph.csr_weight().positive_degree, [4, 0, 0, 0, 0])
+
+    graph.set_topo_coo(np.array([[0, 1], [1, 0]], dtype=np.int32))
+    assert graph.edge_weight is None
+
+    graph = _star_graph()
+    graph.set_topo(CompressedCsrAdj.from_csr(graph.adj_csr, 5))
+    graph.node_count = 5
+    with pytest.raises(TypeError):
+        random_walk_weighted_on_homo(graph, np.array([0], np.int32), 2)